@@ -0,0 +1,53 @@
+#  Copyright 2024 Zeppelin Bend Pty Ltd
+#
+#  This Source Code Form is subject to the terms of the Mozilla Public
+#  License, v. 2.0. If a copy of the MPL was not distributed with this
+#  file, You can obtain one at https://mozilla.org/MPL/2.0/.
+"""
+Measures the cost of the built-in catalogues: the time taken to import `zepben.edith` and the memory allocated by that import and
+after the catalogues are first used. Each measurement is taken in a fresh interpreter.
+
+    python benchmarks/catalogue_footprint.py
+"""
+import statistics
+import subprocess
+import sys
+from typing import List
+
+_IMPORT_TIME = """
+import time
+import zepben.evolve
+start = time.perf_counter()
+import zepben.edith
+print(time.perf_counter() - start)
+"""
+
+_MEMORY = """
+import tracemalloc
+import numpy
+import zepben.evolve
+tracemalloc.start()
+import zepben.edith
+after_import = tracemalloc.get_traced_memory()[0]
+from zepben.edith.linecode_catalogue import LINECODE_CATALOGUE
+from zepben.edith.transformer_catalogue import TRANSFORMER_CATALOGUE
+len(LINECODE_CATALOGUE), len(TRANSFORMER_CATALOGUE)
+print(after_import, tracemalloc.get_traced_memory()[0])
+"""
+
+
+def _run(script: str) -> List[float]:
+    output = subprocess.run([sys.executable, "-c", script], check=True, capture_output=True, text=True).stdout
+    return [float(value) for value in output.split()]
+
+
+def main(repeats: int = 10):
+    import_times = [_run(_IMPORT_TIME)[0] * 1000 for _ in range(repeats)]
+    after_import, after_use = _run(_MEMORY)
+    print(f"import zepben.edith (excluding zepben.evolve): median {statistics.median(import_times):.1f} ms")
+    print(f"memory allocated by import zepben.edith (excluding NumPy): {after_import / 1024:.1f} KiB")
+    print(f"memory allocated after loading the catalogues: {after_use / 1024:.1f} KiB")
+
+
+if __name__ == "__main__":
+    main()
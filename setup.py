@@ -11,6 +11,7 @@ from setuptools import setup, find_namespace_packages
 deps = [
     "zepben.evolve>=0.37.0,<0.38.0",
     "dataclassy==0.6.2",
+    "numpy>=1.22",
 ]
 
 # AsyncMock was not included in the base module until 3.8, so use the backport instead if required
@@ -3,109 +3,270 @@
 #  This Source Code Form is subject to the terms of the Mozilla Public
 #  License, v. 2.0. If a copy of the MPL was not distributed with this
 #  file, You can obtain one at https://mozilla.org/MPL/2.0/.
+import inspect
 import itertools
-import random
-from asyncio import get_event_loop
+import operator
+from asyncio import Semaphore, ensure_future, gather, get_event_loop, get_running_loop
+from concurrent.futures import Future
+from functools import partial, reduce
+from collections import deque
+from threading import Lock
+from typing import AsyncIterator, Awaitable, Iterator, Sequence, Tuple, Type, TypeVar, TYPE_CHECKING
+
 from zepben.evolve import *
-from zepben.protobuf.nc.nc_requests_pb2 import INCLUDE_ENERGIZED_LV_FEEDERS
+from zepben.protobuf.nc.nc_requests_pb2 import EXCLUDE_ENERGIZED_CONTAINERS, INCLUDE_ENERGIZED_LV_FEEDERS
+
+from zepben.edith.background_loop import BackgroundEventLoop, default_background_loop
+from zepben.edith.clients import SharedHierarchyStub, check_policy, isolated_client, planned_client, shared_hierarchy_stub
+from zepben.edith.fetch_policy import FetchAttempt, FetchPolicy, fetch_with_policy
+from zepben.edith.mutation_journal import MutationRecorder
+from zepben.edith.mutator_engine import ALL_FIELDS, MutatorAccess, VisitingMutator, apply_mutators, mutator_access
+from zepben.edith.network_snapshot import network_from_bytes, network_to_bytes
+from zepben.edith.original_ratings import OriginalRatings
+from zepben.edith.scenarios import MutatorFactory, ScenarioResult, run_scenarios
+from zepben.edith.selection_cache import LINECODE_SELECTION_CACHE, TRANSFORMER_SELECTION_CACHE
+
+if TYPE_CHECKING:
+    from numpy.random import Generator
+    from zepben.edith.catalogue_columns import LinecodeColumns, TransformerColumns
+    from zepben.edith.feeder_cache import FeederCache
+    from zepben.edith.original_ratings import _NetworkRatings
+
+__all__ = ["line_weakener", "transformer_weakener", "VoltageMatchCounts", "SyntheticFeederResult", "LvFeederMutator",
+           "MutatorRequirements", "MutatorPipeline", "usage_point_proportional_allocator", "NetworkConsumerClient", "SyncNetworkConsumerClient",
+           "BackgroundSyncNetworkConsumerClient"]
 
-from zepben.edith.linecode_catalogue import LINECODE_CATALOGUE
 
-__all__ = ["line_weakener", "transformer_weakener",
-           "usage_point_proportional_allocator", "NetworkConsumerClient", "SyncNetworkConsumerClient"]
+@dataclass
+class MutatorRequirements(object):
+    """
+    The parts of a feeder network that a mutator needs. A mutator declares its requirements with a `requirements`
+    attribute, and a synthetic feeder created with `minimal_fetch` is fetched with only the parts that at least one of
+    its mutators needs. Mutators without a `requirements` attribute are given the whole feeder network.
+
+    :param lv_feeders: Whether the equipment in the feeder's energized LV feeders is needed.
+    :param locations: Whether the `Location`s of equipment, usage points and assets are needed.
+    :param assets: Whether assets referenced by the network, such as meters, poles and streetlights, are needed.
+    """
+    lv_feeders: bool = True
+    locations: bool = True
+    assets: bool = True
+
+    def __or__(self, other: "MutatorRequirements") -> "MutatorRequirements":
+        return MutatorRequirements(
+            self.lv_feeders or other.lv_feeders,
+            self.locations or other.locations,
+            self.assets or other.assets
+        )
 
-from zepben.edith.transformer_catalogue import TRANSFORMER_CATALOGUE
+    @property
+    def skipped_types(self) -> Tuple[Type[IdentifiedObject], ...]:
+        """
+        :return: The types of objects that are not fetched. Anything only referenced by them is not fetched either.
+        """
+        return tuple(type_ for type_, needed in ((Location, self.locations), (Asset, self.assets)) if not needed)
+
+
+def _plan_fetch(mutators: Sequence[Callable[[NetworkService], None]], minimal_fetch: bool = True) -> MutatorRequirements:
+    if not minimal_fetch or not mutators:
+        return MutatorRequirements()
+    return reduce(operator.or_, (getattr(mutator, "requirements", MutatorRequirements()) for mutator in mutators))
 
 
 def line_weakener(
         weakening_percentage: int,
         use_weakest_when_necessary: bool = True,
-        callback: Optional[Callable[[Set[str]], Any]] = None
+        callback: Optional[Callable[[Set[str]], Any]] = None,
+        catalogue: Optional["LinecodeColumns"] = None,
+        hv_only: bool = False,
+        originals: Optional[OriginalRatings] = None,
+        recorder: Optional[MutationRecorder] = None
 ) -> Callable[[NetworkService], None]:
     """
     Returns a mutator function that downgrades lines based on their amp rating. Both the amp rating and impedance is
-    updated using an entry in the built-in catalogue of linecodes. The linecode must match the voltage category (HV/LV)
-    and phase count (e.g. 2 for AB, 3 for ABCN). If the target amp rating is lower than the amp rating of every
-    candidate linecode, the one with the lowest amp rating will be used if `use_weakest_when_necessary` is `True`.
+    updated using an entry in a catalogue of linecodes, which is the built-in catalogue unless another is given. The
+    linecode must match the voltage category (HV/LV) and phase count (e.g. 2 for AB, 3 for ABCN). If the target amp
+    rating is lower than the amp rating of every candidate linecode, the one with the lowest amp rating will be used if
+    `use_weakest_when_necessary` is `True`.
 
     :param weakening_percentage: Percentage to reduce amp rating of lines by. The linecode chosen for a line with an amp
                                  rating of N should have an amp rating of at most (100 - weakening_percentage)% of N.
     :param use_weakest_when_necessary: Whether to use the linecode with the lowest amp rating if the target amp rating
                                        for a line is too low. Defaults to `True`.
-    :param callback: An optional callback that acts on the set of mRIDs of modified lines.
+    :param callback: An optional callback that acts on the set of mRIDs of modified lines. It may be a coroutine
+                     function, in which case the mutator returns its coroutine to be awaited.
+    :param catalogue: The catalogue of linecodes to select from. Defaults to the built-in catalogue.
+    :param hv_only: Only downgrade HV lines. The feeder's LV feeders are then not fetched for a synthetic feeder created
+                    with `minimal_fetch` unless another mutator needs them. Defaults to `False`.
+    :param originals: Weaken lines incrementally, recording the original rating of each line in `originals` before it is
+                      first modified and selecting linecodes from the original ratings. Lines whose selected linecode
+                      has not changed are left alone, lines that are no longer weakened are restored, and only the lines
+                      that were changed are passed to `callback`. Defaults to weakening from the current ratings.
+    :param recorder: An optional `MutationRecorder`, such as a `MutationJournal`, to record each change in.
 
     :return: A mutator function that downgrades lines.
     """
     if not 1 <= weakening_percentage <= 100:
         raise ValueError("Weakening percentage must be between 1 and 100")
-    amp_rating_ratio = (100 - weakening_percentage) / 100
+    return _LineWeakener((100 - weakening_percentage) / 100, use_weakest_when_necessary, callback, catalogue, hv_only, originals, recorder)
+
+
+class _LineWeakeningState(object):
+
+    def __init__(self, feeder_network: NetworkService, linecodes: "LinecodeColumns", originals: Optional["_NetworkRatings"]):
+        self.feeder_network = feeder_network
+        self.linecodes = linecodes
+        self.originals = originals
+        self.candidate_lines: List[Tuple[AcLineSegment, WireInfo]] = []
+        self.signatures: List[Tuple[bool, int, float, float, bool]] = []
+
+
+class _LineWeakener(VisitingMutator):
 
-    hv_linecodes = [lc for lc in LINECODE_CATALOGUE if lc.hv]
-    lv_linecodes = [lc for lc in LINECODE_CATALOGUE if not lc.hv]
+    visited_types = (AcLineSegment,)
+    access = MutatorAccess(
+        reads=frozenset({
+            (AcLineSegment, "terminals"),
+            (AcLineSegment, "wire_info"),
+            (AcLineSegment, "base_voltage"),
+            (Terminal, "phases"),
+            (WireInfo, "rated_current"),
+            (BaseVoltage, "nominal_voltage")
+        }),
+        writes=frozenset({
+            (AcLineSegment, "wire_info"),
+            (AcLineSegment, "per_length_sequence_impedance"),
+            (CableInfo, ALL_FIELDS),
+            (OverheadWireInfo, ALL_FIELDS),
+            (PerLengthSequenceImpedance, ALL_FIELDS)
+        })
+    )
 
-    def mutate(feeder_network: NetworkService):
-        # Add wire info and plsi for each linecode
-        for lc in LINECODE_CATALOGUE:
-            feeder_network.add(CableInfo(mrid=f"{lc.name}-ug", rated_current=int(lc.norm_amps)))
-            feeder_network.add(OverheadWireInfo(mrid=f"{lc.name}-oh", rated_current=int(lc.norm_amps)))
-            feeder_network.add(PerLengthSequenceImpedance(mrid=f"{lc.name}-plsi", r0=lc.r0, x0=lc.x0, r=lc.r1, x=lc.x1))
+    def __init__(self, amp_rating_ratio: float, use_weakest_when_necessary: bool, callback: Optional[Callable[[Set[str]], Any]],
+                 catalogue: Optional["LinecodeColumns"], hv_only: bool, originals: Optional[OriginalRatings],
+                 recorder: Optional[MutationRecorder]):
+        self.amp_rating_ratio = amp_rating_ratio
+        self.use_weakest_when_necessary = use_weakest_when_necessary
+        self.callback = callback
+        self.catalogue = catalogue
+        self.hv_only = hv_only
+        self.originals = originals
+        self.recorder = recorder
+        self.requirements = MutatorRequirements(lv_feeders=not hv_only, locations=False, assets=False)
+
+    def begin(self, feeder_network: NetworkService) -> _LineWeakeningState:
+        return _LineWeakeningState(
+            feeder_network,
+            self.catalogue if self.catalogue is not None else _builtin_linecodes(),
+            self.originals._of(feeder_network) if self.originals is not None else None
+        )
+
+    def visit(self, state: _LineWeakeningState, acls: AcLineSegment):
+        try:
+            terminal = acls.get_terminal_by_sn(1)
+        except IndexError:
+            return
+
+        wire_info = acls.wire_info
+        if state.originals is not None and acls.mrid in state.originals.lines:
+            wire_info, _ = state.originals.lines[acls.mrid]
+        if wire_info is None or wire_info.rated_current is None:
+            return
+
+        hv = acls.base_voltage_value > 1000
+        if self.hv_only and not hv:
+            return
+
+        state.candidate_lines.append((acls, wire_info))
+        state.signatures.append((
+            hv,
+            terminal.phases.without_neutral.num_phases,
+            wire_info.rated_current,
+            self.amp_rating_ratio,
+            self.use_weakest_when_necessary
+        ))
+
+    def finish(self, state: _LineWeakeningState) -> Optional[Awaitable[None]]:
+        feeder_network = state.feeder_network
+        linecodes = state.linecodes
+
+        # Lines sharing a signature share a linecode, so only unseen signatures are selected, in one batch.
+        selected = LINECODE_SELECTION_CACHE.get_many(linecodes, state.signatures, partial(_select_linecodes, linecodes))
 
         lines_modified = set()
-        for acls in feeder_network.objects(AcLineSegment):
-            try:
-                terminal = acls.get_terminal_by_sn(1)
-            except IndexError:
+        for (acls, wire_info), row in zip(state.candidate_lines, selected):
+            original = state.originals.lines.get(acls.mrid) if state.originals is not None else None
+            if row < 0:
+                # A line that is no longer weakened goes back to its original rating.
+                if original is not None and (acls.wire_info, acls.per_length_sequence_impedance) != original:
+                    _assign(self.recorder, feeder_network, acls, "wire_info", original[0])
+                    _assign(self.recorder, feeder_network, acls, "per_length_sequence_impedance", original[1])
+                    lines_modified.add(acls.mrid)
                 continue
+            linecode = linecodes[row]
+            is_cable = isinstance(wire_info, CableInfo)
+            wire_info_mrid = f"{linecode.name}-ug" if is_cable else f"{linecode.name}-oh"
 
-            if acls.wire_info is None or acls.wire_info.rated_current is None:
-                continue
-            wire_info: WireInfo = acls.wire_info
+            if state.originals is not None:
+                if original is None:
+                    state.originals.lines[acls.mrid] = (acls.wire_info, acls.per_length_sequence_impedance)
+                elif _has_mrid(acls.wire_info, wire_info_mrid) and _has_mrid(acls.per_length_sequence_impedance, f"{linecode.name}-plsi"):
+                    continue
 
-            if acls.base_voltage_value > 1000:
-                correct_voltage_lcs = hv_linecodes
-            else:
-                correct_voltage_lcs = lv_linecodes
-
-            correct_phases_lcs = [
-                lc for lc in correct_voltage_lcs if lc.phases == terminal.phases.without_neutral.num_phases
-            ]
-            viable_lcs = filter(
-                lambda lc: lc.norm_amps <= wire_info.rated_current * amp_rating_ratio,
-                correct_phases_lcs
+            # Wire info and plsi are only added for linecodes that are used, and are reused if already in the network.
+            plsi = _get_or_add(
+                feeder_network,
+                PerLengthSequenceImpedance,
+                f"{linecode.name}-plsi",
+                lambda mrid: PerLengthSequenceImpedance(mrid=mrid, r0=linecode.r0, x0=linecode.x0, r=linecode.r1, x=linecode.x1),
+                self.recorder,
+                linecode.name
             )
-            if use_weakest_when_necessary:
-                fallback_lc = min(correct_phases_lcs, key=lambda lc: lc.norm_amps, default=None)
-            else:
-                fallback_lc = None
-            linecode = max(viable_lcs, key=lambda lc: lc.norm_amps, default=fallback_lc)
-            if linecode is None:
-                continue
-
-            acls.per_length_sequence_impedance = feeder_network.get(f"{linecode.name}-plsi", PerLengthSequenceImpedance)
-            if isinstance(acls.wire_info, CableInfo):
-                acls.wire_info = feeder_network.get(f"{linecode.name}-ug", CableInfo)
+            _assign(self.recorder, feeder_network, acls, "per_length_sequence_impedance", plsi, linecode.name)
+            if is_cable:
+                wire_info = _get_or_add(
+                    feeder_network,
+                    CableInfo,
+                    wire_info_mrid,
+                    lambda mrid: CableInfo(mrid=mrid, rated_current=int(linecode.norm_amps)),
+                    self.recorder,
+                    linecode.name
+                )
             else:
-                acls.wire_info = feeder_network.get(f"{linecode.name}-oh", OverheadWireInfo)
+                wire_info = _get_or_add(
+                    feeder_network,
+                    OverheadWireInfo,
+                    wire_info_mrid,
+                    lambda mrid: OverheadWireInfo(mrid=mrid, rated_current=int(linecode.norm_amps)),
+                    self.recorder,
+                    linecode.name
+                )
+            _assign(self.recorder, feeder_network, acls, "wire_info", wire_info, linecode.name)
             lines_modified.add(acls.mrid)
 
-        if callback is not None:
-            callback(lines_modified)
-
-    return mutate
+        if self.callback is not None:
+            return _awaitable_results([self.callback(lines_modified)])
 
 
 def transformer_weakener(
         weakening_percentage: int,
         use_weakest_when_necessary: bool = True,
         match_voltages: bool = True,
-        callback: Optional[Callable[[Set[str]], Any]] = None
+        callback: Optional[Callable[[Set[str]], Any]] = None,
+        catalogue: Optional["TransformerColumns"] = None,
+        voltage_tolerance: float = 0.0,
+        voltage_match_callback: Optional[Callable[["VoltageMatchCounts"], Any]] = None,
+        originals: Optional[OriginalRatings] = None,
+        recorder: Optional[MutationRecorder] = None
 ) -> Callable[[NetworkService], None]:
     """
     Returns a mutator function that downgrades transformers based on their VA rating. The VA rating of transformer ends
-    are updated using an entry in the built-in catalogue of transformer models. The model must match the number of
-    windings (usually 2), number of phases on each winding, and the operating voltages of each winding unless
-    `match_voltages` is `False`. If the target VA rating is lower than the VA rating of every candidate transformer
-    model, the one with the lowest VA rating will be used if `use_weakest_when_necessary` is `True`.
+    are updated using an entry in a catalogue of transformer models, which is the built-in catalogue unless another is
+    given. The model must match the number of windings (usually 2), number of phases on each winding, and the operating
+    voltages of each winding unless `match_voltages` is `False`. Winding voltages that do not exactly match any model
+    are matched to the closest model voltages within `voltage_tolerance`. If the target VA rating is lower than the VA
+    rating of every candidate transformer model, the one with the lowest VA rating will be used if
+    `use_weakest_when_necessary` is `True`.
 
     :param weakening_percentage: Percentage to reduce VA rating of transformer ends by. The transformer model chosen
                                  for a line with an VA rating of N should have a VA rating of at most
@@ -114,54 +275,329 @@ def transformer_weakener(
                                        VA rating for a line is too low. Defaults to `True`.
     :param match_voltages: Whether to match the operating voltage of transformer windings when selecting a transformer
                            model. Defaults to `True`.
-    :param callback: An optional callback is called on the set of mRIDs of modified transformers.
+    :param callback: An optional callback is called on the set of mRIDs of modified transformers. Either callback may be
+                     a coroutine function, in which case the mutator returns an awaitable of both callbacks.
+    :param catalogue: The catalogue of transformer models to select from. Defaults to the built-in catalogue.
+    :param voltage_tolerance: The largest acceptable difference between a model's voltage and a winding's rated voltage
+                              when winding voltages do not exactly match any model, as a fraction of the rated voltage
+                              (e.g. 0.05 for 5%). Defaults to 0, which only matches exact voltages.
+    :param voltage_match_callback: An optional callback that is called on the counts of transformers whose winding
+                                   voltages matched exactly, matched within `voltage_tolerance`, or did not match.
+    :param originals: Weaken transformers incrementally, recording the original VA ratings of each transformer in
+                      `originals` before it is first modified and selecting models from the original ratings.
+                      Transformers whose selected model has not changed are left alone, transformers that are no longer
+                      weakened are restored, and only the transformers that were changed are passed to `callback`.
+                      Defaults to weakening from the current ratings.
+    :param recorder: An optional `MutationRecorder`, such as a `MutationJournal`, to record each change in.
 
     :return: A mutator function that downgrades transformers.
     """
     if not 1 <= weakening_percentage <= 100:
         raise ValueError("Weakening percentage must be between 1 and 100")
-    amp_rating_ratio = (100 - weakening_percentage) / 100
+    if not 0 <= voltage_tolerance < 1:
+        raise ValueError("Voltage tolerance must be at least 0 and less than 1")
+    return _TransformerWeakener(
+        (100 - weakening_percentage) / 100,
+        use_weakest_when_necessary,
+        match_voltages,
+        callback,
+        catalogue,
+        voltage_tolerance,
+        voltage_match_callback,
+        originals,
+        recorder
+    )
 
-    def mutate(feeder_network: NetworkService):
-        modified_txs = set()
-        for tx in feeder_network.objects(PowerTransformer):
-            ends = list(tx.ends)
-            if len(ends) == 0:
-                continue
-            for end in ends:
-                if end.rated_s is not None:
-                    target_rated_va = end.rated_s * amp_rating_ratio
-                    break
-            else:
-                continue
 
-            correct_num_windings = filter(lambda xfmr: xfmr.windings == len(ends), TRANSFORMER_CATALOGUE)
-            num_cores = ends[0].terminal.phases.without_neutral.num_phases
-            correct_cores_xfmrs = filter(lambda xfmr: xfmr.phases == num_cores, correct_num_windings)
-            if match_voltages:
-                end_voltages = [end.rated_u/1000 for end in ends]
-                good_voltage_xfmrs = [xfmr for xfmr in correct_cores_xfmrs if xfmr.kvs == end_voltages]
-            else:
-                good_voltage_xfmrs = list(correct_cores_xfmrs)
-            viable_xfmrs = filter(lambda xfmr: max(xfmr.kvas) * 1000 <= target_rated_va, good_voltage_xfmrs)
+class _TransformerWeakeningState(object):
+
+    def __init__(self, feeder_network: NetworkService, xfmrs: "TransformerColumns", originals: Optional["_NetworkRatings"]):
+        self.feeder_network = feeder_network
+        self.xfmrs = xfmrs
+        self.originals = originals
+        self.candidate_txs: List[Tuple[PowerTransformer, List[PowerTransformerEnd]]] = []
+        self.signatures: List[Tuple[int, int, Optional[Tuple[float, ...]], float, float, bool]] = []
+        self.voltage_matches: Dict[Tuple[int, int, Tuple[float, ...]], Optional[Tuple[Tuple[float, ...], bool]]] = {}
+        self.match_counts = VoltageMatchCounts()
+
+
+class _TransformerWeakener(VisitingMutator):
+
+    visited_types = (PowerTransformer,)
+    access = MutatorAccess(
+        reads=frozenset({
+            (PowerTransformer, "ends"),
+            (PowerTransformerEnd, "rated_s"),
+            (PowerTransformerEnd, "rated_u"),
+            (PowerTransformerEnd, "terminal"),
+            (Terminal, "phases")
+        }),
+        writes=frozenset({(PowerTransformerEnd, "rated_s")})
+    )
+
+    # Distribution transformers are part of the feeder itself, so its LV feeders are not needed.
+    requirements = MutatorRequirements(lv_feeders=False, locations=False, assets=False)
+
+    def __init__(self, amp_rating_ratio: float, use_weakest_when_necessary: bool, match_voltages: bool,
+                 callback: Optional[Callable[[Set[str]], Any]], catalogue: Optional["TransformerColumns"], voltage_tolerance: float,
+                 voltage_match_callback: Optional[Callable[["VoltageMatchCounts"], Any]], originals: Optional[OriginalRatings],
+                 recorder: Optional[MutationRecorder]):
+        self.amp_rating_ratio = amp_rating_ratio
+        self.use_weakest_when_necessary = use_weakest_when_necessary
+        self.match_voltages = match_voltages
+        self.callback = callback
+        self.catalogue = catalogue
+        self.voltage_tolerance = voltage_tolerance
+        self.voltage_match_callback = voltage_match_callback
+        self.originals = originals
+        self.recorder = recorder
+
+    def begin(self, feeder_network: NetworkService) -> _TransformerWeakeningState:
+        return _TransformerWeakeningState(
+            feeder_network,
+            self.catalogue if self.catalogue is not None else _builtin_transformers(),
+            self.originals._of(feeder_network) if self.originals is not None else None
+        )
 
-            if use_weakest_when_necessary:
-                fallback_xfmr = min(good_voltage_xfmrs, key=lambda xfmr: max(xfmr.kvas), default=None)
+    def visit(self, state: _TransformerWeakeningState, tx: PowerTransformer):
+        ends = list(tx.ends)
+        if len(ends) == 0:
+            return
+        if state.originals is not None and tx.mrid in state.originals.transformers:
+            end_rated_ss = (ratings[0].rated_s if ratings else None for ratings in state.originals.transformers[tx.mrid])
+        else:
+            end_rated_ss = (end.rated_s for end in ends)
+        rated_s = next((end_rated_s for end_rated_s in end_rated_ss if end_rated_s is not None), None)
+        if rated_s is None:
+            return
+
+        num_phases = ends[0].terminal.phases.without_neutral.num_phases
+        if self.match_voltages:
+            end_kvs = tuple(end.rated_u/1000 for end in ends)
+            key = (len(ends), num_phases, end_kvs)
+            if key not in state.voltage_matches:
+                state.voltage_matches[key] = state.xfmrs.find_voltages(*key, self.voltage_tolerance)
+            match = state.voltage_matches[key]
+
+            if match is None:
+                state.match_counts.unmatched += 1
+                return
+            kvs, exact = match
+            if exact:
+                state.match_counts.exact += 1
             else:
-                fallback_xfmr = None
-            xfmr = max(viable_xfmrs, key=lambda xfmr: max(xfmr.kvas), default=fallback_xfmr)
-            if xfmr is None:
+                state.match_counts.within_tolerance += 1
+        else:
+            kvs = None
+
+        state.candidate_txs.append((tx, ends))
+        state.signatures.append((
+            len(ends),
+            num_phases,
+            kvs,
+            rated_s,
+            self.amp_rating_ratio,
+            self.use_weakest_when_necessary
+        ))
+
+    def finish(self, state: _TransformerWeakeningState) -> Optional[Awaitable[None]]:
+        # Transformers sharing a signature share a model, so only unseen signatures are selected, in one batch.
+        selected = TRANSFORMER_SELECTION_CACHE.get_many(state.xfmrs, state.signatures, partial(_select_transformers, state.xfmrs))
+
+        modified_txs = set()
+        for (tx, ends), row in zip(state.candidate_txs, selected):
+            original = state.originals.transformers.get(tx.mrid) if state.originals is not None else None
+            if row < 0:
+                # A transformer that is no longer weakened goes back to its original ratings.
+                if original is not None and tuple(tuple(end.s_ratings) for end in ends) != original:
+                    for end, ratings in zip(ends, original):
+                        _set_s_ratings(self.recorder, state.feeder_network, end, ratings)
+                    modified_txs.add(tx.mrid)
                 continue
+            xfmr = state.xfmrs[row]
+
+            if state.originals is not None:
+                if original is None:
+                    state.originals.transformers[tx.mrid] = tuple(tuple(end.s_ratings) for end in ends)
+                elif all(end.rated_s == new_kva_rating * 1000 for end, new_kva_rating in zip(ends, xfmr.kvas)):
+                    continue
 
             for end, new_kva_rating in zip(ends, xfmr.kvas):
+                old_ratings = tuple(end.s_ratings)
                 end.rated_s = new_kva_rating * 1000
+                if self.recorder is not None:
+                    self.recorder.record(state.feeder_network, end, "s_ratings", old_ratings, tuple(end.s_ratings), xfmr.name)
 
             modified_txs.add(tx.mrid)
 
-        if callback is not None:
-            callback(modified_txs)
+        results = []
+        if self.callback is not None:
+            results.append(self.callback(modified_txs))
+        if self.voltage_match_callback is not None and self.match_voltages:
+            results.append(self.voltage_match_callback(state.match_counts))
+        return _awaitable_results(results)
+
+
+@dataclass
+class VoltageMatchCounts(object):
+    """
+    The number of transformers whose winding voltages matched a transformer model exactly, matched within the voltage
+    tolerance, or did not match any model.
+    """
+    exact: int = 0
+    within_tolerance: int = 0
+    unmatched: int = 0
+
+
+T = TypeVar("T", bound=IdentifiedObject)
+R = TypeVar("R")
+
 
-    return mutate
+def _awaitable_results(results: Iterable[Any]) -> Optional[Awaitable[None]]:
+    awaitables = [result for result in results if inspect.isawaitable(result)]
+    if not awaitables:
+        return None
+
+    async def await_all():
+        for awaitable in awaitables:
+            await awaitable
+
+    return await_all()
+
+
+def _has_mrid(io: Optional[IdentifiedObject], mrid: str) -> bool:
+    return io is not None and io.mrid == mrid
+
+
+def _get_or_add(
+        feeder_network: NetworkService,
+        type_: Type[T],
+        mrid: str,
+        create: Callable[[str], T],
+        recorder: Optional[MutationRecorder] = None,
+        entry: Optional[str] = None
+) -> T:
+    obj = feeder_network.get(mrid, type_, default=None)
+    if obj is None:
+        obj = create(mrid)
+        feeder_network.add(obj)
+        if recorder is not None:
+            recorder.record(feeder_network, obj, ALL_FIELDS, None, obj, entry)
+    return obj
+
+
+def _assign(recorder: Optional[MutationRecorder], feeder_network: NetworkService, io: IdentifiedObject, field_name: str, value: Any,
+            entry: Optional[str] = None):
+    old = getattr(io, field_name)
+    setattr(io, field_name, value)
+    if recorder is not None and old is not value:
+        recorder.record(feeder_network, io, field_name, old, value, entry)
+
+
+def _set_s_ratings(recorder: Optional[MutationRecorder], feeder_network: NetworkService, end: PowerTransformerEnd,
+                   ratings: Iterable[TransformerEndRatedS]):
+    old = tuple(end.s_ratings)
+    end.clear_ratings()
+    for rating in ratings:
+        end.add_rating(rating.cooling_type, rating.rated_s)
+    if recorder is not None:
+        recorder.record(feeder_network, end, "s_ratings", old, tuple(end.s_ratings))
+
+
+def _builtin_linecodes() -> "LinecodeColumns":
+    # The columnar catalogues need NumPy, which is only imported once a catalogue is needed.
+    from zepben.edith.catalogue_columns import LINECODE_COLUMNS
+    return LINECODE_COLUMNS
+
+
+def _builtin_transformers() -> "TransformerColumns":
+    from zepben.edith.catalogue_columns import TRANSFORMER_COLUMNS
+    return TRANSFORMER_COLUMNS
+
+
+def _select_linecodes(linecodes: "LinecodeColumns", signatures: List[Tuple[bool, int, float, float, bool]]) -> Sequence[int]:
+    hv, phases, rated_currents, ratios, use_weakest = zip(*signatures)
+    return linecodes.select(
+        [rated_current * ratio for rated_current, ratio in zip(rated_currents, ratios)],
+        phases,
+        hv,
+        use_weakest[0]
+    )
+
+
+def _select_transformers(
+    xfmrs: "TransformerColumns",
+    signatures: List[Tuple[int, int, Optional[Tuple[float, ...]], float, float, bool]]
+) -> Sequence[int]:
+    windings, phases, kvs, rated_ss, ratios, use_weakest = zip(*signatures)
+    if kvs[0] is not None:
+        width = max(windings)
+        kvs = [end_kvs + (0,) * (width - len(end_kvs)) for end_kvs in kvs]
+    else:
+        kvs = None
+
+    return xfmrs.select(
+        [rated_s * ratio for rated_s, ratio in zip(rated_ss, ratios)],
+        windings,
+        phases,
+        kvs,
+        use_weakest[0]
+    )
+
+
+class LvFeederMutator(VisitingMutator):
+    """
+    A mutator that modifies a feeder network one `LvFeeder` at a time. When a synthetic feeder is created with
+    `stream_lv_feeders`, it is applied to each LV feeder as soon as that LV feeder has been fetched, rather than waiting
+    for the whole network.
+
+    Any state needed across LV feeders is returned by `begin` and passed to the other methods, so a single mutator can
+    be applied to several networks at once. `finish` may return an awaitable, e.g. of an asynchronous callback, which is
+    awaited, in mutator order, before the next stage of mutators starts (see `apply_mutators`).
+    """
+
+    visited_types = (LvFeeder,)
+    requirements: MutatorRequirements = MutatorRequirements()
+
+    def visit(self, state: Any, lv_feeder: LvFeeder):
+        self.mutate_lv_feeder(state, lv_feeder)
+
+    def mutate_lv_feeder(self, state: Any, lv_feeder: LvFeeder):
+        """
+        Mutate an LV feeder, once its equipment and everything it references are in the network.
+
+        :param state: The state returned by `begin`.
+        :param lv_feeder: The LV feeder to mutate.
+        """
+        raise NotImplementedError
+
+
+class MutatorPipeline(object):
+    """
+    A mutator that applies other mutators in stages of independent mutators, as described in `apply_mutators`, running
+    the mutators of each stage on up to `max_workers` threads. The result is the same as applying the mutators one after
+    another, and the awaitables returned by the mutators of each stage are awaited in the order the mutators were given.
+
+    Mutators declare what they read and write with an `access` attribute holding a `MutatorAccess`. Mutators without one
+    are applied on their own, after every mutator before them and before every mutator after them.
+    """
+
+    def __init__(self, mutators: Iterable[Callable[[NetworkService], Any]], max_workers: int = 4):
+        """
+        :param mutators: The mutators to apply.
+        :param max_workers: The number of threads to apply the independent mutators of a stage with.
+        """
+        if max_workers < 1:
+            raise ValueError("max_workers must be at least 1")
+        self.mutators = list(mutators)
+        self.max_workers = max_workers
+        self.requirements = _plan_fetch(self.mutators)
+
+        accesses = [mutator_access(mutator) for mutator in self.mutators]
+        self.access = None if any(access is None for access in accesses) else reduce(operator.or_, accesses, MutatorAccess())
+
+    def __call__(self, feeder_network: NetworkService) -> Awaitable[None]:
+        return apply_mutators(self.mutators, feeder_network, self.max_workers)
 
 
 def usage_point_proportional_allocator(
@@ -169,18 +605,33 @@ def usage_point_proportional_allocator(
         edith_customers: List[str],
         allow_duplicate_customers: bool = False,
         seed: Optional[int] = None,
-        callback: Optional[Callable[[Set[str]], Any]] = None
-) -> Callable[[NetworkService], None]:
+        callback: Optional[Callable[[Set[str]], Any]] = None,
+        recorder: Optional[MutationRecorder] = None,
+        restart_customers_per_feeder: bool = False
+) -> LvFeederMutator:
     """
     Creates a mutator function that distributes a `proportion` of NMIs from `edith_customers`
     to the `UsagePoint`s in the network.
 
+    By default, each feeder network the mutator is applied to is given the customers that follow those given to the
+    feeder networks it was applied to before, in the order they finished being mutated. When several feeders are
+    mutated at the same time, e.g. by `create_synthetic_feeders` or a `MutatorPipeline`, which customers each feeder
+    gets depends on that order, so it can change from run to run even with a `seed`. The usage points chosen in each
+    feeder only depend on the `seed`. Use `restart_customers_per_feeder` for allocations that do not depend on the
+    order feeders are mutated in.
+
     :param proportion: The percentage of Edith customers to distribute to an `LvFeeder`. Must be between 1 and 100
     :param edith_customers: The Edith NMIs to distribute to the `UsagePoint`s in the network.
     :param allow_duplicate_customers: Reuse customers from the list to reach the proportion if necessary. Defaults to
                                       `False`.
     :param seed: A number to seed the random number generator with. Defaults to not seeding.
-    :param callback: An optional function that is called on the set of mRIDs of `UsagePoint`s that are named.
+    :param callback: An optional function that is called on the set of mRIDs of `UsagePoint`s that are named. It may be
+                     a coroutine function, in which case the mutator returns its coroutine to be awaited.
+    :param recorder: An optional `MutationRecorder`, such as a `MutationJournal`, to record each change in.
+    :param restart_customers_per_feeder: Allocate each feeder network from the start of `edith_customers`, so a customer
+                                         may be given to a usage point in each of several feeders, and the allocation of
+                                         a feeder does not depend on the other feeders mutated before it. Defaults to
+                                         `False`, which continues from where the previous feeder network left off.
 
     :return: A mutator function that distributes NMIs across `proportion`% of the `UsagePoint`s, and returns the set
              of mRIDs of modified `UsagePoint`s.
@@ -188,69 +639,229 @@ def usage_point_proportional_allocator(
     if not 1 <= proportion <= 100:
         raise ValueError("Proportion must be between 1 and 100")
 
-    if allow_duplicate_customers:
-        nmi_generator = itertools.cycle(edith_customers)
-    else:
-        nmi_generator = iter(edith_customers)
+    return _UsagePointProportionalAllocator(
+        proportion,
+        edith_customers,
+        allow_duplicate_customers,
+        seed,
+        callback,
+        recorder,
+        restart_customers_per_feeder
+    )
+
+
+class _AllocationState(object):
 
-    def mutate(feeder_network: NetworkService):
-        random.seed(seed)
+    def __init__(self, feeder_network: NetworkService, rng: "Generator", nmi_name_type: NameType):
+        self.feeder_network = feeder_network
+        self.rng = rng
+        self.nmi_name_type = nmi_name_type
+        self.lv_feeder_usage_points: List[Tuple[str, List[UsagePoint]]] = []
+
+
+class _UsagePointProportionalAllocator(LvFeederMutator):
+
+    requirements = MutatorRequirements(locations=False, assets=False)
+    access = MutatorAccess(
+        reads=frozenset({(LvFeeder, "equipment"), (Equipment, "usage_points"), (UsagePoint, "names")}),
+        writes=frozenset({(UsagePoint, "names"), (NameType, ALL_FIELDS)})
+    )
+
+    def __init__(self, proportion: int, edith_customers: List[str], allow_duplicate_customers: bool, seed: Optional[int],
+                 callback: Optional[Callable[[Set[str]], Any]], recorder: Optional[MutationRecorder], restart_customers_per_feeder: bool):
+        self.proportion = proportion
+        self.seed = seed
+        self.callback = callback
+        self.recorder = recorder
+        self.edith_customers = list(edith_customers)
+        self.allow_duplicate_customers = allow_duplicate_customers
+        self.restart_customers_per_feeder = restart_customers_per_feeder
+        self._next_customer = 0
+        self._customers_lock = Lock()
+
+    def begin(self, feeder_network: NetworkService) -> _AllocationState:
         try:
             nmi_name_type = feeder_network.get_name_type("NMI")
         except KeyError:
             # noinspection PyArgumentList
             nmi_name_type = NameType(name="NMI")
             feeder_network.add_name_type(nmi_name_type)
+            if self.recorder is not None:
+                self.recorder.record(feeder_network, nmi_name_type, ALL_FIELDS, None, nmi_name_type)
 
-        usage_points_named = set()
-        for lv_feeder in feeder_network.objects(LvFeeder):
-            usage_points = []
-            for eq in lv_feeder.equipment:
-                usage_points.extend(eq.usage_points)
-            usage_points.sort(key=lambda up: up.mrid)
-
-            usage_points_to_name = random.sample(usage_points, int(len(usage_points) * proportion / 100))
-            for usage_point in usage_points_to_name:
-                try:
-                    next_nmi = next(nmi_generator)
-                except StopIteration:
-                    break
+        # NumPy is only imported once an allocation is made. A generator per application, seeded the same way, keeps
+        # the usage points chosen in a feeder independent of any other feeders being mutated at the same time.
+        from numpy.random import default_rng
+        return _AllocationState(feeder_network, default_rng(self.seed), nmi_name_type)
 
-                for name in usage_point.names:
-                    if name.type.name == "NMI":
-                        usage_point.remove_name(name)
-                        name.type.remove_name(name)
-                        break
+    def mutate_lv_feeder(self, state: _AllocationState, lv_feeder: LvFeeder):
+        # Usage points are only collected here, so that every LV feeder is sampled in one batch by `finish`.
+        usage_points = []
+        for eq in lv_feeder.equipment:
+            usage_points.extend(eq.usage_points)
+        state.lv_feeder_usage_points.append((lv_feeder.mrid, usage_points))
 
-                usage_point.add_name(nmi_name_type.get_or_add_name(next_nmi, usage_point))
-                usage_points_named.add(usage_point.mrid)
-            else:
-                continue
-            break
+    def finish(self, state: _AllocationState) -> Optional[Awaitable[None]]:
+        from zepben.edith.allocation import allocate_customers
 
-        if callback is not None:
-            callback(usage_points_named)
+        usage_points_named = set()
+        if self.restart_customers_per_feeder:
+            allocations = allocate_customers(
+                state.lv_feeder_usage_points,
+                self.proportion,
+                self.edith_customers,
+                self.allow_duplicate_customers,
+                state.rng
+            )
+        else:
+            # Feeder networks mutated at the same time take the customers that follow each other's, one at a time.
+            with self._customers_lock:
+                allocations = allocate_customers(
+                    state.lv_feeder_usage_points,
+                    self.proportion,
+                    self.edith_customers,
+                    self.allow_duplicate_customers,
+                    state.rng,
+                    self._next_customer
+                )
+                self._next_customer += len(allocations)
+                if self.allow_duplicate_customers and self.edith_customers:
+                    self._next_customer %= len(self.edith_customers)
+        for usage_point, nmi in allocations:
+            for name in usage_point.names:
+                if name.type.name == "NMI":
+                    usage_point.remove_name(name)
+                    name.type.remove_name(name)
+                    if self.recorder is not None:
+                        self.recorder.record(state.feeder_network, usage_point, "names", name, None)
+                    break
+
+            name = state.nmi_name_type.get_or_add_name(nmi, usage_point)
+            usage_point.add_name(name)
+            if self.recorder is not None:
+                self.recorder.record(state.feeder_network, usage_point, "names", None, name)
+            usage_points_named.add(usage_point.mrid)
 
-    return mutate
+        if self.callback is not None:
+            return _awaitable_results([self.callback(usage_points_named)])
 
 
 async def _create_synthetic_feeder(
         self: NetworkConsumerClient,
         feeder_mrid: str,
-        mutators: Iterable[Callable[[NetworkService], None]] = ()
+        mutators: Iterable[Callable[[NetworkService], None]] = (),
+        cache: Optional["FeederCache"] = None,
+        stream_lv_feeders: bool = False,
+        max_lv_feeder_fetches: int = 4,
+        minimal_fetch: bool = False
 ):
     """
     Creates a copy of the given `feeder_mrid` and runs `mutator` to the copied network.
 
     :param feeder_mrid: The mRID of the feeder to create a synthetic version of.
-    :param mutators: The mutator functions to use to modify the feeder network. Defaults to no mutator functions.
+    :param mutators: The mutator functions to use to modify the feeder network. Defaults to no mutator functions. A
+        mutator may be a coroutine function, or return an awaitable, which is awaited, in mutator order, before the next
+        stage of mutators starts (see `apply_mutators`).
+    :param cache: A cache of fetched feeder networks to load the feeder from instead of the server, if it holds a valid
+        copy of it. Feeders that are fetched from the server are stored in the cache before being mutated. Cached
+        feeders are always fetched whole, so they can be reused with any mutators.
+    :param stream_lv_feeders: Fetch the feeder's LV feeders one at a time after the rest of the feeder, applying the
+        leading `LvFeederMutator`s in `mutators` to each LV feeder as soon as it has been fetched. The remaining
+        mutators are applied once every LV feeder has been fetched. With `minimal_fetch`, the LV feeders are not fetched
+        at all if no mutator needs them. Can not be used with a `cache`.
+    :param max_lv_feeder_fetches: The maximum number of LV feeders to fetch at once when streaming LV feeders.
+    :param minimal_fetch: Only fetch the parts of the feeder that the mutators declare they need in their
+        `MutatorRequirements`, e.g. leaving out locations and assets for the built-in mutators. The client's network
+        then does not hold the whole feeder. Defaults to fetching the whole feeder.
     :return: The mRIDs of the mutated objects in the feeder network.
     """
+    mutators = list(mutators)
+    requirements = _plan_fetch(mutators, minimal_fetch)
+
+    if stream_lv_feeders:
+        if cache is not None:
+            raise ValueError("LV feeders can not be streamed when using a cache, as the cache stores unmutated feeders")
+        # When no mutator needs the LV feeders there is nothing to stream, so the feeder is fetched without them.
+        if requirements.lv_feeders:
+            await _fetch_and_mutate_lv_feeders(self, feeder_mrid, mutators, max_lv_feeder_fetches, requirements)
+            return
 
-    (await self.get_equipment_container(feeder_mrid, Feeder, include_energized_containers=INCLUDE_ENERGIZED_LV_FEEDERS)).throw_on_error()
+    await _fetch_feeder(self, feeder_mrid, cache, requirements)
+
+    await apply_mutators(mutators, self.service)
+
+
+async def _fetch_and_mutate_lv_feeders(
+        client: NetworkConsumerClient,
+        feeder_mrid: str,
+        mutators: List[Callable[[NetworkService], None]],
+        max_lv_feeder_fetches: int,
+        requirements: MutatorRequirements
+):
+    if max_lv_feeder_fetches < 1:
+        raise ValueError("max_lv_feeder_fetches must be at least 1")
+
+    # Fetching the feeder without its LV feeders still resolves the LvFeeder objects it references, just not their equipment.
+    fetcher = planned_client(client, requirements.skipped_types)
+    (await fetcher.get_equipment_container(feeder_mrid, Feeder)).throw_on_error()
+    network = client.service
+
+    energized = {lv_feeder.mrid for lv_feeder in network.get(feeder_mrid, Feeder).normal_energized_lv_feeders}
+    lv_feeders = [lv_feeder for lv_feeder in network.objects(LvFeeder) if lv_feeder.mrid in energized]
+
+    # Mutators after the first one that needs the whole network must wait for it, to keep the order they are applied in.
+    num_streamed = next((i for i, mutator in enumerate(mutators) if not isinstance(mutator, LvFeederMutator)), len(mutators))
+    streamed = [(mutator, mutator.begin(network)) for mutator in mutators[:num_streamed]]
+
+    semaphore = Semaphore(max_lv_feeder_fetches)
+
+    async def fetch(lv_feeder: LvFeeder):
+        async with semaphore:
+            (await fetcher.get_equipment_container(lv_feeder.mrid, LvFeeder)).throw_on_error()
+
+    fetches = [ensure_future(fetch(lv_feeder)) for lv_feeder in lv_feeders]
+    try:
+        for lv_feeder, fetched in zip(lv_feeders, fetches):
+            await fetched
+            for mutator, state in streamed:
+                mutator.mutate_lv_feeder(state, lv_feeder)
+    finally:
+        for fetched in fetches:
+            fetched.cancel()
+        await gather(*fetches, return_exceptions=True)
+
+    for mutator, state in streamed:
+        finished = mutator.finish(state)
+        if inspect.isawaitable(finished):
+            await finished
+
+    await apply_mutators(mutators[num_streamed:], network)
+
+
+async def _fetch_feeder(
+        client: NetworkConsumerClient,
+        feeder_mrid: str,
+        cache: Optional["FeederCache"],
+        requirements: Optional[MutatorRequirements] = None
+):
+    if cache is None:
+        requirements = requirements if requirements is not None else MutatorRequirements()
+        include_energized_containers = INCLUDE_ENERGIZED_LV_FEEDERS if requirements.lv_feeders else EXCLUDE_ENERGIZED_CONTAINERS
+        fetcher = planned_client(client, requirements.skipped_types)
+        (await fetcher.get_equipment_container(feeder_mrid, Feeder, include_energized_containers=include_energized_containers)).throw_on_error()
+        return
+
+    if cache.load(feeder_mrid, client.service) is not None:
+        return
+
+    # Fetch into an empty service so that only the feeder's network is cached, not everything else the client holds.
+    fetcher = isolated_client(client)
+    (await fetcher.get_equipment_container(feeder_mrid, Feeder, include_energized_containers=INCLUDE_ENERGIZED_LV_FEEDERS)).throw_on_error()
+    # The network is serialised once, both to cache it and to copy it into the client's network.
+    data = network_to_bytes(fetcher.service)
+    cache.store(feeder_mrid, fetcher.service, data)
+    network_from_bytes(data, client.service)
 
-    for mutator in mutators:
-        mutator(self.service)
 
 NetworkConsumerClient.create_synthetic_feeder = _create_synthetic_feeder
 
@@ -258,16 +869,453 @@ NetworkConsumerClient.create_synthetic_feeder = _create_synthetic_feeder
 def _sync_create_synthetic_feeder(
         self: SyncNetworkConsumerClient,
         feeder_mrid: str,
-        mutators: Iterable[Callable[[NetworkService], None]] = ()
+        mutators: Iterable[Callable[[NetworkService], None]] = (),
+        cache: Optional["FeederCache"] = None,
+        stream_lv_feeders: bool = False,
+        max_lv_feeder_fetches: int = 4,
+        minimal_fetch: bool = False
 ):
     """
     Creates a copy of the given `feeder_mrid` and runs `mutator` to the copied network.
 
     :param feeder_mrid: The mRID of the feeder to create a synthetic version of.
     :param mutator: The mutator to use to modify the feeder network. Default will do nothing to the feeder.
+    :param cache: A cache of fetched feeder networks to load the feeder from instead of the server, if it holds a valid
+        copy of it.
+    :param stream_lv_feeders: Apply the leading `LvFeederMutator`s in `mutators` to each LV feeder as soon as it has
+        been fetched. Can not be used with a `cache`.
+    :param max_lv_feeder_fetches: The maximum number of LV feeders to fetch at once when streaming LV feeders.
+    :param minimal_fetch: Only fetch the parts of the feeder that the mutators declare they need.
     :return: The mRIDs of the mutated objects in the feeder network.
     """
-    return get_event_loop().run_until_complete(_create_synthetic_feeder(self, feeder_mrid, mutators))
+    return _run_sync(
+        self,
+        _create_synthetic_feeder(self, feeder_mrid, mutators, cache, stream_lv_feeders, max_lv_feeder_fetches, minimal_fetch)
+    )
 
 
 SyncNetworkConsumerClient.create_synthetic_feeder = _sync_create_synthetic_feeder
+
+
+@dataclass
+class SyntheticFeederResult(object):
+    """
+    The outcome of creating one synthetic feeder with `create_synthetic_feeders`.
+
+    :param feeder_mrid: The mRID of the feeder the synthetic feeder was created from.
+    :param network: The isolated network the feeder was fetched into and mutated, or `None` if it could not be created.
+    :param error: The exception raised while fetching or mutating the feeder, if any.
+    :param attempts: The timing and outcome of each attempt to fetch the feeder, if it was fetched with a `FetchPolicy`.
+    """
+    feeder_mrid: str
+    network: Optional[NetworkService] = None
+    error: Optional[Exception] = None
+    attempts: List[FetchAttempt] = []
+
+    @property
+    def was_successful(self) -> bool:
+        return self.error is None
+
+
+async def _create_synthetic_feeders(
+        self: NetworkConsumerClient,
+        feeder_mrids: Iterable[str],
+        mutators: Iterable[Callable[[NetworkService], None]] = (),
+        max_concurrency: int = 8,
+        cache: Optional["FeederCache"] = None,
+        stream_lv_feeders: bool = False,
+        policy: Optional[FetchPolicy] = None,
+        minimal_fetch: bool = False
+) -> List[SyntheticFeederResult]:
+    """
+    Creates a synthetic version of each of the given feeders, fetching each into its own `NetworkService` so that up to
+    `max_concurrency` feeders can be fetched from the server at once. `self.service` is not modified.
+
+    :param feeder_mrids: The mRIDs of the feeders to create synthetic versions of.
+    :param mutators: The mutator functions to apply to each feeder network. Defaults to no mutator functions.
+    :param max_concurrency: The maximum number of feeders to fetch at once.
+    :param cache: A cache of fetched feeder networks to load feeders from instead of the server, if it holds a valid
+        copy of them.
+    :param stream_lv_feeders: Apply the leading `LvFeederMutator`s in `mutators` to each LV feeder as soon as it has
+        been fetched. Can not be used with a `cache` or `policy`.
+    :param policy: The deadline, retries and hedging to fetch each feeder with. Hedged fetches use the same channel.
+        Defaults to fetching each feeder once, with no deadline.
+    :param minimal_fetch: Only fetch the parts of each feeder that the mutators declare they need in their
+        `MutatorRequirements`. Defaults to fetching each feeder whole.
+    :return: A `SyntheticFeederResult` for each feeder, in the same order as `feeder_mrids`. A feeder that fails to be
+        fetched or mutated does not stop the others from being created.
+    """
+    if max_concurrency < 1:
+        raise ValueError("max_concurrency must be at least 1")
+    check_policy(policy, stream_lv_feeders)
+
+    mutators = list(mutators)
+    semaphore = Semaphore(max_concurrency)
+    stub = shared_hierarchy_stub(self)
+
+    async def create(feeder_mrid: str) -> SyntheticFeederResult:
+        async with semaphore:
+            return await create_isolated_synthetic_feeder(
+                self,
+                feeder_mrid,
+                mutators,
+                cache,
+                stream_lv_feeders,
+                policy,
+                stub=stub,
+                minimal_fetch=minimal_fetch
+            )
+
+    return list(await gather(*(create(feeder_mrid) for feeder_mrid in feeder_mrids)))
+
+
+async def create_isolated_synthetic_feeder(
+        self: NetworkConsumerClient,
+        feeder_mrid: str,
+        mutators: Iterable[Callable[[NetworkService], None]],
+        cache: Optional["FeederCache"],
+        stream_lv_feeders: bool,
+        policy: Optional[FetchPolicy] = None,
+        create_hedge_client: Optional[Callable[[], NetworkConsumerClient]] = None,
+        stub: Optional[SharedHierarchyStub] = None,
+        minimal_fetch: bool = False,
+        release_hedge_client: Optional[Callable[[NetworkConsumerClient], None]] = None
+) -> SyntheticFeederResult:
+    """
+    Creates a synthetic version of a feeder in its own `NetworkService`, for `create_synthetic_feeders` and the client
+    pool. Not part of the public API.
+
+    :param create_hedge_client: Creates the client for a hedged fetch. Defaults to a client on the same channel.
+    :param stub: The stub shared by the clients of a batch. Defaults to a stub for this feeder alone.
+    :param release_hedge_client: Called with each hedge client once its fetch is finished.
+    :return: The `SyntheticFeederResult` for the feeder.
+    """
+    # The clients of a batch share a stub, so the network hierarchy is only requested once for the whole batch.
+    stub = stub if stub is not None else shared_hierarchy_stub(self)
+    client = isolated_client(self, stub)
+    if policy is None:
+        try:
+            await _create_synthetic_feeder(client, feeder_mrid, mutators, cache, stream_lv_feeders, minimal_fetch=minimal_fetch)
+        except Exception as e:
+            return SyntheticFeederResult(feeder_mrid, error=e)
+        return SyntheticFeederResult(feeder_mrid, client.service)
+
+    mutators = list(mutators)
+    requirements = _plan_fetch(mutators, minimal_fetch)
+    attempts = []
+    try:
+        client = await fetch_with_policy(
+            lambda c: _fetch_feeder(c, feeder_mrid, cache, requirements),
+            client,
+            create_hedge_client if create_hedge_client is not None else lambda: isolated_client(self, stub),
+            policy,
+            attempts,
+            release_hedge_client
+        )
+        await apply_mutators(mutators, client.service)
+    except Exception as e:
+        return SyntheticFeederResult(feeder_mrid, error=e, attempts=attempts)
+    return SyntheticFeederResult(feeder_mrid, client.service, attempts=attempts)
+
+
+NetworkConsumerClient.create_synthetic_feeders = _create_synthetic_feeders
+
+
+def _sync_create_synthetic_feeders(
+        self: SyncNetworkConsumerClient,
+        feeder_mrids: Iterable[str],
+        mutators: Iterable[Callable[[NetworkService], None]] = (),
+        max_concurrency: int = 8,
+        cache: Optional["FeederCache"] = None,
+        stream_lv_feeders: bool = False,
+        policy: Optional[FetchPolicy] = None,
+        minimal_fetch: bool = False
+) -> List[SyntheticFeederResult]:
+    """
+    Creates a synthetic version of each of the given feeders, fetching each into its own `NetworkService` so that up to
+    `max_concurrency` feeders can be fetched from the server at once. `self.service` is not modified.
+
+    :param feeder_mrids: The mRIDs of the feeders to create synthetic versions of.
+    :param mutators: The mutator functions to apply to each feeder network. Defaults to no mutator functions.
+    :param max_concurrency: The maximum number of feeders to fetch at once.
+    :param cache: A cache of fetched feeder networks to load feeders from instead of the server, if it holds a valid
+        copy of them.
+    :param stream_lv_feeders: Apply the leading `LvFeederMutator`s in `mutators` to each LV feeder as soon as it has
+        been fetched. Can not be used with a `cache` or `policy`.
+    :param policy: The deadline, retries and hedging to fetch each feeder with.
+    :param minimal_fetch: Only fetch the parts of each feeder that the mutators declare they need.
+    :return: A `SyntheticFeederResult` for each feeder, in the same order as `feeder_mrids`.
+    """
+    return _run_sync(
+        self,
+        _create_synthetic_feeders(self, feeder_mrids, mutators, max_concurrency, cache, stream_lv_feeders, policy, minimal_fetch)
+    )
+
+
+SyncNetworkConsumerClient.create_synthetic_feeders = _sync_create_synthetic_feeders
+
+
+async def _iterate_synthetic_feeders(
+        self: NetworkConsumerClient,
+        feeder_mrids: Iterable[str],
+        mutators: Iterable[Callable[[NetworkService], None]] = (),
+        prefetch: int = 2,
+        cache: Optional["FeederCache"] = None,
+        stream_lv_feeders: bool = False,
+        policy: Optional[FetchPolicy] = None,
+        minimal_fetch: bool = False
+) -> AsyncIterator[SyntheticFeederResult]:
+    """
+    Creates a synthetic version of each of the given feeders one at a time, fetching the next `prefetch` feeders in the
+    background while the caller works on the current one. Each feeder is fetched into its own `NetworkService`, and
+    `self.service` is not modified. At most `prefetch` feeders are held or being fetched besides the one the caller has.
+
+        async for result in client.iterate_synthetic_feeders(feeder_mrids, [mutator]):
+            ...  # export result.network
+
+    :param feeder_mrids: The mRIDs of the feeders to create synthetic versions of.
+    :param mutators: The mutator functions to apply to each feeder network. Defaults to no mutator functions.
+    :param prefetch: The number of feeders to fetch ahead of the current one. 0 fetches each feeder only once the caller
+        has finished with the one before it.
+    :param cache: A cache of fetched feeder networks to load feeders from instead of the server, if it holds a valid
+        copy of them.
+    :param stream_lv_feeders: Apply the leading `LvFeederMutator`s in `mutators` to each LV feeder as soon as it has
+        been fetched. Can not be used with a `cache` or `policy`.
+    :param policy: The deadline, retries and hedging to fetch each feeder with.
+    :param minimal_fetch: Only fetch the parts of each feeder that the mutators declare they need in their
+        `MutatorRequirements`. Defaults to fetching each feeder whole.
+    :return: An asynchronous iterator of a `SyntheticFeederResult` for each feeder, in the same order as `feeder_mrids`.
+    """
+    if prefetch < 0:
+        raise ValueError("prefetch must not be negative")
+    check_policy(policy, stream_lv_feeders)
+
+    mutators = list(mutators)
+    stub = shared_hierarchy_stub(self)
+    async for result in _prefetch(
+        feeder_mrids,
+        lambda feeder_mrid: create_isolated_synthetic_feeder(
+            self,
+            feeder_mrid,
+            mutators,
+            cache,
+            stream_lv_feeders,
+            policy,
+            stub=stub,
+            minimal_fetch=minimal_fetch
+        ),
+        prefetch
+    ):
+        yield result
+
+NetworkConsumerClient.iterate_synthetic_feeders = _iterate_synthetic_feeders
+
+
+def _sync_iterate_synthetic_feeders(
+        self: SyncNetworkConsumerClient,
+        feeder_mrids: Iterable[str],
+        mutators: Iterable[Callable[[NetworkService], None]] = (),
+        prefetch: int = 2,
+        cache: Optional["FeederCache"] = None,
+        stream_lv_feeders: bool = False,
+        policy: Optional[FetchPolicy] = None,
+        minimal_fetch: bool = False
+) -> Iterator[SyntheticFeederResult]:
+    """
+    Creates a synthetic version of each of the given feeders one at a time, fetching up to `prefetch` feeders ahead of
+    the current one. Feeders are only fetched in the background while the caller works on the current one if the client
+    runs on a background event loop, e.g. a `BackgroundSyncNetworkConsumerClient`.
+
+    :param feeder_mrids: The mRIDs of the feeders to create synthetic versions of.
+    :param mutators: The mutator functions to apply to each feeder network. Defaults to no mutator functions.
+    :param prefetch: The number of feeders to fetch ahead of the current one.
+    :param cache: A cache of fetched feeder networks to load feeders from instead of the server, if it holds a valid
+        copy of them.
+    :param stream_lv_feeders: Apply the leading `LvFeederMutator`s in `mutators` to each LV feeder as soon as it has
+        been fetched. Can not be used with a `cache` or `policy`.
+    :param policy: The deadline, retries and hedging to fetch each feeder with.
+    :param minimal_fetch: Only fetch the parts of each feeder that the mutators declare they need.
+    :return: An iterator of a `SyntheticFeederResult` for each feeder, in the same order as `feeder_mrids`.
+    """
+    results = _iterate_synthetic_feeders(self, feeder_mrids, mutators, prefetch, cache, stream_lv_feeders, policy, minimal_fetch)
+
+    # Background event loops only run coroutines, rather than any awaitable.
+    async def next_result() -> SyntheticFeederResult:
+        return await results.__anext__()
+
+    async def close():
+        await results.aclose()
+
+    try:
+        while True:
+            try:
+                yield _run_sync(self, next_result())
+            except StopAsyncIteration:
+                return
+    finally:
+        # Cancels any feeders still being prefetched if the caller stops early.
+        _run_sync(self, close())
+
+
+SyncNetworkConsumerClient.iterate_synthetic_feeders = _sync_iterate_synthetic_feeders
+
+
+async def _prefetch(items: Iterable[str], create: Callable[[str], Awaitable[R]], prefetch: int) -> AsyncIterator[R]:
+    items = iter(items)
+    pending = deque(ensure_future(create(item)) for item in itertools.islice(items, prefetch + 1))
+    try:
+        while pending:
+            yield await pending.popleft()
+            # The caller has finished with the previous item, so another can be started without exceeding the bound.
+            pending.extend(ensure_future(create(item)) for item in itertools.islice(items, 1))
+    finally:
+        for task in pending:
+            task.cancel()
+        await gather(*pending, return_exceptions=True)
+
+
+async def _create_synthetic_feeder_scenarios(
+        self: NetworkConsumerClient,
+        feeder_mrid: str,
+        scenarios: Iterable[Sequence[MutatorFactory]],
+        max_workers: Optional[int] = None,
+        return_networks: bool = True,
+        cache: Optional["FeederCache"] = None
+) -> List[ScenarioResult]:
+    """
+    Fetches the given `feeder_mrid` once, then applies each scenario to its own copy of the feeder across a pool of
+    worker processes. `self.service` is not modified.
+
+    :param feeder_mrid: The mRID of the feeder to create synthetic versions of.
+    :param scenarios: The mutator factories of each scenario. A mutator factory is a picklable callable that takes a
+        `callback` keyword argument and returns a mutator, e.g. `functools.partial(line_weakener, 30)`.
+    :param max_workers: The number of worker processes to use. Defaults to the number of processors.
+    :param return_networks: Whether to return the mutated copy of the feeder for each scenario.
+    :param cache: A cache of fetched feeder networks to load the feeder from instead of the server, if it holds a valid
+        copy of it.
+    :return: A `ScenarioResult` for each scenario, in the same order as `scenarios`, holding the mutated feeder and the
+        values passed to each mutator's callback.
+    """
+    client = isolated_client(self)
+    await _fetch_feeder(client, feeder_mrid, cache)
+
+    scenarios = [list(scenario) for scenario in scenarios]
+    return await get_running_loop().run_in_executor(None, run_scenarios, client.service, scenarios, max_workers, return_networks)
+
+NetworkConsumerClient.create_synthetic_feeder_scenarios = _create_synthetic_feeder_scenarios
+
+
+def _sync_create_synthetic_feeder_scenarios(
+        self: SyncNetworkConsumerClient,
+        feeder_mrid: str,
+        scenarios: Iterable[Sequence[MutatorFactory]],
+        max_workers: Optional[int] = None,
+        return_networks: bool = True,
+        cache: Optional["FeederCache"] = None
+) -> List[ScenarioResult]:
+    """
+    Fetches the given `feeder_mrid` once, then applies each scenario to its own copy of the feeder across a pool of
+    worker processes. `self.service` is not modified.
+
+    :param feeder_mrid: The mRID of the feeder to create synthetic versions of.
+    :param scenarios: The mutator factories of each scenario, e.g. `[[partial(line_weakener, 10)], ...]`.
+    :param max_workers: The number of worker processes to use. Defaults to the number of processors.
+    :param return_networks: Whether to return the mutated copy of the feeder for each scenario.
+    :param cache: A cache of fetched feeder networks to load the feeder from instead of the server, if it holds a valid
+        copy of it.
+    :return: A `ScenarioResult` for each scenario, in the same order as `scenarios`.
+    """
+    return _run_sync(self, _create_synthetic_feeder_scenarios(self, feeder_mrid, scenarios, max_workers, return_networks, cache))
+
+
+SyncNetworkConsumerClient.create_synthetic_feeder_scenarios = _sync_create_synthetic_feeder_scenarios
+
+
+class BackgroundSyncNetworkConsumerClient(SyncNetworkConsumerClient):
+    """
+    A `SyncNetworkConsumerClient` whose synchronous calls run on a background event loop, rather than on an event loop
+    in the calling thread. It works from threads with no event loop, or from inside an already running one such as a
+    Jupyter kernel, and can overlap many feeders with `submit_synthetic_feeder`.
+    """
+
+    background_loop: Optional[BackgroundEventLoop] = None
+
+    def __init__(
+            self,
+            channel_factory: Callable[[], Any],
+            background_loop: Optional[BackgroundEventLoop] = None,
+            error_handlers: List[Callable[[Exception], bool]] = None,
+            timeout: int = 60
+    ):
+        """
+        :param channel_factory: A function that creates the gRPC channel to use, e.g.
+            `lambda: connect_with_password(client_id=..., username=..., password=..., host=..., port=...)`. It is called
+            on the background event loop, as gRPC channels can only be used from the event loop they were created on.
+        :param background_loop: The background event loop to run calls on. Defaults to one shared by every client.
+        :param error_handlers: A collection of handlers to be processed for any errors that occur.
+        :param timeout: The timeout for gRPC requests, in seconds.
+        """
+        background_loop = background_loop if background_loop is not None else default_background_loop()
+        background_loop.call(
+            lambda: SyncNetworkConsumerClient.__init__(self, channel=channel_factory(), error_handlers=error_handlers, timeout=timeout)
+        )
+        self.background_loop = background_loop
+
+    def submit_synthetic_feeder(
+            self,
+            feeder_mrid: str,
+            mutators: Iterable[Callable[[NetworkService], None]] = (),
+            cache: Optional["FeederCache"] = None,
+            stream_lv_feeders: bool = False,
+            policy: Optional[FetchPolicy] = None,
+            minimal_fetch: bool = False
+    ) -> Future[SyntheticFeederResult]:
+        """
+        Starts creating a synthetic version of a feeder on the background event loop, fetching it into its own
+        `NetworkService`, and returns without waiting for it.
+
+        :param feeder_mrid: The mRID of the feeder to create a synthetic version of.
+        :param mutators: The mutator functions to apply to the feeder network. Defaults to no mutator functions.
+        :param cache: A cache of fetched feeder networks to load the feeder from instead of the server, if it holds a
+            valid copy of it.
+        :param stream_lv_feeders: Apply the leading `LvFeederMutator`s in `mutators` to each LV feeder as soon as it has
+            been fetched. Can not be used with a `cache` or `policy`.
+        :param policy: The deadline, retries and hedging to fetch the feeder with.
+        :param minimal_fetch: Only fetch the parts of the feeder that the mutators declare they need in their
+            `MutatorRequirements`. Defaults to fetching the whole feeder.
+        :return: A future that resolves to the `SyntheticFeederResult` for the feeder.
+        """
+        check_policy(policy, stream_lv_feeders)
+        return self.background_loop.submit(
+            create_isolated_synthetic_feeder(self, feeder_mrid, list(mutators), cache, stream_lv_feeders, policy, minimal_fetch=minimal_fetch)
+        )
+
+
+
+def _run_sync(client: SyncNetworkConsumerClient, coroutine: Awaitable[R]) -> R:
+    background_loop = getattr(client, "background_loop", None)
+    if background_loop is not None:
+        return background_loop.run(coroutine)
+    return get_event_loop().run_until_complete(coroutine)
+
+
+def _sync_passthrough(name: str, coroutine_function: Callable[..., Awaitable[Any]]):
+    def run(self: SyncNetworkConsumerClient, *args, **kwargs):
+        return _run_sync(self, coroutine_function(self, *args, **kwargs))
+
+    run.__name__ = name
+    run.__doc__ = getattr(SyncNetworkConsumerClient, name).__doc__
+    return run
+
+
+# Run the consumer's own synchronous calls on the background event loop too.
+for _name in ["get_identified_object", "get_identified_objects", "get_equipment_for_container", "get_equipment_for_containers",
+              "get_current_equipment_for_feeder", "get_equipment_for_restriction", "get_terminals_for_connectivity_node",
+              "get_network_hierarchy", "get_equipment_container", "retrieve_network"]:
+    setattr(BackgroundSyncNetworkConsumerClient, _name, _sync_passthrough(_name, getattr(NetworkConsumerClient, _name)))
+del _name
+
+BackgroundSyncNetworkConsumerClient.get_feeder = _sync_passthrough(
+    "get_feeder",
+    lambda self, mrid: NetworkConsumerClient.get_equipment_container(self, mrid, Feeder)
+)
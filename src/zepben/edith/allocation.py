@@ -0,0 +1,63 @@
+#  Copyright 2024 Zeppelin Bend Pty Ltd
+#
+#  This Source Code Form is subject to the terms of the Mozilla Public
+#  License, v. 2.0. If a copy of the MPL was not distributed with this
+#  file, You can obtain one at https://mozilla.org/MPL/2.0/.
+from typing import List, Sequence, Tuple
+
+import numpy as np
+from zepben.evolve import UsagePoint
+
+__all__ = ["allocate_customers"]
+
+
+def allocate_customers(
+        lv_feeder_usage_points: Sequence[Tuple[str, Sequence[UsagePoint]]],
+        proportion: float,
+        customers: Sequence[str],
+        allow_duplicate_customers: bool,
+        rng: np.random.Generator,
+        first_customer: int = 0
+) -> List[Tuple[UsagePoint, str]]:
+    """
+    Choose `proportion`% of the usage points of each LV feeder, rounded down, and the customer to give each of them.
+    Every LV feeder is sampled in one batch: each usage point is given a random key, and the usage points of an LV
+    feeder with the smallest keys are chosen.
+
+    The result only depends on the LV feeders and usage points, and the state of `rng`, not on the order they are
+    given in, as they are put in order of mRID before sampling.
+
+    :param lv_feeder_usage_points: The mRID of each LV feeder and the usage points to choose from in it.
+    :param proportion: The percentage of each LV feeder's usage points to choose.
+    :param customers: The customers to give the chosen usage points, in order.
+    :param allow_duplicate_customers: Start again from the first customer once every customer has been given out,
+        rather than leaving the remaining usage points without one.
+    :param rng: The random number generator to sample with.
+    :param first_customer: The index in `customers` of the first customer to give out. Defaults to the first customer.
+    :return: Each chosen usage point and its customer, with the LV feeders in order of mRID, and the usage points of
+        each LV feeder in the random order they were chosen in.
+    """
+    lv_feeder_usage_points = sorted(lv_feeder_usage_points, key=lambda lv_feeder: lv_feeder[0])
+    counts = np.fromiter((len(usage_points) for _, usage_points in lv_feeder_usage_points), dtype=np.int64, count=len(lv_feeder_usage_points))
+    usage_points = [usage_point for _, lv_feeder in lv_feeder_usage_points for usage_point in lv_feeder]
+    if not usage_points or not customers:
+        return []
+
+    segments = np.repeat(np.arange(len(counts)), counts)
+    starts = np.repeat(np.cumsum(counts) - counts, counts)
+    to_choose = (counts * proportion / 100).astype(np.int64)
+
+    # Usage points are put in order of mRID within each LV feeder before the random keys are drawn, so the keys don't
+    # depend on the order the network was fetched in. Sorting by key within each LV feeder then gives a random order.
+    canonical = np.lexsort((np.array([usage_point.mrid for usage_point in usage_points]), segments))
+    keys = rng.random(len(usage_points))
+    shuffled = canonical[np.lexsort((keys, segments))]
+    chosen = shuffled[np.arange(len(usage_points)) - starts < to_choose[segments]]
+
+    if allow_duplicate_customers:
+        assigned = (first_customer + np.arange(len(chosen))) % len(customers)
+    else:
+        chosen = chosen[:max(len(customers) - first_customer, 0)]
+        assigned = first_customer + np.arange(len(chosen))
+
+    return [(usage_points[i], customers[c]) for i, c in zip(chosen.tolist(), assigned.tolist())]
@@ -0,0 +1,95 @@
+#  Copyright 2024 Zeppelin Bend Pty Ltd
+#
+#  This Source Code Form is subject to the terms of the Mozilla Public
+#  License, v. 2.0. If a copy of the MPL was not distributed with this
+#  file, You can obtain one at https://mozilla.org/MPL/2.0/.
+from asyncio import AbstractEventLoop, new_event_loop, run_coroutine_threadsafe, set_event_loop
+from concurrent.futures import Future
+from threading import Lock, Thread, get_ident
+from typing import Any, Awaitable, Callable, Optional, TypeVar
+
+__all__ = ["BackgroundEventLoop", "default_background_loop"]
+
+T = TypeVar("T")
+
+
+class BackgroundEventLoop(object):
+    """
+    An asyncio event loop that runs forever in a daemon thread, so that synchronous code can run coroutines on it
+    without blocking on, or needing, an event loop of its own. gRPC channels are bound to the event loop they are
+    created on, so any channel used by coroutines run on this loop must be created with `call`.
+    """
+
+    def __init__(self, name: str = "edith-event-loop"):
+        """
+        :param name: The name of the thread that runs the event loop.
+        """
+        self.loop: AbstractEventLoop = new_event_loop()
+        self._thread = Thread(target=self._run, name=name, daemon=True)
+        self._thread.start()
+
+    def submit(self, coroutine: Awaitable[T]) -> Future[T]:
+        """
+        Schedule a coroutine on the event loop without waiting for it.
+
+        :param coroutine: The coroutine to run.
+        :return: A future that resolves to the result of the coroutine.
+        """
+        return run_coroutine_threadsafe(coroutine, self.loop)
+
+    def run(self, coroutine: Awaitable[T]) -> T:
+        """
+        Run a coroutine on the event loop and wait for its result.
+
+        :param coroutine: The coroutine to run.
+        :return: The result of the coroutine.
+        """
+        if get_ident() == self._thread.ident:
+            coroutine.close()
+            raise RuntimeError("Can not wait for a coroutine from the event loop it is running on")
+        return self.submit(coroutine).result()
+
+    def call(self, function: Callable[..., T], *args: Any, **kwargs: Any) -> T:
+        """
+        Call a function from within the event loop, e.g. to create a gRPC channel that is bound to it.
+
+        :param function: The function to call.
+        :return: The result of the function.
+        """
+        async def call():
+            return function(*args, **kwargs)
+
+        return self.run(call())
+
+    @property
+    def is_running(self) -> bool:
+        return self._thread.is_alive()
+
+    def close(self):
+        """
+        Stop the event loop and wait for its thread to finish. Coroutines still running on the loop are abandoned.
+        """
+        if self.is_running:
+            self.loop.call_soon_threadsafe(self.loop.stop)
+            self._thread.join()
+        self.loop.close()
+
+    def _run(self):
+        set_event_loop(self.loop)
+        self.loop.run_forever()
+
+
+_default_background_loop: Optional[BackgroundEventLoop] = None
+_default_background_loop_lock = Lock()
+
+
+def default_background_loop() -> BackgroundEventLoop:
+    """
+    :return: The background event loop shared by every `SyncNetworkConsumerClient` that was not given its own. It is
+        started on first use.
+    """
+    global _default_background_loop
+    with _default_background_loop_lock:
+        if _default_background_loop is None or not _default_background_loop.is_running:
+            _default_background_loop = BackgroundEventLoop()
+        return _default_background_loop
@@ -0,0 +1,527 @@
+#  Copyright 2024 Zeppelin Bend Pty Ltd
+#
+#  This Source Code Form is subject to the terms of the Mozilla Public
+#  License, v. 2.0. If a copy of the MPL was not distributed with this
+#  file, You can obtain one at https://mozilla.org/MPL/2.0/.
+import csv
+from bisect import bisect_left, bisect_right
+from os import PathLike
+from threading import Lock
+from typing import Dict, Hashable, Iterable, Iterator, List, Optional, Sequence, Tuple, Union
+
+import numpy as np
+
+from zepben.edith import linecode_catalogue, transformer_catalogue
+from zepben.edith.linecode_catalogue import LC
+from zepben.edith.transformer_catalogue import XfmrCode
+
+__all__ = ["LinecodeColumns", "TransformerColumns", "LINECODE_COLUMNS", "TRANSFORMER_COLUMNS"]
+
+_Ladder = Tuple[np.ndarray, np.ndarray]
+_Path = Union[str, PathLike]
+
+# Guards the first build of a catalogue's ladders, which may happen on several mutator threads at once. It is shared by
+# every catalogue, rather than held by each, so that catalogues can still be pickled.
+_LADDERS_LOCK = Lock()
+
+
+class LinecodeColumns(object):
+    """
+    A linecode catalogue in columnar form, with one NumPy array per `LC` field. Row `i` of every column describes the
+    `i`th linecode of the catalogue.
+
+    Catalogues can be built from `LC` records, read from a CSV file, or memory-mapped from a binary file written by
+    `save_binary`, and can be passed to `line_weakener` in place of the built-in catalogue. Memory-mapped catalogues are
+    only read as they are queried, and their pages are shared between processes that map the same file.
+    """
+
+    def __init__(
+        self,
+        names: np.ndarray,
+        phases: np.ndarray,
+        norm_amps: np.ndarray,
+        emerg_amps: np.ndarray,
+        r0: np.ndarray,
+        r1: np.ndarray,
+        x0: np.ndarray,
+        x1: np.ndarray,
+        hv: np.ndarray,
+        records: Optional[Sequence[LC]] = None
+    ):
+        self.names = names
+        self.phases = phases
+        self.norm_amps = norm_amps
+        self.emerg_amps = emerg_amps
+        self.r0 = r0
+        self.r1 = r1
+        self.x0 = x0
+        self.x1 = x1
+        self.hv = hv
+        self._records = records
+        self._ladders: Optional[Dict[Hashable, _Ladder]] = None
+
+    @classmethod
+    def from_records(cls, linecodes: Iterable[LC]) -> "LinecodeColumns":
+        """
+        Build a columnar catalogue from `LC` records, such as `LINECODE_CATALOGUE`.
+        """
+        linecodes = tuple(linecodes)
+        return cls(
+            names=np.array([lc.name for lc in linecodes], dtype=str),
+            phases=np.array([lc.phases for lc in linecodes], dtype=np.int64),
+            norm_amps=np.array([lc.norm_amps for lc in linecodes], dtype=np.float64),
+            emerg_amps=np.array([lc.emerg_amps for lc in linecodes], dtype=np.float64),
+            r0=np.array([lc.r0 for lc in linecodes], dtype=np.float64),
+            r1=np.array([lc.r1 for lc in linecodes], dtype=np.float64),
+            x0=np.array([lc.x0 for lc in linecodes], dtype=np.float64),
+            x1=np.array([lc.x1 for lc in linecodes], dtype=np.float64),
+            hv=np.array([lc.hv for lc in linecodes], dtype=bool),
+            records=linecodes
+        )
+
+    @classmethod
+    def from_csv(cls, path: _Path) -> "LinecodeColumns":
+        """
+        Read a catalogue from a CSV file with a header row naming the `LC` fields: name, phases, norm_amps, emerg_amps,
+        r0, r1, x0, x1 and hv. The hv column holds `true` or `false`, and is optional.
+        """
+        with open(path, newline="") as f:
+            return cls.from_records(
+                LC(
+                    row["name"],
+                    phases=int(row["phases"]),
+                    norm_amps=float(row["norm_amps"]),
+                    emerg_amps=float(row["emerg_amps"]),
+                    r0=float(row["r0"]),
+                    r1=float(row["r1"]),
+                    x0=float(row["x0"]),
+                    x1=float(row["x1"]),
+                    hv=_parse_bool(row.get("hv") or "false")
+                )
+                for row in csv.DictReader(f)
+            )
+
+    @classmethod
+    def from_binary(cls, path: _Path) -> "LinecodeColumns":
+        """
+        Memory-map a catalogue from a binary file written by `save_binary`.
+        """
+        table = _load_table(path, ("name", "phases", "norm_amps", "emerg_amps", "r0", "r1", "x0", "x1", "hv"))
+        return cls(**{("names" if field == "name" else field): table[field] for field in table.dtype.names})
+
+    def save_binary(self, path: _Path):
+        """
+        Write the catalogue to a binary file (a NumPy `.npy` file holding a structured array) that can be memory-mapped
+        with `from_binary`.
+        """
+        _save_table(path, [
+            ("name", self.names, ()),
+            ("phases", self.phases, ()),
+            ("norm_amps", self.norm_amps, ()),
+            ("emerg_amps", self.emerg_amps, ()),
+            ("r0", self.r0, ()),
+            ("r1", self.r1, ()),
+            ("x0", self.x0, ()),
+            ("x1", self.x1, ()),
+            ("hv", self.hv, ()),
+        ])
+
+    def __len__(self):
+        return len(self.names)
+
+    def __iter__(self) -> Iterator[LC]:
+        return (self[row] for row in range(len(self)))
+
+    def __getitem__(self, row: int) -> LC:
+        if self._records is not None:
+            return self._records[row]
+        return LC(
+            str(self.names[row]),
+            phases=int(self.phases[row]),
+            norm_amps=float(self.norm_amps[row]),
+            emerg_amps=float(self.emerg_amps[row]),
+            r0=float(self.r0[row]),
+            r1=float(self.r1[row]),
+            x0=float(self.x0[row]),
+            x1=float(self.x1[row]),
+            hv=bool(self.hv[row])
+        )
+
+    def select(
+        self,
+        max_amps: Sequence[float],
+        phases: Sequence[int],
+        hv: Sequence[bool],
+        use_weakest_when_necessary: bool = True
+    ) -> np.ndarray:
+        """
+        Select a linecode for each of a batch of lines. For each line, the linecode with the highest normal amp rating
+        that does not exceed its `max_amps` is chosen from those matching its phase count and voltage category.
+
+        :param max_amps: The highest acceptable normal amp rating for each line.
+        :param phases: The number of phases, excluding neutral, of each line.
+        :param hv: Whether each line is HV (`True`) or LV (`False`).
+        :param use_weakest_when_necessary: Whether to fall back to the linecode with the lowest normal amp rating if
+                                           every candidate for a line exceeds its `max_amps`. Defaults to `True`.
+
+        :return: An array holding the catalogue row of the linecode selected for each line, or -1 where no linecode is
+                 suitable.
+        """
+        if self._ladders is None:
+            self._ladders = _build_ladders(zip(self.hv.tolist(), self.phases.tolist()), self.norm_amps)
+
+        max_amps = np.asarray(max_amps, dtype=np.float64)
+        keys = np.column_stack((np.asarray(hv, dtype=np.int64), np.asarray(phases, dtype=np.int64)))
+
+        return _select_from_ladders(
+            self._ladders,
+            keys,
+            lambda key: (bool(key[0]), int(key[1])),
+            max_amps,
+            use_weakest_when_necessary
+        )
+
+
+class TransformerColumns(object):
+    """
+    A transformer model catalogue in columnar form, with one NumPy array per `XfmrCode` field. Row `i` of every column
+    describes the `i`th model of the catalogue. Per-winding fields (`kvas`, `kvs` and `conns`) are two dimensional, with
+    one column per winding, and are padded with zeros (or empty strings) for models with fewer windings than the widest
+    model.
+
+    Catalogues can be built from `XfmrCode` records, read from a CSV file, or memory-mapped from a binary file written
+    by `save_binary`, and can be passed to `transformer_weakener` in place of the built-in catalogue. Memory-mapped
+    catalogues are only read as they are queried, and their pages are shared between processes that map the same file.
+    """
+
+    def __init__(
+        self,
+        names: np.ndarray,
+        phases: np.ndarray,
+        windings: np.ndarray,
+        kvas: np.ndarray,
+        kvs: np.ndarray,
+        xhl: np.ndarray,
+        load_loss: np.ndarray,
+        conns: np.ndarray,
+        tap: np.ndarray,
+        records: Optional[Sequence[XfmrCode]] = None
+    ):
+        self.names = names
+        self.phases = phases
+        self.windings = windings
+        self.kvas = kvas
+        self.kvs = kvs
+        self.xhl = xhl
+        self.load_loss = load_loss
+        self.conns = conns
+        self.tap = tap
+        self._records = records
+        self._voltage_ladders: Optional[Dict[Hashable, _Ladder]] = None
+        self._phase_ladders: Optional[Dict[Hashable, _Ladder]] = None
+        self._voltage_ranges: Optional[Dict[Tuple[int, int], Tuple[List[float], List[Tuple[float, ...]]]]] = None
+
+    @classmethod
+    def from_records(cls, xfmrs: Iterable[XfmrCode]) -> "TransformerColumns":
+        """
+        Build a columnar catalogue from `XfmrCode` records, such as `TRANSFORMER_CATALOGUE`.
+        """
+        xfmrs = tuple(xfmrs)
+        width = max((x.windings for x in xfmrs), default=0)
+        return cls(
+            names=np.array([x.name for x in xfmrs], dtype=str),
+            phases=np.array([x.phases for x in xfmrs], dtype=np.int64),
+            windings=np.array([x.windings for x in xfmrs], dtype=np.int64),
+            kvas=_padded([x.kvas for x in xfmrs], width, np.float64, 0),
+            kvs=_padded([x.kvs for x in xfmrs], width, np.float64, 0),
+            xhl=np.array([x.xhl for x in xfmrs], dtype=np.float64),
+            load_loss=np.array([x.load_loss for x in xfmrs], dtype=np.float64),
+            conns=_padded([x.conns for x in xfmrs], width, str, ""),
+            tap=np.array([x.tap for x in xfmrs], dtype=np.float64),
+            records=xfmrs
+        )
+
+    @classmethod
+    def from_csv(cls, path: _Path) -> "TransformerColumns":
+        """
+        Read a catalogue from a CSV file with a header row naming the `XfmrCode` fields: name, phases, windings, kvas,
+        kvs, xhl, load_loss, conns and tap. The per-winding kvas, kvs and conns columns hold one value per winding,
+        separated by semicolons (e.g. `11;0.433`).
+        """
+        with open(path, newline="") as f:
+            return cls.from_records(
+                XfmrCode(
+                    name=row["name"],
+                    phases=int(row["phases"]),
+                    windings=int(row["windings"]),
+                    kvas=tuple(float(kva) for kva in row["kvas"].split(";")),
+                    kvs=tuple(float(kv) for kv in row["kvs"].split(";")),
+                    xhl=float(row["xhl"]),
+                    load_loss=float(row["load_loss"]),
+                    conns=tuple(row["conns"].split(";")),
+                    tap=float(row["tap"])
+                )
+                for row in csv.DictReader(f)
+            )
+
+    @classmethod
+    def from_binary(cls, path: _Path) -> "TransformerColumns":
+        """
+        Memory-map a catalogue from a binary file written by `save_binary`.
+        """
+        table = _load_table(path, ("name", "phases", "windings", "kvas", "kvs", "xhl", "load_loss", "conns", "tap"))
+        return cls(**{("names" if field == "name" else field): table[field] for field in table.dtype.names})
+
+    def save_binary(self, path: _Path):
+        """
+        Write the catalogue to a binary file (a NumPy `.npy` file holding a structured array) that can be memory-mapped
+        with `from_binary`.
+        """
+        width = self.kvas.shape[1]
+        _save_table(path, [
+            ("name", self.names, ()),
+            ("phases", self.phases, ()),
+            ("windings", self.windings, ()),
+            ("kvas", self.kvas, (width,)),
+            ("kvs", self.kvs, (width,)),
+            ("xhl", self.xhl, ()),
+            ("load_loss", self.load_loss, ()),
+            ("conns", self.conns, (width,)),
+            ("tap", self.tap, ()),
+        ])
+
+    def __len__(self):
+        return len(self.names)
+
+    def __iter__(self) -> Iterator[XfmrCode]:
+        return (self[row] for row in range(len(self)))
+
+    def __getitem__(self, row: int) -> XfmrCode:
+        if self._records is not None:
+            return self._records[row]
+        windings = int(self.windings[row])
+        return XfmrCode(
+            name=str(self.names[row]),
+            phases=int(self.phases[row]),
+            windings=windings,
+            kvas=tuple(float(kva) for kva in self.kvas[row, :windings]),
+            kvs=tuple(float(kv) for kv in self.kvs[row, :windings]),
+            xhl=float(self.xhl[row]),
+            load_loss=float(self.load_loss[row]),
+            conns=tuple(str(conn) for conn in self.conns[row, :windings]),
+            tap=float(self.tap[row])
+        )
+
+    def select(
+        self,
+        max_va: Sequence[float],
+        windings: Sequence[int],
+        phases: Sequence[int],
+        kvs: Optional[Sequence[Sequence[float]]] = None,
+        use_weakest_when_necessary: bool = True
+    ) -> np.ndarray:
+        """
+        Select a transformer model for each of a batch of transformers. For each transformer, the model with the highest
+        VA rating that does not exceed its `max_va` is chosen from those matching its windings, phase count and, if
+        `kvs` is given, winding voltages.
+
+        :param max_va: The highest acceptable VA rating for each transformer.
+        :param windings: The number of windings of each transformer.
+        :param phases: The number of phases, excluding neutral, of each transformer.
+        :param kvs: The rated voltage in kV of each winding of each transformer, as a two dimensional array with one row
+                    per transformer. Rows for transformers with fewer windings than others should be padded with zeros.
+                    Voltages are not matched if this is `None`. Defaults to `None`.
+        :param use_weakest_when_necessary: Whether to fall back to the model with the lowest VA rating if every
+                                           candidate for a transformer exceeds its `max_va`. Defaults to `True`.
+
+        :return: An array holding the catalogue row of the model selected for each transformer, or -1 where no model is
+                 suitable.
+        """
+        self._ensure_ladders()
+
+        max_va = np.asarray(max_va, dtype=np.float64)
+        windings = np.asarray(windings, dtype=np.int64)
+        phases = np.asarray(phases, dtype=np.int64)
+
+        if kvs is None or len(max_va) == 0:
+            return _select_from_ladders(
+                self._phase_ladders,
+                np.column_stack((windings, phases)),
+                lambda key: (int(key[0]), int(key[1])),
+                max_va,
+                use_weakest_when_necessary
+            )
+
+        kvs = np.asarray(kvs, dtype=np.float64).reshape(len(max_va), -1)
+        return _select_from_ladders(
+            self._voltage_ladders,
+            np.column_stack((windings, phases, kvs)),
+            lambda key: (int(key[0]), int(key[1]), tuple(key[2:2 + int(key[0])])),
+            max_va,
+            use_weakest_when_necessary
+        )
+
+    def find_voltages(
+        self,
+        windings: int,
+        phases: int,
+        kvs: Sequence[float],
+        tolerance: float = 0.0
+    ) -> Optional[Tuple[Tuple[float, ...], bool]]:
+        """
+        Find the winding voltages of the catalogue models that best match the winding voltages of a transformer. Models
+        with exactly the same voltages are preferred. Otherwise, the closest voltages for which every winding is within
+        `tolerance` of the transformer's are used, where closeness is the largest relative difference of any winding.
+        Candidates are found with a binary search on the voltage of the first winding.
+
+        :param windings: The number of windings of the transformer.
+        :param phases: The number of phases, excluding neutral, of the transformer.
+        :param kvs: The rated voltage in kV of each winding of the transformer.
+        :param tolerance: The largest acceptable difference between a catalogue voltage and a winding voltage, as a
+                          fraction of the winding voltage (e.g. 0.05 for 5%). Defaults to 0, which only matches exact
+                          voltages.
+
+        :return: The matched catalogue voltages and whether they matched exactly, or `None` if no voltages match.
+        """
+        self._ensure_ladders()
+
+        kvs = tuple(kvs)
+        if (windings, phases, kvs) in self._voltage_ladders:
+            return kvs, True
+        if tolerance <= 0 or len(kvs) != windings or any(kv <= 0 for kv in kvs):
+            return None
+
+        primaries, candidates = self._voltage_ranges.get((windings, phases), ((), ()))
+        lo = bisect_left(primaries, kvs[0] * (1 - tolerance))
+        hi = bisect_right(primaries, kvs[0] * (1 + tolerance))
+
+        best, best_difference = None, None
+        for candidate in candidates[lo:hi]:
+            difference = max(abs(c - kv) / kv for c, kv in zip(candidate, kvs))
+            if difference <= tolerance and (best is None or difference < best_difference):
+                best, best_difference = candidate, difference
+
+        return (best, False) if best is not None else None
+
+    def _ensure_ladders(self):
+        # `_phase_ladders` is published last, so once it is set the other structures are complete.
+        if self._phase_ladders is not None:
+            return
+        with _LADDERS_LOCK:
+            if self._phase_ladders is None:
+                self._build_ladders()
+
+    def _build_ladders(self):
+        windings = self.windings.tolist()
+        phases = self.phases.tolist()
+        kvs = [tuple(row[:w]) for row, w in zip(self.kvs.tolist(), windings)]
+        max_vas = self.kvas.max(axis=1, initial=0) * 1000
+
+        voltage_ladders = _build_ladders(zip(windings, phases, kvs), max_vas)
+        phase_ladders = _build_ladders(zip(windings, phases), max_vas)
+
+        # The distinct voltages of each windings and phase count group, sorted by the voltage of the first winding.
+        voltage_ranges = {}
+        for w, p, group_kvs in sorted(voltage_ladders, key=lambda group: group[2][:1]):
+            primaries, candidates = voltage_ranges.setdefault((w, p), ([], []))
+            primaries.append(group_kvs[0] if group_kvs else 0)
+            candidates.append(group_kvs)
+
+        self._voltage_ladders = voltage_ladders
+        self._voltage_ranges = voltage_ranges
+        self._phase_ladders = phase_ladders
+
+
+def _parse_bool(value: str) -> bool:
+    value = value.strip().lower()
+    if value in ("true", "1", "yes"):
+        return True
+    if value in ("false", "0", "no", ""):
+        return False
+    raise ValueError(f"Expected true or false, got {value!r}")
+
+
+def _save_table(path: _Path, columns: List[Tuple[str, np.ndarray, Tuple[int, ...]]]):
+    dtype = np.dtype([(field, column.dtype, shape) for field, column, shape in columns])
+    table = np.empty(len(columns[0][1]), dtype=dtype)
+    for field, column, _ in columns:
+        table[field] = column
+    np.save(path, table, allow_pickle=False)
+
+
+def _load_table(path: _Path, fields: Tuple[str, ...]) -> np.ndarray:
+    table = np.load(path, mmap_mode="r", allow_pickle=False)
+    if table.dtype.names != fields:
+        raise ValueError(f"{path} is not a catalogue file: expected fields {fields}, got {table.dtype.names}")
+    return table
+
+
+def _padded(rows: List[Sequence], width: int, dtype, fill) -> np.ndarray:
+    return np.array([list(row) + [fill] * (width - len(row)) for row in rows], dtype=dtype).reshape(len(rows), width)
+
+
+def _build_ladders(groups: Iterable[Hashable], ratings: np.ndarray) -> Dict[Hashable, _Ladder]:
+    rows_by_group: Dict[Hashable, Dict[float, int]] = {}
+    for row, group in enumerate(groups):
+        # Where several entries in a group share a rating, the first one in the catalogue is used.
+        rows_by_group.setdefault(group, {}).setdefault(float(ratings[row]), row)
+
+    ladders = {}
+    for group, rows_by_rating in rows_by_group.items():
+        group_ratings = sorted(rows_by_rating)
+        ladders[group] = (
+            np.array(group_ratings, dtype=np.float64),
+            np.array([rows_by_rating[r] for r in group_ratings], dtype=np.intp)
+        )
+    return ladders
+
+
+def _select_from_ladders(
+    ladders: Dict[Hashable, _Ladder],
+    keys: np.ndarray,
+    to_group,
+    max_ratings: np.ndarray,
+    use_weakest_when_necessary: bool
+) -> np.ndarray:
+    selected = np.full(len(max_ratings), -1, dtype=np.intp)
+    if len(max_ratings) == 0:
+        return selected
+
+    # Only the distinct group keys are resolved in Python, each covering a contiguous run of the sorted queries.
+    unique_keys, inverse = np.unique(keys, axis=0, return_inverse=True)
+    inverse = inverse.reshape(-1)
+    order = np.argsort(inverse, kind="stable")
+    bounds = np.searchsorted(inverse[order], np.arange(len(unique_keys) + 1))
+
+    for k, key in enumerate(unique_keys):
+        ladder = ladders.get(to_group(key))
+        if ladder is None:
+            continue
+
+        ratings, rows = ladder
+        queries = order[bounds[k]:bounds[k + 1]]
+        i = np.searchsorted(ratings, max_ratings[queries], side="right")
+        if use_weakest_when_necessary:
+            selected[queries] = rows[np.maximum(i, 1) - 1]
+        else:
+            selected[queries] = np.where(i > 0, rows[np.maximum(i, 1) - 1], -1)
+
+    return selected
+
+
+# Only annotated here, as the columns are bound by `__getattr__` the first time they are used.
+LINECODE_COLUMNS: LinecodeColumns
+TRANSFORMER_COLUMNS: TransformerColumns
+
+
+def __getattr__(name: str):
+    # The columns are only built the first time they are used, then cached as module attributes.
+    if name == "LINECODE_COLUMNS":
+        value = LinecodeColumns.from_records(linecode_catalogue.LINECODE_CATALOGUE)
+    elif name == "TRANSFORMER_COLUMNS":
+        value = TransformerColumns.from_records(transformer_catalogue.TRANSFORMER_CATALOGUE)
+    else:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+    globals()[name] = value
+    return value
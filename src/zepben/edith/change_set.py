@@ -0,0 +1,139 @@
+#  Copyright 2024 Zeppelin Bend Pty Ltd
+#
+#  This Source Code Form is subject to the terms of the Mozilla Public
+#  License, v. 2.0. If a copy of the MPL was not distributed with this
+#  file, You can obtain one at https://mozilla.org/MPL/2.0/.
+import csv
+from threading import Lock
+from typing import Any, Iterator, List, Optional, TextIO, Union
+
+from dataclassy import dataclass
+from zepben.evolve import IdentifiedObject, Name, NameType, NetworkService, TransformerEndRatedS
+
+from zepben.edith.mutation_journal import MutationRecorder
+from zepben.edith.mutator_engine import ALL_FIELDS
+
+__all__ = ["Change", "ChangeSetBuffer", "ChangeSetFileSink"]
+
+COLUMNS = ("mrid", "field", "old_value", "new_value", "entry")
+
+
+@dataclass
+class Change(object):
+    """
+    A change made by a mutator to a feeder network. Values are described as text: objects by their mRID, names by their
+    name, and transformer end ratings as `cooling_type:rated_s` pairs separated by semicolons.
+
+    :param mrid: The mRID of the object changed, or added to the network, or the name of an added name type.
+    :param field: The field that was changed, or `ALL_FIELDS` for objects added to the network.
+    :param old_value: The value of the field before the change.
+    :param new_value: The value of the field after the change, or the type of an object added to the network.
+    :param entry: The name of the catalogue entry the new value was taken from, if any.
+    """
+    mrid: str
+    field: str
+    old_value: Optional[str]
+    new_value: Optional[str]
+    entry: Optional[str] = None
+
+
+class ChangeSetBuffer(MutationRecorder):
+    """
+    A `MutationRecorder` that keeps the changes made to a feeder network in memory, one list per column, so what a
+    mutator changed can be read without comparing the network to a copy of it.
+    """
+
+    def __init__(self):
+        self.mrids: List[str] = []
+        self.fields: List[str] = []
+        self.old_values: List[Optional[str]] = []
+        self.new_values: List[Optional[str]] = []
+        self.entries: List[Optional[str]] = []
+        self._lock = Lock()
+
+    def __len__(self) -> int:
+        return len(self.mrids)
+
+    def __iter__(self) -> Iterator[Change]:
+        for row in zip(self.mrids, self.fields, self.old_values, self.new_values, self.entries):
+            yield Change(*row)
+
+    def record(self, _feeder_network: NetworkService, io: Any, field: str, old: Any, new: Any, entry: Optional[str] = None):
+        change = _describe_change(io, field, old, new, entry)
+        # Mutators applied on several threads may record at once, and every column must get the same number of rows.
+        with self._lock:
+            self.mrids.append(change.mrid)
+            self.fields.append(change.field)
+            self.old_values.append(change.old_value)
+            self.new_values.append(change.new_value)
+            self.entries.append(change.entry)
+
+    def clear(self):
+        """
+        Remove every recorded change.
+        """
+        with self._lock:
+            for column in (self.mrids, self.fields, self.old_values, self.new_values, self.entries):
+                column.clear()
+
+
+class ChangeSetFileSink(MutationRecorder):
+    """
+    A `MutationRecorder` that writes each change made to a feeder network to a CSV file as it is made, with a header row
+    of `mrid,field,old_value,new_value,entry`. Missing values are written as empty fields.
+    """
+
+    def __init__(self, file: Union[str, TextIO]):
+        """
+        :param file: The path of the file to write, which is replaced if it exists, or an open text file to write to.
+        """
+        if isinstance(file, str):
+            self._file = open(file, "w", newline="")
+            self._owns_file = True
+        else:
+            self._file = file
+            self._owns_file = False
+        self._writer = csv.writer(self._file)
+        self._writer.writerow(COLUMNS)
+        self._lock = Lock()
+
+    def __enter__(self) -> "ChangeSetFileSink":
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.close()
+
+    def record(self, _feeder_network: NetworkService, io: Any, field: str, old: Any, new: Any, entry: Optional[str] = None):
+        change = _describe_change(io, field, old, new, entry)
+        with self._lock:
+            self._writer.writerow((change.mrid, change.field, change.old_value, change.new_value, change.entry))
+
+    def close(self):
+        """
+        Flush the changes written so far, and close the file if it was opened by the sink.
+        """
+        with self._lock:
+            if self._owns_file:
+                self._file.close()
+            else:
+                self._file.flush()
+
+
+def _describe_change(io: Any, field: str, old: Any, new: Any, entry: Optional[str]) -> Change:
+    if field == ALL_FIELDS:
+        return Change(_describe(io), field, None, type(io).__name__, entry)
+    return Change(_describe(io), field, _describe(old), _describe(new), entry)
+
+
+def _describe(value: Any) -> Optional[str]:
+    if value is None:
+        return None
+    if isinstance(value, IdentifiedObject):
+        return value.mrid
+    if isinstance(value, (Name, NameType)):
+        return value.name
+    if isinstance(value, TransformerEndRatedS):
+        return f"{value.cooling_type.name}:{value.rated_s}"
+    if isinstance(value, tuple):
+        return ";".join(_describe(v) for v in value)
+    return str(value)
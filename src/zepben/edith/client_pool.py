@@ -0,0 +1,188 @@
+#  Copyright 2024 Zeppelin Bend Pty Ltd
+#
+#  This Source Code Form is subject to the terms of the Mozilla Public
+#  License, v. 2.0. If a copy of the MPL was not distributed with this
+#  file, You can obtain one at https://mozilla.org/MPL/2.0/.
+from asyncio import Semaphore, gather
+from typing import Any, Callable, Iterable, List, Optional
+
+from zepben.evolve import NetworkConsumerClient, NetworkService
+
+from zepben.edith import SyntheticFeederResult, create_isolated_synthetic_feeder
+from zepben.edith.clients import SharedHierarchyStub, check_policy, isolated_client, shared_hierarchy_stub
+from zepben.edith.feeder_cache import FeederCache
+from zepben.edith.fetch_policy import FetchPolicy
+
+__all__ = ["NetworkConsumerClientPool"]
+
+
+class NetworkConsumerClientPool(object):
+    """
+    A pool of network consumer clients, each with its own gRPC channel, that spreads feeder fetches across the channels
+    so that concurrent fetches do not contend for a single connection. Each feeder is fetched through the channel with
+    the fewest feeders in flight, or if several are tied, the one that has fetched the fewest feeders. Hedged fetches
+    are sent through a different channel to the fetch they hedge, chosen in the same way.
+    """
+
+    def __init__(self, channels: Iterable[Any], error_handlers: List[Callable[[Exception], bool]] = None, timeout: int = 60):
+        """
+        :param channels: The gRPC channels to fetch feeders through, e.g. several calls to `connect_with_password`.
+        :param error_handlers: A collection of handlers to be processed for any errors that occur.
+        :param timeout: The timeout for gRPC requests, in seconds.
+        """
+        self.clients = [NetworkConsumerClient(channel=channel, error_handlers=error_handlers, timeout=timeout) for channel in channels]
+        if not self.clients:
+            raise ValueError("A client pool needs at least one channel")
+        self._in_flight = [0] * len(self.clients)
+        self._dispatched = [0] * len(self.clients)
+
+    @classmethod
+    def from_factory(cls, channel_factory: Callable[[], Any], size: int, **kwargs) -> "NetworkConsumerClientPool":
+        """
+        Create a pool of `size` channels.
+
+        :param channel_factory: A function that creates a new gRPC channel each time it is called.
+        :param size: The number of channels in the pool.
+        :param kwargs: Any other arguments of `NetworkConsumerClientPool`.
+        """
+        return cls([channel_factory() for _ in range(size)], **kwargs)
+
+    @property
+    def in_flight(self) -> List[int]:
+        """
+        :return: The number of feeders currently being created through each channel, in the order the channels were
+            given.
+        """
+        return list(self._in_flight)
+
+    @property
+    def dispatched(self) -> List[int]:
+        """
+        :return: The total number of feeders that have been created through each channel, in the order the channels were
+            given.
+        """
+        return list(self._dispatched)
+
+    async def create_synthetic_feeder(
+            self,
+            feeder_mrid: str,
+            mutators: Iterable[Callable[[NetworkService], None]] = (),
+            cache: Optional[FeederCache] = None,
+            stream_lv_feeders: bool = False,
+            policy: Optional[FetchPolicy] = None,
+            minimal_fetch: bool = False
+    ) -> SyntheticFeederResult:
+        """
+        Creates a synthetic version of a feeder through the least loaded channel, fetching it into its own
+        `NetworkService`.
+
+        :param feeder_mrid: The mRID of the feeder to create a synthetic version of.
+        :param mutators: The mutator functions to apply to the feeder network. Defaults to no mutator functions.
+        :param cache: A cache of fetched feeder networks to load the feeder from instead of the server, if it holds a
+            valid copy of it.
+        :param stream_lv_feeders: Apply the leading `LvFeederMutator`s in `mutators` to each LV feeder as soon as it has
+            been fetched. Can not be used with a `cache` or `policy`.
+        :param policy: The deadline, retries and hedging to fetch the feeder with.
+        :param minimal_fetch: Only fetch the parts of the feeder that the mutators declare they need in their
+            `MutatorRequirements`. Defaults to fetching the whole feeder.
+        :return: The `SyntheticFeederResult` for the feeder.
+        """
+        check_policy(policy, stream_lv_feeders)
+        return await self._create_synthetic_feeder(
+            feeder_mrid,
+            mutators,
+            cache,
+            stream_lv_feeders,
+            policy,
+            minimal_fetch,
+            self._shared_hierarchy_stubs()
+        )
+
+    async def _create_synthetic_feeder(
+            self,
+            feeder_mrid: str,
+            mutators: Iterable[Callable[[NetworkService], None]],
+            cache: Optional[FeederCache],
+            stream_lv_feeders: bool,
+            policy: Optional[FetchPolicy],
+            minimal_fetch: bool,
+            stubs: List[SharedHierarchyStub]
+    ) -> SyntheticFeederResult:
+        index = self._least_loaded()
+        self._in_flight[index] += 1
+        self._dispatched[index] += 1
+        hedge_indexes = {}
+
+        def create_hedge_client() -> NetworkConsumerClient:
+            hedge_index = self._least_loaded(exclude=index)
+            self._in_flight[hedge_index] += 1
+            self._dispatched[hedge_index] += 1
+            hedge_client = isolated_client(self.clients[hedge_index], stubs[hedge_index])
+            hedge_indexes[id(hedge_client)] = hedge_index
+            return hedge_client
+
+        def release_hedge_client(hedge_client: NetworkConsumerClient):
+            self._in_flight[hedge_indexes.pop(id(hedge_client))] -= 1
+
+        try:
+            return await create_isolated_synthetic_feeder(
+                self.clients[index],
+                feeder_mrid,
+                mutators,
+                cache,
+                stream_lv_feeders,
+                policy,
+                create_hedge_client,
+                stubs[index],
+                minimal_fetch,
+                release_hedge_client
+            )
+        finally:
+            self._in_flight[index] -= 1
+
+    async def create_synthetic_feeders(
+            self,
+            feeder_mrids: Iterable[str],
+            mutators: Iterable[Callable[[NetworkService], None]] = (),
+            max_concurrency: Optional[int] = None,
+            cache: Optional[FeederCache] = None,
+            stream_lv_feeders: bool = False,
+            policy: Optional[FetchPolicy] = None,
+            minimal_fetch: bool = False
+    ) -> List[SyntheticFeederResult]:
+        """
+        Creates a synthetic version of each of the given feeders, spreading them across the pool's channels.
+
+        :param feeder_mrids: The mRIDs of the feeders to create synthetic versions of.
+        :param mutators: The mutator functions to apply to each feeder network. Defaults to no mutator functions.
+        :param max_concurrency: The maximum number of feeders to fetch at once. Defaults to 8 per channel.
+        :param cache: A cache of fetched feeder networks to load feeders from instead of the server, if it holds a valid
+            copy of them.
+        :param stream_lv_feeders: Apply the leading `LvFeederMutator`s in `mutators` to each LV feeder as soon as it has
+            been fetched. Can not be used with a `cache` or `policy`.
+        :param policy: The deadline, retries and hedging to fetch each feeder with.
+        :param minimal_fetch: Only fetch the parts of each feeder that the mutators declare they need.
+        :return: A `SyntheticFeederResult` for each feeder, in the same order as `feeder_mrids`.
+        """
+        max_concurrency = max_concurrency if max_concurrency is not None else 8 * len(self.clients)
+        if max_concurrency < 1:
+            raise ValueError("max_concurrency must be at least 1")
+        check_policy(policy, stream_lv_feeders)
+
+        mutators = list(mutators)
+        semaphore = Semaphore(max_concurrency)
+        # The network hierarchy is requested at most once per channel for the whole batch.
+        stubs = self._shared_hierarchy_stubs()
+
+        async def create(feeder_mrid: str) -> SyntheticFeederResult:
+            async with semaphore:
+                return await self._create_synthetic_feeder(feeder_mrid, mutators, cache, stream_lv_feeders, policy, minimal_fetch, stubs)
+
+        return list(await gather(*(create(feeder_mrid) for feeder_mrid in feeder_mrids)))
+
+    def _shared_hierarchy_stubs(self) -> List[SharedHierarchyStub]:
+        return [shared_hierarchy_stub(client) for client in self.clients]
+
+    def _least_loaded(self, exclude: Optional[int] = None) -> int:
+        candidates = [i for i in range(len(self.clients)) if i != exclude] or [exclude]
+        return min(candidates, key=lambda i: (self._in_flight[i], self._dispatched[i]))
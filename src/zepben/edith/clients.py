@@ -0,0 +1,131 @@
+#  Copyright 2024 Zeppelin Bend Pty Ltd
+#
+#  This Source Code Form is subject to the terms of the Mozilla Public
+#  License, v. 2.0. If a copy of the MPL was not distributed with this
+#  file, You can obtain one at https://mozilla.org/MPL/2.0/.
+from asyncio import ensure_future, shield
+from typing import Any, Awaitable, Iterable, Iterator, Optional, Tuple, Type
+
+from zepben.evolve import GrpcResult, IdentifiedObject, NetworkConsumerClient, NetworkService
+from zepben.protobuf.nc.nc_requests_pb2 import GetIdentifiedObjectsRequest
+
+from zepben.edith.fetch_policy import FetchPolicy
+
+__all__ = ["SharedHierarchyStub", "PlannedStub", "PlannedNetworkConsumerClient", "isolated_client", "shared_hierarchy_stub",
+           "planned_client", "check_policy"]
+
+
+def isolated_client(client: NetworkConsumerClient, stub: Optional[Any] = None) -> NetworkConsumerClient:
+    """
+    :param client: The client to copy the settings of.
+    :param stub: The stub to fetch through. Defaults to the stub of `client`.
+    :return: A client that fetches into its own empty `NetworkService`, with the same error handlers and timeout as
+        `client`.
+    """
+    stub = stub if stub is not None else client._stub
+    return NetworkConsumerClient(stub=stub, error_handlers=client.error_handlers, timeout=client.timeout)
+
+
+class SharedHierarchyStub(object):
+    """
+    A network consumer stub that requests the network hierarchy once and gives the same response to every client using
+    it, so a batch of isolated clients does not request the hierarchy once per feeder. Each client still builds the
+    hierarchy into its own network. A failed request is not shared, so a later client requests the hierarchy again.
+    Every other call is passed to the wrapped stub.
+    """
+
+    def __init__(self, stub: Any):
+        self.stub = stub
+        self._hierarchy: Optional[Awaitable[Any]] = None
+
+    def __getattr__(self, name: str) -> Any:
+        return getattr(self.stub, name)
+
+    async def getNetworkHierarchy(self, request: Any, **kwargs) -> Any:
+        hierarchy = self._hierarchy
+        if hierarchy is None or (hierarchy.done() and (hierarchy.cancelled() or hierarchy.exception() is not None)):
+            hierarchy = self._hierarchy = ensure_future(self.stub.getNetworkHierarchy(request, **kwargs))
+        # A client that is cancelled, e.g. an abandoned hedged fetch, must not cancel the request for the others.
+        return await shield(hierarchy)
+
+
+def shared_hierarchy_stub(client: NetworkConsumerClient) -> SharedHierarchyStub:
+    """
+    :param client: The client whose stub to wrap.
+    :return: A `SharedHierarchyStub` for the clients of a batch fetched through the channel of `client`.
+    """
+    return SharedHierarchyStub(client._stub)
+
+
+def planned_client(client: NetworkConsumerClient, skipped_types: Tuple[Type[IdentifiedObject], ...]) -> NetworkConsumerClient:
+    """
+    :param client: The client to fetch into the network of.
+    :param skipped_types: The types of object to leave out of fetches.
+    :return: A client that fetches into the network of `client` without the objects of `skipped_types`, or `client`
+        itself if no types are skipped.
+    """
+    if not skipped_types:
+        return client
+    return PlannedNetworkConsumerClient(client, PlannedStub(client._stub, client.service, skipped_types))
+
+
+class PlannedStub(object):
+    """
+    A network consumer stub that leaves out of each request for identified objects the mRIDs that are only referenced as
+    objects of skipped types, so that references to them are left unresolved. Every other call is passed to the wrapped
+    stub.
+    """
+
+    def __init__(self, stub: Any, network: NetworkService, skipped_types: Tuple[Type[IdentifiedObject], ...]):
+        self.stub = stub
+        self.network = network
+        self.skipped_types = skipped_types
+
+    def __getattr__(self, name: str) -> Any:
+        return getattr(self.stub, name)
+
+    def getIdentifiedObjects(self, requests: Iterable[GetIdentifiedObjectsRequest], **kwargs) -> Any:
+        return self.stub.getIdentifiedObjects(self._without_skipped(requests), **kwargs)
+
+    def _without_skipped(self, requests: Iterable[GetIdentifiedObjectsRequest]) -> Iterator[GetIdentifiedObjectsRequest]:
+        for request in requests:
+            mrids = [mrid for mrid in request.mrids if not self._is_skipped(mrid)]
+            if mrids:
+                yield GetIdentifiedObjectsRequest(mrids=mrids)
+
+    def _is_skipped(self, mrid: str) -> bool:
+        references = list(self.network.get_unresolved_references_to(mrid))
+        return bool(references) and all(issubclass(reference.resolver.to_class, self.skipped_types) for reference in references)
+
+
+class PlannedNetworkConsumerClient(NetworkConsumerClient):
+    """
+    A client that fetches into the network of another client through a `PlannedStub`. The network hierarchy is taken
+    from the other client, which only requests it the first time it is needed.
+    """
+
+    # The base class is slotted, so every attribute must be declared.
+    client: NetworkConsumerClient
+
+    def __init__(self, client: NetworkConsumerClient, stub: PlannedStub):
+        super().__init__(stub=stub, error_handlers=client.error_handlers, timeout=client.timeout)
+        self.client = client
+
+    @property
+    def service(self) -> NetworkService:
+        return self.client.service
+
+    async def _get_network_hierarchy(self) -> GrpcResult:
+        return await self.client._get_network_hierarchy()
+
+
+def check_policy(policy: Optional[FetchPolicy], stream_lv_feeders: bool):
+    """
+    Check that a fetch policy can be used to fetch a feeder.
+
+    :param policy: The policy to fetch the feeder with, if any.
+    :param stream_lv_feeders: Whether the feeder's LV feeders are being streamed.
+    """
+    # Streamed LV feeders are mutated as they arrive, so a failed fetch can not simply be retried.
+    if policy is not None and stream_lv_feeders:
+        raise ValueError("LV feeders can not be streamed when using a fetch policy")
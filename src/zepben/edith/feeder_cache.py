@@ -0,0 +1,213 @@
+#  Copyright 2024 Zeppelin Bend Pty Ltd
+#
+#  This Source Code Form is subject to the terms of the Mozilla Public
+#  License, v. 2.0. If a copy of the MPL was not distributed with this
+#  file, You can obtain one at https://mozilla.org/MPL/2.0/.
+import hashlib
+import os
+import tempfile
+from collections import OrderedDict
+from pathlib import Path
+from threading import Lock
+from typing import Optional, Tuple, Union
+
+from google.protobuf.message import DecodeError
+from zepben.evolve import IdentifiedObject, NetworkService
+
+from zepben.edith.network_snapshot import network_from_bytes, network_to_bytes
+
+__all__ = ["FeederCache", "FeederDiskCache", "FeederMemoryCache"]
+
+
+class FeederDiskCache(object):
+    """
+    A directory of pristine feeder networks, as fetched from the server before any mutators were applied, keyed by
+    feeder mRID and a version token. Once the cached networks take up more than `max_bytes`, the least recently used
+    ones are removed.
+
+    The version token should change whenever the server's network does, e.g. the date the network model was built.
+    Entries cached under any other version are never loaded, and are eventually evicted.
+    """
+
+    def __init__(self, directory: Union[str, os.PathLike], version: str, max_bytes: int = 1024 ** 3):
+        """
+        :param directory: The directory to cache networks in. It is created if it does not exist.
+        :param version: The version of the server's network that cached networks are valid for.
+        :param max_bytes: The total size of the cached networks to evict down to after a network is stored.
+        """
+        if max_bytes < 1:
+            raise ValueError("Cache size must be at least 1 byte")
+        self.directory = Path(directory)
+        self.version = version
+        self.max_bytes = max_bytes
+        self._lock = Lock()
+        self.directory.mkdir(parents=True, exist_ok=True)
+
+    def load(self, feeder_mrid: str, network: Optional[NetworkService] = None) -> Optional[NetworkService]:
+        """
+        Load a cached feeder network, if there is a valid one.
+
+        :param feeder_mrid: The mRID of the feeder to load.
+        :param network: The network to add the cached objects to. Defaults to a new `NetworkService`.
+        :return: The network the cached objects were added to, or `None` if the feeder is not cached for this version.
+        """
+        path = self._path(feeder_mrid)
+        try:
+            data = path.read_bytes()
+            os.utime(path)
+        except FileNotFoundError:
+            return None
+
+        try:
+            return network_from_bytes(data, network)
+        except DecodeError:
+            path.unlink(missing_ok=True)
+            return None
+
+    def store(self, feeder_mrid: str, network: NetworkService, data: Optional[bytes] = None):
+        """
+        Cache a feeder network, then evict the least recently used networks if the cache has grown beyond `max_bytes`.
+
+        :param feeder_mrid: The mRID of the feeder being cached.
+        :param network: The network holding the feeder, which should not have had any mutators applied to it.
+        :param data: `network` already serialised with `network_to_bytes`, so it is not serialised again. Defaults to
+            serialising `network`.
+        """
+        data = data if data is not None else network_to_bytes(network)
+
+        # Write to a temporary file first so that concurrent readers never see a partially written network.
+        fd, tmp = tempfile.mkstemp(dir=self.directory, suffix=".tmp")
+        try:
+            with os.fdopen(fd, "wb") as f:
+                f.write(data)
+            os.replace(tmp, self._path(feeder_mrid))
+        except BaseException:
+            Path(tmp).unlink(missing_ok=True)
+            raise
+
+        self.evict()
+
+    def evict(self, max_bytes: Optional[int] = None):
+        """
+        Remove the least recently used networks until the cache takes up no more than `max_bytes`.
+
+        :param max_bytes: The size to evict down to. Defaults to the cache's `max_bytes`.
+        """
+        max_bytes = self.max_bytes if max_bytes is None else max_bytes
+        with self._lock:
+            entries = []
+            for path in self.directory.glob("*.pb"):
+                try:
+                    stat = path.stat()
+                except FileNotFoundError:
+                    continue
+                entries.append((stat.st_mtime, stat.st_size, path))
+
+            total = sum(size for _, size, _ in entries)
+            for _, size, path in sorted(entries, key=lambda e: e[0]):
+                if total <= max_bytes:
+                    break
+                path.unlink(missing_ok=True)
+                total -= size
+
+    def clear(self):
+        """
+        Remove every cached network.
+        """
+        self.evict(0)
+
+    def _path(self, feeder_mrid: str) -> Path:
+        key = hashlib.sha256(f"{self.version}\0{feeder_mrid}".encode()).hexdigest()
+        return self.directory / f"{key}.pb"
+
+
+class FeederMemoryCache(object):
+    """
+    An in-memory cache of pristine feeder networks, as fetched from the server before any mutators were applied. Each
+    network is held in its serialised form, so every load creates an independent copy that can be mutated without
+    affecting the cached network or any other copy.
+
+    Once the cached networks hold more than `max_bytes` serialised bytes or `max_objects` objects, the least recently
+    used ones are evicted.
+    """
+
+    def __init__(self, max_bytes: Optional[int] = 512 * 1024 ** 2, max_objects: Optional[int] = None):
+        """
+        :param max_bytes: The total serialised size of the cached networks, or `None` for no limit.
+        :param max_objects: The total number of objects in the cached networks, or `None` for no limit.
+        """
+        if max_bytes is not None and max_bytes < 1:
+            raise ValueError("Cache size must be at least 1 byte")
+        if max_objects is not None and max_objects < 1:
+            raise ValueError("Cache size must be at least 1 object")
+        self.max_bytes = max_bytes
+        self.max_objects = max_objects
+        self._networks: OrderedDict[str, Tuple[bytes, int]] = OrderedDict()
+        self._num_bytes = 0
+        self._num_objects = 0
+        self._lock = Lock()
+
+    def load(self, feeder_mrid: str, network: Optional[NetworkService] = None) -> Optional[NetworkService]:
+        """
+        Load a copy of a cached feeder network, if there is one.
+
+        :param feeder_mrid: The mRID of the feeder to load.
+        :param network: The network to add the copied objects to. Defaults to a new `NetworkService`.
+        :return: The network the copied objects were added to, or `None` if the feeder is not cached.
+        """
+        with self._lock:
+            entry = self._networks.get(feeder_mrid)
+            if entry is None:
+                return None
+            self._networks.move_to_end(feeder_mrid)
+
+        return network_from_bytes(entry[0], network)
+
+    def store(self, feeder_mrid: str, network: NetworkService, data: Optional[bytes] = None):
+        """
+        Cache a feeder network, then evict the least recently used networks if the cache has grown beyond its limits.
+
+        :param feeder_mrid: The mRID of the feeder being cached.
+        :param network: The network holding the feeder, which should not have had any mutators applied to it.
+        :param data: `network` already serialised with `network_to_bytes`, so it is not serialised again. Defaults to
+            serialising `network`.
+        """
+        data = data if data is not None else network_to_bytes(network)
+        num_objects = sum(1 for _ in network.objects(IdentifiedObject))
+
+        with self._lock:
+            self._remove(feeder_mrid)
+            self._networks[feeder_mrid] = (data, num_objects)
+            self._num_bytes += len(data)
+            self._num_objects += num_objects
+
+            while self._networks and self._is_over_limit():
+                self._remove(next(iter(self._networks)))
+
+    def clear(self):
+        """
+        Remove every cached network.
+        """
+        with self._lock:
+            self._networks.clear()
+            self._num_bytes = 0
+            self._num_objects = 0
+
+    def __len__(self) -> int:
+        return len(self._networks)
+
+    def __contains__(self, feeder_mrid: str) -> bool:
+        return feeder_mrid in self._networks
+
+    def _is_over_limit(self) -> bool:
+        return (self.max_bytes is not None and self._num_bytes > self.max_bytes) or \
+            (self.max_objects is not None and self._num_objects > self.max_objects)
+
+    def _remove(self, feeder_mrid: str):
+        entry = self._networks.pop(feeder_mrid, None)
+        if entry is not None:
+            self._num_bytes -= len(entry[0])
+            self._num_objects -= entry[1]
+
+
+FeederCache = Union[FeederDiskCache, FeederMemoryCache]
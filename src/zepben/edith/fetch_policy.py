@@ -0,0 +1,237 @@
+#  Copyright 2024 Zeppelin Bend Pty Ltd
+#
+#  This Source Code Form is subject to the terms of the Mozilla Public
+#  License, v. 2.0. If a copy of the MPL was not distributed with this
+#  file, You can obtain one at https://mozilla.org/MPL/2.0/.
+import itertools
+import math
+from asyncio import FIRST_COMPLETED, TimeoutError as AsyncioTimeoutError, ensure_future, gather, sleep, wait, wait_for
+from collections import deque
+from threading import Lock
+from time import monotonic
+from typing import Awaitable, Callable, Iterable, List, Optional, TypeVar
+
+import grpc
+from dataclassy import dataclass
+
+__all__ = ["FetchPolicy", "FetchAttempt", "fetch_with_policy"]
+
+C = TypeVar("C")
+
+TRANSIENT_STATUS_CODES = frozenset({
+    grpc.StatusCode.UNAVAILABLE,
+    grpc.StatusCode.DEADLINE_EXCEEDED,
+    grpc.StatusCode.RESOURCE_EXHAUSTED,
+    grpc.StatusCode.ABORTED
+})
+
+
+class FetchPolicy(object):
+    """
+    How a feeder is fetched: how long it may take, how failed fetches are retried, and when a hedged fetch is started
+    alongside a slow one. A policy remembers how long its successful fetches took, so the same policy should be used for
+    every feeder in a batch for hedging to work.
+    """
+
+    def __init__(
+            self,
+            deadline: Optional[float] = None,
+            max_attempts: int = 1,
+            initial_backoff: float = 0.5,
+            max_backoff: float = 10.0,
+            backoff_multiplier: float = 2.0,
+            retryable_status_codes: Iterable[grpc.StatusCode] = TRANSIENT_STATUS_CODES,
+            hedge_percentile: Optional[float] = None,
+            hedge_min_samples: int = 20,
+            latency_window: int = 200
+    ):
+        """
+        :param deadline: The number of seconds a feeder may take to fetch, across every attempt, before it fails with a
+            builtin `TimeoutError`, on every Python version. Defaults to no deadline.
+        :param max_attempts: The maximum number of times to try fetching a feeder, including the first. Defaults to 1,
+            which does not retry.
+        :param initial_backoff: The number of seconds to wait before the first retry.
+        :param max_backoff: The longest to wait before any retry, in seconds.
+        :param backoff_multiplier: How much longer to wait before each retry than before the one before it.
+        :param retryable_status_codes: The gRPC status codes of failures to retry. Defaults to those of transient
+            failures, e.g. `UNAVAILABLE`.
+        :param hedge_percentile: Start a second fetch of a feeder once the first has taken longer than this percentile
+            of recent successful fetches, and use whichever finishes first. Defaults to never hedging.
+        :param hedge_min_samples: The number of successful fetches to time before any fetch is hedged.
+        :param latency_window: The number of recent successful fetches the hedging percentile is taken over.
+        """
+        if deadline is not None and deadline <= 0:
+            raise ValueError("deadline must be greater than 0")
+        if max_attempts < 1:
+            raise ValueError("max_attempts must be at least 1")
+        if initial_backoff < 0 or max_backoff < 0 or backoff_multiplier < 1:
+            raise ValueError("Backoffs must not be negative and backoff_multiplier must be at least 1")
+        if hedge_percentile is not None and not 0 < hedge_percentile <= 100:
+            raise ValueError("hedge_percentile must be greater than 0 and at most 100")
+        if hedge_min_samples < 1 or latency_window < hedge_min_samples:
+            raise ValueError("hedge_min_samples must be at least 1 and at most latency_window")
+
+        self.deadline = deadline
+        self.max_attempts = max_attempts
+        self.initial_backoff = initial_backoff
+        self.max_backoff = max_backoff
+        self.backoff_multiplier = backoff_multiplier
+        self.retryable_status_codes = frozenset(retryable_status_codes)
+        self.hedge_percentile = hedge_percentile
+        self.hedge_min_samples = hedge_min_samples
+        self._latencies = deque(maxlen=latency_window)
+        self._lock = Lock()
+
+    def is_retryable(self, error: Exception) -> bool:
+        """
+        :param error: The exception a fetch failed with.
+        :return: Whether the fetch should be retried.
+        """
+        return isinstance(error, grpc.RpcError) and error.code() in self.retryable_status_codes
+
+    def backoff(self, retry: int) -> float:
+        """
+        :param retry: The number of the retry, starting from 0 for the first.
+        :return: The number of seconds to wait before the retry.
+        """
+        return min(self.initial_backoff * self.backoff_multiplier ** retry, self.max_backoff)
+
+    def record_latency(self, seconds: float):
+        """
+        Record how long a successful fetch took.
+
+        :param seconds: The duration of the fetch.
+        """
+        with self._lock:
+            self._latencies.append(seconds)
+
+    def hedge_delay(self) -> Optional[float]:
+        """
+        :return: How long to wait for a fetch before starting a hedged one, or `None` if fetches should not be hedged,
+            either because hedging is disabled or too few fetches have been timed.
+        """
+        if self.hedge_percentile is None:
+            return None
+        with self._lock:
+            if len(self._latencies) < self.hedge_min_samples:
+                return None
+            latencies = sorted(self._latencies)
+
+        # The nearest-rank percentile.
+        return latencies[max(math.ceil(self.hedge_percentile / 100 * len(latencies)), 1) - 1]
+
+
+@dataclass
+class FetchAttempt(object):
+    """
+    The timing and outcome of one attempt to fetch a feeder.
+
+    :param number: The number of the attempt, starting from 1, in the order the attempts were started.
+    :param hedged: Whether this was a hedged attempt, started alongside a slow one.
+    :param started: The number of seconds after the first attempt started that this attempt started.
+    :param duration: The number of seconds the attempt took.
+    :param error: The exception the attempt failed with, or `None` if it succeeded. Attempts that were abandoned,
+        because another attempt finished first or the deadline passed, have a `CancelledError`.
+    """
+    number: int
+    hedged: bool
+    started: float
+    duration: float
+    error: Optional[BaseException] = None
+
+    @property
+    def was_successful(self) -> bool:
+        return self.error is None
+
+
+async def fetch_with_policy(
+        fetch: Callable[[C], Awaitable[None]],
+        client: C,
+        create_hedge_client: Optional[Callable[[], C]],
+        policy: FetchPolicy,
+        attempts: List[FetchAttempt],
+        release_hedge_client: Optional[Callable[[C], None]] = None
+) -> C:
+    """
+    Fetch a feeder following a `FetchPolicy`.
+
+    Retries fetch into the same client, so objects fetched by a failed attempt are not fetched again. A hedged attempt
+    fetches into a new client, as it runs at the same time as the attempt it hedges. A fetch that passes the policy's
+    deadline fails with the builtin `TimeoutError`.
+
+    :param fetch: A function that fetches the feeder into the client it is called with.
+    :param client: The client to fetch the feeder into.
+    :param create_hedge_client: A function that creates the client for a hedged attempt, or `None` to never hedge.
+    :param policy: The policy to follow.
+    :param attempts: A list that each attempt is added to once it finishes, whether or not the feeder could be fetched.
+    :param release_hedge_client: An optional function that is called on the client of a hedged attempt once the attempt
+        has finished, succeeded, failed or been abandoned.
+    :return: The client the feeder was fetched into.
+    """
+    first_started = monotonic()
+    numbers = itertools.count(1)
+
+    async def attempt(attempt_client: C, hedged: bool):
+        number = next(numbers)
+        started = monotonic()
+        error = None
+        try:
+            await fetch(attempt_client)
+        except BaseException as e:
+            error = e
+            raise
+        finally:
+            duration = monotonic() - started
+            attempts.append(FetchAttempt(number, hedged, started - first_started, duration, error))
+            if error is None:
+                policy.record_latency(duration)
+
+    async def with_retries() -> C:
+        for retry in itertools.count():
+            try:
+                await attempt(client, False)
+                return client
+            except Exception as e:
+                if retry + 1 >= policy.max_attempts or not policy.is_retryable(e):
+                    raise
+            await sleep(policy.backoff(retry))
+
+    async def hedged() -> C:
+        # The client is created once the hedged attempt starts, so it is always released, even if the attempt is abandoned.
+        hedge_client = create_hedge_client()
+        try:
+            await attempt(hedge_client, True)
+            return hedge_client
+        finally:
+            if release_hedge_client is not None:
+                release_hedge_client(hedge_client)
+
+    async def run() -> C:
+        primary = ensure_future(with_retries())
+        pending = {primary}
+        try:
+            hedge_delay = policy.hedge_delay() if create_hedge_client is not None else None
+            if hedge_delay is not None:
+                done, pending = await wait(pending, timeout=hedge_delay)
+                if not done:
+                    pending.add(ensure_future(hedged()))
+
+            # Use the first attempt to succeed, or fail with the primary attempt's error if none do.
+            while pending:
+                done, pending = await wait(pending, return_when=FIRST_COMPLETED)
+                for task in done:
+                    if not task.cancelled() and task.exception() is None:
+                        return task.result()
+            return primary.result()
+        finally:
+            for task in pending:
+                task.cancel()
+            await gather(*pending, return_exceptions=True)
+
+    try:
+        return await wait_for(run(), policy.deadline)
+    except AsyncioTimeoutError as e:
+        # Before Python 3.11, asyncio raises its own `TimeoutError` rather than the builtin one.
+        if isinstance(e, TimeoutError):
+            raise
+        raise TimeoutError(f"Fetch did not finish within its {policy.deadline}s deadline") from e
@@ -0,0 +1,113 @@
+#  Copyright 2024 Zeppelin Bend Pty Ltd
+#
+#  This Source Code Form is subject to the terms of the Mozilla Public
+#  License, v. 2.0. If a copy of the MPL was not distributed with this
+#  file, You can obtain one at https://mozilla.org/MPL/2.0/.
+from typing import Any, List, Optional, Tuple
+
+from zepben.evolve import NameType, NetworkService
+
+from zepben.edith.mutator_engine import ALL_FIELDS
+
+__all__ = ["MutationRecorder", "MutationJournal", "RecorderGroup"]
+
+
+class MutationRecorder(object):
+    """
+    Receives each change a mutator makes to a feeder network, as it is made. The built-in mutators take a recorder as
+    their `recorder` argument. Changes are described by the object changed, the field changed, and its old and new
+    values:
+
+    * Assignments to fields such as `wire_info` are recorded with the name of the field.
+    * Changes to the VA ratings of a transformer end are recorded on the `s_ratings` field, with the old and new values
+      being tuples of its `TransformerEndRatedS`.
+    * Names added to or removed from an object are recorded on the `names` field, with the added `Name` as the new value
+      or the removed `Name` as the old value.
+    * Objects and name types added to the network are recorded with a field of `ALL_FIELDS`, the object as the new value
+      and `None` as the old value.
+    """
+
+    def record(self, feeder_network: NetworkService, io: Any, field: str, old: Any, new: Any, entry: Optional[str] = None):
+        """
+        Record a change to a feeder network.
+
+        :param feeder_network: The network that was changed.
+        :param io: The object that was changed, or added to the network.
+        :param field: The name of the field that was changed.
+        :param old: The value of the field before the change.
+        :param new: The value of the field after the change.
+        :param entry: The name of the catalogue entry the new value was taken from, if any.
+        """
+        raise NotImplementedError
+
+
+class RecorderGroup(MutationRecorder):
+    """
+    A `MutationRecorder` that passes each change on to several others, e.g. to roll back the changes that are written to
+    a change set.
+    """
+
+    def __init__(self, *recorders: MutationRecorder):
+        """
+        :param recorders: The recorders to pass each change to, in order.
+        """
+        self.recorders = recorders
+
+    def record(self, feeder_network: NetworkService, io: Any, field: str, old: Any, new: Any, entry: Optional[str] = None):
+        for recorder in self.recorders:
+            recorder.record(feeder_network, io, field, old, new, entry)
+
+
+class MutationJournal(MutationRecorder):
+    """
+    An undo log of the changes mutators make to feeder networks. Rolling the journal back undoes every change recorded
+    since it was created, or last rolled back or cleared, in time proportional to the number of changes. This lets a
+    single fetched feeder network be mutated by many scenarios in turn, rolling back after each, rather than fetching or
+    copying it for each scenario.
+
+    Only changes made through a recorder are undone, so every mutator applied to a network between rollbacks should be
+    given the journal. Name types added to the network are left in it, without any of the names added since.
+    """
+
+    def __init__(self):
+        self._changes: List[Tuple[NetworkService, Any, str, Any, Any]] = []
+
+    def __len__(self) -> int:
+        return len(self._changes)
+
+    def record(self, feeder_network: NetworkService, io: Any, field: str, old: Any, new: Any, entry: Optional[str] = None):
+        self._changes.append((feeder_network, io, field, old, new))
+
+    def rollback(self):
+        """
+        Undo every recorded change, latest first, and clear the journal.
+        """
+        changes = self._changes
+        self._changes = []
+        for feeder_network, io, field, old, new in reversed(changes):
+            _undo(feeder_network, io, field, old, new)
+
+    def clear(self):
+        """
+        Forget every recorded change, keeping the changes in the network.
+        """
+        self._changes = []
+
+
+def _undo(feeder_network: NetworkService, io: Any, field: str, old: Any, new: Any):
+    if field == ALL_FIELDS:
+        # The network has no way to remove a name type, but its names are removed with the objects they belong to.
+        if not isinstance(new, NameType):
+            feeder_network.remove(new)
+    elif field == "names":
+        if new is not None:
+            io.remove_name(new)
+            new.type.remove_name(new)
+        if old is not None:
+            io.add_name(old.type.get_or_add_name(old.name, io))
+    elif field == "s_ratings":
+        io.clear_ratings()
+        for rating in old:
+            io.add_rating(rating.cooling_type, rating.rated_s)
+    else:
+        setattr(io, field, old)
@@ -0,0 +1,228 @@
+#  Copyright 2024 Zeppelin Bend Pty Ltd
+#
+#  This Source Code Form is subject to the terms of the Mozilla Public
+#  License, v. 2.0. If a copy of the MPL was not distributed with this
+#  file, You can obtain one at https://mozilla.org/MPL/2.0/.
+import inspect
+from asyncio import gather, get_running_loop
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Awaitable, Callable, Dict, FrozenSet, Iterable, List, Optional, Tuple, Type, Union
+
+from dataclassy import dataclass
+from zepben.evolve import IdentifiedObject, NetworkService
+
+__all__ = ["ALL_FIELDS", "MutatorAccess", "VisitingMutator", "apply_mutators", "mutator_access"]
+
+ALL_FIELDS = "*"
+"""The field of a `MutatorAccess` entry that stands for every field of its type, including adding or removing objects."""
+
+Field = Tuple[type, str]
+
+
+@dataclass
+class MutatorAccess(object):
+    """
+    The fields of network objects that a mutator reads and writes, as `(type, field name)` pairs, e.g.
+    `(PowerTransformerEnd, "rated_s")`. A field name of `ALL_FIELDS` covers every field of the type, and adding objects
+    of the type to the network. A field of a type also covers that field of its subclasses.
+
+    Mutators declare their access with an `access` attribute. Mutators that neither write anything the other reads or
+    writes can be applied in either order, so they are put in the same stage by `apply_mutators`. Mutators without an
+    `access` attribute, including `VisitingMutator`s, are assumed to read and write everything.
+
+    Adding objects to a network is not thread safe, even for objects of different types, and neither is finding the
+    objects of a type while another is being added. A stage holding a mutator that writes `ALL_FIELDS` of any type is
+    therefore always applied on a single thread.
+
+    :param reads: The fields the mutator reads.
+    :param writes: The fields the mutator writes.
+    """
+    reads: FrozenSet[Field] = frozenset()
+    writes: FrozenSet[Field] = frozenset()
+
+    def __or__(self, other: "MutatorAccess") -> "MutatorAccess":
+        return MutatorAccess(self.reads | other.reads, self.writes | other.writes)
+
+    def conflicts_with(self, other: "MutatorAccess") -> bool:
+        """
+        :param other: The access of another mutator.
+        :return: Whether the result of applying both mutators depends on the order they are applied in.
+        """
+        return _touches(self.writes, other.reads | other.writes) or _touches(other.writes, self.reads)
+
+
+def _adds(fields: FrozenSet[Field]) -> bool:
+    return any(field == ALL_FIELDS for _, field in fields)
+
+
+def _can_apply_on_threads(stage: List[Callable[[NetworkService], Any]]) -> bool:
+    accesses = [mutator_access(mutator) for mutator in stage]
+    return all(access is not None and not _adds(access.writes) for access in accesses)
+
+
+def _touches(fields: FrozenSet[Field], others: FrozenSet[Field]) -> bool:
+    for type_, field in fields:
+        for other_type, other_field in others:
+            if (issubclass(type_, other_type) or issubclass(other_type, type_)) and \
+                    (field == other_field or ALL_FIELDS in (field, other_field)):
+                return True
+    return False
+
+
+class VisitingMutator(object):
+    """
+    A mutator that visits each object in a feeder network whose type is one of its `visited_types`. When several
+    visiting mutators that visit different types are applied one after another, the network is walked once for all of
+    them, with each object passed to the mutator that visits its type.
+
+    A visiting mutator should only modify the objects it visits and the objects that belong to them, such as the ends of
+    a transformer, so that walking the network for several mutators at once gives the same result as applying them one
+    after another.
+
+    Any state needed across objects is returned by `begin` and passed to the other methods, so a single mutator can be
+    applied to several networks at once.
+    """
+
+    visited_types: Tuple[Type[IdentifiedObject], ...] = ()
+
+    def __call__(self, feeder_network: NetworkService) -> Optional[Awaitable[None]]:
+        [finished] = _walk([self], feeder_network)
+        return finished
+
+    def begin(self, feeder_network: NetworkService) -> Any:
+        """
+        Start mutating a feeder network, before any objects are visited.
+
+        :param feeder_network: The network being mutated.
+        :return: The state to pass to `visit` and `finish`.
+        """
+        return feeder_network
+
+    def visit(self, state: Any, io: IdentifiedObject):
+        """
+        Visit an object of one of the `visited_types`.
+
+        :param state: The state returned by `begin`.
+        :param io: The object to visit.
+        """
+        raise NotImplementedError
+
+    def finish(self, state: Any) -> Optional[Awaitable[None]]:
+        """
+        Finish mutating a feeder network, after every object has been visited.
+
+        :param state: The state returned by `begin`.
+        :return: Optionally, an awaitable, which is awaited, in mutator order, before the next stage starts.
+        """
+
+
+async def apply_mutators(mutators: Iterable[Callable[[NetworkService], Any]], feeder_network: NetworkService, max_workers: int = 1):
+    """
+    Apply mutators to a feeder network with the same result as applying them one after another.
+
+    The mutators are split into stages using their `MutatorAccess`: each mutator goes in the stage after the last stage
+    holding a mutator it conflicts with, so the mutators in a stage are independent of each other. Consecutive
+    `VisitingMutator`s in a stage that visit different types share a single walk of the network. Consecutive visiting
+    mutators without an `access` attribute are kept in a stage of their own, which is applied in order, so they still
+    share a walk. Awaitables returned by the mutators in a stage, such as the coroutines of coroutine functions, are
+    awaited in the order the mutators were given, before the next stage starts.
+
+    :param mutators: The mutators to apply.
+    :param feeder_network: The network to mutate.
+    :param max_workers: The number of threads to apply the independent mutators of a stage with. Defaults to 1, which
+        applies them in the calling thread. More threads only help mutators that block, e.g. on synchronous I/O in a
+        callback, or that release the GIL. Stages holding a mutator that adds objects to the network are always applied
+        in the calling thread.
+    """
+    if max_workers < 1:
+        raise ValueError("max_workers must be at least 1")
+
+    for stage in _stages(list(mutators)):
+        units = _fuse(stage)
+        if max_workers > 1 and len(units) > 1 and _can_apply_on_threads(stage):
+            loop = get_running_loop()
+            with ThreadPoolExecutor(min(max_workers, len(units))) as executor:
+                unit_results = await gather(*(loop.run_in_executor(executor, _apply_unit, unit, feeder_network) for unit in units))
+        else:
+            unit_results = [_apply_unit(unit, feeder_network) for unit in units]
+
+        for results in unit_results:
+            for result in results:
+                if inspect.isawaitable(result):
+                    await result
+
+
+def mutator_access(mutator: Callable[[NetworkService], Any]) -> Optional[MutatorAccess]:
+    """
+    :param mutator: A mutator.
+    :return: The fields the mutator reads and writes, or `None` if they are unknown.
+    """
+    return getattr(mutator, "access", None)
+
+
+def _stages(mutators: List[Callable[[NetworkService], Any]]) -> List[List[Callable[[NetworkService], Any]]]:
+    accesses = [mutator_access(mutator) for mutator in mutators]
+    stage_of = []
+    stages = []
+    for i, (mutator, access) in enumerate(zip(mutators, accesses)):
+        if access is None and i > 0 and accesses[i - 1] is None and isinstance(mutator, VisitingMutator) and \
+                isinstance(mutators[i - 1], VisitingMutator):
+            # Keep undeclared visiting mutators with the one before them, so they can share its walk.
+            stage = stage_of[i - 1]
+        else:
+            stage = 0
+            for j in range(i):
+                if access is None or accesses[j] is None or access.conflicts_with(accesses[j]):
+                    stage = max(stage, stage_of[j] + 1)
+        stage_of.append(stage)
+        if stage == len(stages):
+            stages.append([])
+        stages[stage].append(mutator)
+    return stages
+
+
+def _apply_unit(unit: Union[List[VisitingMutator], Callable[[NetworkService], Any]], feeder_network: NetworkService) -> List[Any]:
+    if isinstance(unit, list):
+        return _walk(unit, feeder_network)
+    return [unit(feeder_network)]
+
+
+def _fuse(mutators: Iterable[Callable[[NetworkService], Any]]) -> List[Union[List[VisitingMutator], Callable[[NetworkService], Any]]]:
+    stages = []
+    visited: Tuple[type, ...] = ()
+    for mutator in mutators:
+        if isinstance(mutator, VisitingMutator) and stages and isinstance(stages[-1], list) and not _overlaps(mutator.visited_types, visited):
+            stages[-1].append(mutator)
+            visited += mutator.visited_types
+        elif isinstance(mutator, VisitingMutator):
+            stages.append([mutator])
+            visited = mutator.visited_types
+        else:
+            stages.append(mutator)
+            visited = ()
+    return stages
+
+
+def _overlaps(types: Tuple[type, ...], others: Tuple[type, ...]) -> bool:
+    return any(issubclass(t, o) or issubclass(o, t) for t in types for o in others)
+
+
+def _walk(mutators: List[VisitingMutator], feeder_network: NetworkService) -> List[Optional[Awaitable[None]]]:
+    states = [mutator.begin(feeder_network) for mutator in mutators]
+
+    # Walk each of the most general visited types, which are disjoint, so every object is only reached once.
+    visited_types = [t for mutator in mutators for t in mutator.visited_types]
+    roots = list(dict.fromkeys(t for t in visited_types if not any(t is not o and issubclass(t, o) for o in visited_types)))
+
+    visitors: Dict[type, List[Tuple[VisitingMutator, Any]]] = {}
+    for root in roots:
+        # Visitors may add objects to the network, so the objects are listed before any are visited.
+        for io in list(feeder_network.objects(root)):
+            type_visitors = visitors.get(type(io))
+            if type_visitors is None:
+                type_visitors = [(m, s) for m, s in zip(mutators, states) if isinstance(io, m.visited_types)]
+                visitors[type(io)] = type_visitors
+            for mutator, state in type_visitors:
+                mutator.visit(state, io)
+
+    return [mutator.finish(state) for mutator, state in zip(mutators, states)]
@@ -0,0 +1,64 @@
+#  Copyright 2024 Zeppelin Bend Pty Ltd
+#
+#  This Source Code Form is subject to the terms of the Mozilla Public
+#  License, v. 2.0. If a copy of the MPL was not distributed with this
+#  file, You can obtain one at https://mozilla.org/MPL/2.0/.
+from typing import Dict, Optional, Type
+
+from zepben.evolve import IdentifiedObject, NetworkService
+from zepben.evolve.streaming.get.network_consumer import _nio_type_to_cim
+from zepben.protobuf.nc.nc_responses_pb2 import GetIdentifiedObjectsResponse
+
+__all__ = ["network_to_bytes", "network_from_bytes", "clone_network"]
+
+_cim_to_nio_type: Dict[Type[IdentifiedObject], str] = {cim: nio_type for nio_type, cim in _nio_type_to_cim.items()}
+
+
+def network_to_bytes(network: NetworkService) -> bytes:
+    """
+    Serialise every object in a network using the same protobuf messages the network consumer receives from the server.
+
+    :param network: The network to serialise.
+    :return: The serialised network.
+    """
+    snapshot = GetIdentifiedObjectsResponse()
+    for io in network.objects(IdentifiedObject):
+        nio_type = _cim_to_nio_type.get(type(io))
+        if nio_type is None:
+            raise TypeError(f"Unable to serialise {io}: {type(io).__name__} is not supported by the network consumer")
+
+        # noinspection PyUnresolvedReferences
+        getattr(snapshot.identifiedObjects.add(), nio_type).CopyFrom(io.to_pb())
+
+    return snapshot.SerializeToString()
+
+
+def network_from_bytes(data: bytes, network: Optional[NetworkService] = None) -> NetworkService:
+    """
+    Deserialise a network serialised with `network_to_bytes`.
+
+    :param data: The serialised network.
+    :param network: The network to add the deserialised objects to. Objects with an mRID that is already in this network
+        are skipped, in the same way as objects fetched from the server. Defaults to a new `NetworkService`.
+    :return: The network the objects were added to.
+    """
+    network = network if network is not None else NetworkService()
+
+    snapshot = GetIdentifiedObjectsResponse.FromString(data)
+    for nio in snapshot.identifiedObjects:
+        pb = getattr(nio, nio.WhichOneof("identifiedObject"))
+        # noinspection PyUnresolvedReferences
+        if network.get(pb.mrid(), default=None) is None:
+            network.add_from_pb(pb)
+
+    return network
+
+
+def clone_network(network: NetworkService) -> NetworkService:
+    """
+    Create an independent copy of a network, which can be mutated without affecting the original.
+
+    :param network: The network to copy.
+    :return: A new `NetworkService` holding a copy of every object in `network`.
+    """
+    return network_from_bytes(network_to_bytes(network))
@@ -0,0 +1,77 @@
+#  Copyright 2024 Zeppelin Bend Pty Ltd
+#
+#  This Source Code Form is subject to the terms of the Mozilla Public
+#  License, v. 2.0. If a copy of the MPL was not distributed with this
+#  file, You can obtain one at https://mozilla.org/MPL/2.0/.
+from threading import Lock
+from typing import Dict, Optional, Tuple
+
+from zepben.evolve import NetworkService, PerLengthSequenceImpedance, TransformerEndRatedS, WireInfo
+
+__all__ = ["OriginalRatings", "LineRating", "TransformerRating"]
+
+LineRating = Tuple[Optional[WireInfo], Optional[PerLengthSequenceImpedance]]
+"""The wire info and per length sequence impedance of a line."""
+
+TransformerRating = Tuple[Tuple[TransformerEndRatedS, ...], ...]
+"""The VA ratings of each end of a transformer."""
+
+
+class OriginalRatings(object):
+    """
+    The ratings that objects in feeder networks had before they were first weakened. When a weakener is given an
+    `OriginalRatings`, it records the rating of each object before it first modifies it, and always weakens from the
+    recorded rating rather than the current one. This lets the same network be weakened by several percentages one
+    after another, e.g. in a sweep, without fetching it again, and only the objects whose selected catalogue entry
+    changes are modified at each step.
+
+    A single `OriginalRatings` can be shared by several networks, and by the line and transformer weakeners. It holds a
+    reference to each network it has recorded ratings for until that network is forgotten.
+    """
+
+    def __init__(self):
+        self._networks: Dict[int, _NetworkRatings] = {}
+        self._lock = Lock()
+
+    def line(self, feeder_network: NetworkService, mrid: str) -> Optional[LineRating]:
+        """
+        :param feeder_network: The network the line is in.
+        :param mrid: The mRID of the line.
+        :return: The original wire info and per length sequence impedance of the line, or `None` if it has not been
+            weakened.
+        """
+        return self._of(feeder_network).lines.get(mrid)
+
+    def transformer(self, feeder_network: NetworkService, mrid: str) -> Optional[TransformerRating]:
+        """
+        :param feeder_network: The network the transformer is in.
+        :param mrid: The mRID of the transformer.
+        :return: The original VA ratings of each end of the transformer, or `None` if it has not been weakened.
+        """
+        return self._of(feeder_network).transformers.get(mrid)
+
+    def forget(self, feeder_network: NetworkService):
+        """
+        Forget the original ratings recorded for a network. The network is not restored to them.
+
+        :param feeder_network: The network to forget.
+        """
+        with self._lock:
+            self._networks.pop(id(feeder_network), None)
+
+    def _of(self, feeder_network: NetworkService) -> "_NetworkRatings":
+        with self._lock:
+            ratings = self._networks.get(id(feeder_network))
+            if ratings is None:
+                ratings = _NetworkRatings(feeder_network)
+                self._networks[id(feeder_network)] = ratings
+            return ratings
+
+
+class _NetworkRatings(object):
+
+    def __init__(self, feeder_network: NetworkService):
+        # Networks are keyed by their id, so they are kept alive to stop the id being reused by another network.
+        self.feeder_network = feeder_network
+        self.lines: Dict[str, LineRating] = {}
+        self.transformers: Dict[str, TransformerRating] = {}
@@ -0,0 +1,122 @@
+#  Copyright 2024 Zeppelin Bend Pty Ltd
+#
+#  This Source Code Form is subject to the terms of the Mozilla Public
+#  License, v. 2.0. If a copy of the MPL was not distributed with this
+#  file, You can obtain one at https://mozilla.org/MPL/2.0/.
+import asyncio
+import inspect
+from typing import Any, Awaitable, Callable, Iterable, List, Optional, Sequence, Tuple
+
+from dataclassy import dataclass
+from zepben.evolve import NetworkService
+
+from zepben.edith.network_snapshot import network_from_bytes, network_to_bytes
+
+__all__ = ["ScenarioResult", "MutatorFactory", "run_scenarios"]
+
+MutatorFactory = Callable[..., Callable[[NetworkService], Any]]
+"""
+A picklable callable that takes a `callback` keyword argument and returns a mutator, e.g.
+`functools.partial(line_weakener, 30)`.
+"""
+
+
+@dataclass
+class ScenarioResult(object):
+    """
+    The outcome of applying one scenario to a copy of a feeder.
+
+    :param scenario: The index of the scenario in the scenarios that were run.
+    :param network: The mutated copy of the feeder, if networks were returned and the scenario succeeded.
+    :param callback_payloads: The values each mutator in the scenario passed to its callback, in the order the mutators
+        were applied.
+    :param error: The exception raised while applying the scenario, if any.
+    """
+    scenario: int
+    network: Optional[NetworkService] = None
+    callback_payloads: List[List[Any]] = []
+    error: Optional[Exception] = None
+
+    @property
+    def was_successful(self) -> bool:
+        return self.error is None
+
+
+def run_scenarios(
+        network: NetworkService,
+        scenarios: Iterable[Sequence[MutatorFactory]],
+        max_workers: Optional[int] = None,
+        return_networks: bool = True
+) -> List[ScenarioResult]:
+    """
+    Apply each scenario to its own copy of `network`, spreading the scenarios across a pool of worker processes.
+
+    Mutators can not be sent to other processes, so each scenario is given as the factories that create its mutators
+    instead. Each factory is called in a worker process with a `callback` that records what the mutator reports, which
+    replaces any callback the factory was given. Worker processes are started with the "spawn" start method, so the
+    factories must be importable by module name, e.g. not defined in an interactive session.
+
+    :param network: The network to apply the scenarios to. It is not modified.
+    :param scenarios: The mutator factories of each scenario, e.g.
+        `[[partial(line_weakener, 10)], [partial(line_weakener, 20), partial(transformer_weakener, 20)]]`.
+    :param max_workers: The number of worker processes to use. Defaults to the number of processors.
+    :param return_networks: Whether to return the mutated copy of the network for each scenario. Sending networks back
+        from the worker processes can take as long as mutating them, so this can be disabled if only the callback
+        payloads are needed.
+    :return: A `ScenarioResult` for each scenario, in the same order as `scenarios`.
+    """
+    scenarios = [list(scenario) for scenario in scenarios]
+    if not scenarios:
+        return []
+
+    # Process pools pull in all of multiprocessing, so they are only imported once scenarios are run.
+    import multiprocessing
+    from concurrent.futures import ProcessPoolExecutor
+
+    # Workers are spawned rather than forked, as this may run on an executor thread of an event loop with open gRPC
+    # channels, which are not safe to fork. The network is only sent to each worker process once, rather than with every
+    # scenario.
+    with ProcessPoolExecutor(
+        max_workers,
+        mp_context=multiprocessing.get_context("spawn"),
+        initializer=_set_pristine_network,
+        initargs=(network_to_bytes(network),)
+    ) as executor:
+        futures = [executor.submit(_run_scenario, scenario, return_networks) for scenario in scenarios]
+
+        results = []
+        for i, future in enumerate(futures):
+            try:
+                network_bytes, payloads = future.result()
+            except Exception as e:
+                results.append(ScenarioResult(i, error=e))
+                continue
+            results.append(ScenarioResult(i, network_from_bytes(network_bytes) if network_bytes is not None else None, payloads))
+
+    return results
+
+
+_pristine_network: Optional[bytes] = None
+
+
+def _set_pristine_network(network_bytes: bytes):
+    global _pristine_network
+    _pristine_network = network_bytes
+
+
+def _run_scenario(scenario: Sequence[MutatorFactory], return_network: bool) -> Tuple[Optional[bytes], List[List[Any]]]:
+    network = network_from_bytes(_pristine_network)
+
+    payloads = []
+    for factory in scenario:
+        mutator_payloads = []
+        payloads.append(mutator_payloads)
+        result = factory(callback=mutator_payloads.append)(network)
+        if inspect.isawaitable(result):
+            asyncio.run(_await(result))
+
+    return network_to_bytes(network) if return_network else None, payloads
+
+
+async def _await(awaitable: Awaitable[Any]) -> Any:
+    return await awaitable
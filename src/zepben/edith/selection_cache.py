@@ -0,0 +1,127 @@
+#  Copyright 2024 Zeppelin Bend Pty Ltd
+#
+#  This Source Code Form is subject to the terms of the Mozilla Public
+#  License, v. 2.0. If a copy of the MPL was not distributed with this
+#  file, You can obtain one at https://mozilla.org/MPL/2.0/.
+import itertools
+import weakref
+from collections import OrderedDict
+from threading import Lock
+from typing import Any, Callable, Dict, Hashable, List, NamedTuple, Sequence
+
+__all__ = ["SelectionCache", "CacheInfo", "LINECODE_SELECTION_CACHE", "TRANSFORMER_SELECTION_CACHE"]
+
+
+class CacheInfo(NamedTuple):
+    hits: int
+    misses: int
+    maxsize: int
+    currsize: int
+
+
+class SelectionCache(object):
+    """
+    A bounded cache of catalogue selections, keyed by the catalogue and the signature of the object a catalogue entry
+    was selected for. Once the cache holds `maxsize` selections, the least recently used selection is evicted to make
+    room for a new one.
+
+    The cache only holds a weak reference to each catalogue, and removes a catalogue's selections once it has been
+    garbage collected, so dropping a catalogue frees it.
+    """
+
+    def __init__(self, maxsize: int = 4096):
+        if maxsize < 1:
+            raise ValueError("Cache size must be at least 1")
+        self.maxsize = maxsize
+        self.hits = 0
+        self.misses = 0
+        self._selections: OrderedDict = OrderedDict()
+        self._lock = Lock()
+        # Each catalogue is given a token that is never reused, as the id of a collected catalogue can be.
+        self._tokens: Dict[int, int] = {}
+        self._next_token = itertools.count()
+        self._collected_tokens: List[int] = []
+
+    def get_many(self, catalogue: Any, keys: Sequence[Hashable], select: Callable[[List[Hashable]], Sequence[int]]) -> List[int]:
+        """
+        Look up the selection for each key, selecting any that are not cached in a single call to `select`.
+
+        :param catalogue: The catalogue the selections are made from.
+        :param keys: The signature of each object to look up a selection for.
+        :param select: A function that returns the selection for each of a list of distinct, uncached keys.
+
+        :return: The selection for each key, in the same order as `keys`.
+        """
+        selections: List[int] = [-1] * len(keys)
+        with self._lock:
+            self._remove_collected()
+            token = self._token(catalogue)
+            missing: Dict[Hashable, List[int]] = {}
+            for i, key in enumerate(keys):
+                if key in missing:
+                    missing[key].append(i)
+                    self.hits += 1
+                elif (token, key) in self._selections:
+                    self._selections.move_to_end((token, key))
+                    selections[i] = self._selections[(token, key)]
+                    self.hits += 1
+                else:
+                    missing[key] = [i]
+
+            if not missing:
+                return selections
+
+            missing_keys = list(missing)
+            self.misses += len(missing_keys)
+            for key, selection in zip(missing_keys, select(missing_keys)):
+                selection = int(selection)
+                for i in missing[key]:
+                    selections[i] = selection
+                self._selections[(token, key)] = selection
+                if len(self._selections) > self.maxsize:
+                    self._selections.popitem(last=False)
+
+        return selections
+
+    def info(self) -> CacheInfo:
+        """
+        :return: The hit and miss counts, maximum size and current size of the cache.
+        """
+        with self._lock:
+            self._remove_collected()
+            return CacheInfo(self.hits, self.misses, self.maxsize, len(self._selections))
+
+    def clear(self):
+        """
+        Remove every cached selection and reset the hit and miss counts.
+        """
+        with self._lock:
+            self._selections.clear()
+            self.hits = 0
+            self.misses = 0
+
+    def _token(self, catalogue: Any) -> int:
+        token = self._tokens.get(id(catalogue))
+        if token is None:
+            token = next(self._next_token)
+            self._tokens[id(catalogue)] = token
+            weakref.finalize(catalogue, self._collected, id(catalogue), token)
+        return token
+
+    def _collected(self, catalogue_id: int, token: int):
+        # This can run during any allocation, including while the lock is held, so the selections are removed later.
+        self._tokens.pop(catalogue_id, None)
+        self._collected_tokens.append(token)
+
+    def _remove_collected(self):
+        if not self._collected_tokens:
+            return
+        collected = set()
+        while self._collected_tokens:
+            collected.add(self._collected_tokens.pop())
+        for key in [key for key in self._selections if key[0] in collected]:
+            del self._selections[key]
+
+
+LINECODE_SELECTION_CACHE = SelectionCache()
+TRANSFORMER_SELECTION_CACHE = SelectionCache()
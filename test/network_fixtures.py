@@ -6,7 +6,7 @@
 from typing import Dict, List, Optional
 
 from pytest import fixture
-from zepben.evolve import AssignToLvFeeders, LvFeeder, BaseVoltage, NameType, TestNetworkBuilder
+from zepben.evolve import AssignToLvFeeders, LvFeeder, BaseVoltage, NameType, TestNetworkBuilder, CableInfo
 
 from zepben.edith import NetworkService, Feeder, PhaseCode, EnergySource, EnergySourcePhase, Junction, ConductingEquipment, Breaker, PowerTransformer, \
     UsagePoint, Terminal, PowerTransformerEnd, Meter, AssetOwner, CustomerService, Organisation, AcLineSegment, \
@@ -18,7 +18,7 @@ from zepben.evolve.util import CopyableUUID
 __all__ = ["create_terminals", "create_junction_for_connecting", "create_source_for_connecting", "create_switch_for_connecting", "create_acls_for_connecting",
            "create_energy_consumer_for_connecting", "create_feeder", "create_substation", "create_power_transformer_for_connecting", "create_terminals",
            "create_geographical_region", "create_subgeographical_region", "create_asset_owner", "create_meter", "create_power_transformer_end",
-           "feeder_network", "network_with_nmis", "create_connectivitynode_with_terminals", "create_terminal"]
+           "feeder_network", "network_with_nmis", "create_connectivitynode_with_terminals", "create_terminal", "create_weakenable_network"]
 
 
 def create_terminals(network: NetworkService, ce: ConductingEquipment, num_terms: int, phases: PhaseCode = PhaseCode.ABCN) -> List[Terminal]:
@@ -286,6 +286,36 @@ def add_location(network: NetworkService, psr: PowerSystemResource, *coords: flo
     network.add(loc)
 
 
+async def create_weakenable_network(lv_line: bool = False, feeder: bool = False) -> NetworkService:
+    """
+    A line with a 500A cable into a 300kVA 11000/433V transformer, for testing the weakeners.
+
+          c0       c2
+    fdr------tx1------
+
+    :param lv_line: Add c2, a second line with the same cable, after the transformer.
+    :param feeder: Add a feeder headed at c0.
+    """
+    cable_info = CableInfo(mrid="cable-500A", rated_current=500)
+    builder = TestNetworkBuilder() \
+        .from_acls(action=lambda acls: setattr(acls, "wire_info", cable_info)) \
+        .to_power_transformer(
+            nominal_phases=[PhaseCode.ABC, PhaseCode.ABC],
+            end_actions=[
+                lambda end: setattr(end, "rated_u", 11000) or setattr(end, "rated_s", 300000),
+                lambda end: setattr(end, "rated_u", 433) or setattr(end, "rated_s", 300000)
+            ]
+        )
+    if lv_line:
+        builder.to_acls(action=lambda acls: setattr(acls, "wire_info", cable_info))
+    if feeder:
+        builder.add_feeder("c0", mrid="fdr")
+
+    network_service = await builder.build()
+    network_service.add(cable_info)
+    return network_service
+
+
 @fixture()
 async def feeder_network(request):
     """
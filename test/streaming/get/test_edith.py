@@ -4,6 +4,7 @@
 #  License, v. 2.0. If a copy of the MPL was not distributed with this
 #  file, You can obtain one at https://mozilla.org/MPL/2.0/.
 
+import asyncio
 from typing import Optional, Iterable, Generator, Callable, Dict, Set
 
 import pytest
@@ -16,11 +17,21 @@ from zepben.evolve import NetworkService, IdentifiedObject, CableInfo, AcLineSeg
     SubGeographicalRegion, Circuit, Loop, LvFeeder, UsagePoint, BaseVoltage, TestNetworkBuilder, PhaseCode
 from zepben.protobuf.nc import nc_pb2
 from zepben.protobuf.nc.nc_data_pb2 import NetworkIdentifiedObject
-from zepben.protobuf.nc.nc_requests_pb2 import GetIdentifiedObjectsRequest, GetEquipmentForContainersRequest
+from zepben.protobuf.nc.nc_requests_pb2 import GetIdentifiedObjectsRequest, GetEquipmentForContainersRequest, \
+    EXCLUDE_ENERGIZED_CONTAINERS, INCLUDE_ENERGIZED_LV_FEEDERS
 from zepben.protobuf.nc.nc_responses_pb2 import GetIdentifiedObjectsResponse, GetEquipmentForContainersResponse, \
     GetNetworkHierarchyResponse
 
-from zepben.edith import NetworkConsumerClient, usage_point_proportional_allocator, line_weakener, transformer_weakener
+from zepben import edith
+from zepben.edith import NetworkConsumerClient, BackgroundSyncNetworkConsumerClient, usage_point_proportional_allocator, \
+    line_weakener, transformer_weakener
+from zepben.edith import feeder_cache
+from zepben.edith.background_loop import BackgroundEventLoop
+from zepben.edith.client_pool import NetworkConsumerClientPool
+from zepben.edith.feeder_cache import FeederDiskCache
+from zepben.edith.fetch_policy import FetchPolicy
+from zepben.edith.network_snapshot import network_to_bytes
+from streaming.get.catching_thread import CatchingThread
 from streaming.get.grpcio_aio_testing.mock_async_channel import async_testing_channel
 from streaming.get.mock_server import MockServer, StreamGrpc, UnaryGrpc, unary_from_fixed
 
@@ -171,6 +182,82 @@ class TestNetworkConsumer:
             ]
         )
 
+    @pytest.mark.asyncio
+    @pytest.mark.parametrize("minimal_fetch", [True, False])
+    async def test_minimal_fetch_only_includes_what_mutators_need(self, minimal_fetch: bool):
+        cable_info = CableInfo(mrid="cable-500A", rated_current=500)
+        base_voltage = BaseVoltage(mrid="hv-bv", nominal_voltage=11000)
+        location = Location(mrid="loc1")
+        network_with_line = await (
+            TestNetworkBuilder()
+            .from_acls(
+                nominal_phases=PhaseCode.BCN,
+                action=lambda acls: setattr(acls, "wire_info", cable_info) or
+                                    setattr(acls, "base_voltage", base_voltage) or
+                                    setattr(acls, "location", location)
+            )
+            .add_feeder("c0")
+            .build()
+        )
+        network_with_line.add(cable_info)
+        network_with_line.add(base_voltage)
+        network_with_line.add(location)
+        container_requests = []
+        object_requests = []
+
+        def record_container_request(request: GetEquipmentForContainersRequest):
+            container_requests.append(request.includeEnergizedContainers)
+            yield from _create_container_responses(network_with_line)(request)
+
+        def record_object_request(request: GetIdentifiedObjectsRequest):
+            object_requests.extend(request.mrids)
+            yield from _create_object_responses(network_with_line)(request)
+
+        async def client_test():
+            await self.client.create_synthetic_feeder("fdr1", [line_weakener(30, hv_only=True)], minimal_fetch=minimal_fetch)
+
+        await self.mock_server.validate(
+            client_test,
+            [
+                UnaryGrpc('getNetworkHierarchy', unary_from_fixed(None, _create_hierarchy_response(network_with_line))),
+                StreamGrpc('getEquipmentForContainers', [record_container_request]),
+                StreamGrpc('getIdentifiedObjects', [record_object_request])
+            ]
+        )
+
+        if minimal_fetch:
+            assert container_requests == [EXCLUDE_ENERGIZED_CONTAINERS]
+            assert "loc1" not in object_requests
+            assert self.service.get("loc1", default=None) is None
+        else:
+            # The whole feeder is fetched unless a minimal fetch is asked for.
+            assert container_requests == [INCLUDE_ENERGIZED_LV_FEEDERS]
+            assert self.service.get("loc1", Location) is not None
+        assert self.service.get("c0", AcLineSegment).wire_info.rated_current < 500
+
+    @pytest.mark.asyncio
+    async def test_minimal_fetches_reuse_the_clients_network_hierarchy(self):
+        network_with_line = await TestNetworkBuilder().from_acls().add_feeder("c0").build()
+        hierarchy_requests = []
+
+        async def client_test():
+            for _ in range(2):
+                await self.client.create_synthetic_feeder("fdr1", [line_weakener(30, hv_only=True)], minimal_fetch=True)
+
+        object_responses = _create_object_responses(network_with_line)
+
+        await self.mock_server.validate(
+            client_test,
+            [
+                UnaryGrpc('getNetworkHierarchy', _record_hierarchy_request(network_with_line, hierarchy_requests)),
+                StreamGrpc('getEquipmentForContainers', [_create_container_responses(network_with_line)]),
+                StreamGrpc('getIdentifiedObjects', [object_responses]),
+                StreamGrpc('getEquipmentForContainers', [_create_container_responses(network_with_line)])
+            ]
+        )
+
+        assert len(hierarchy_requests) == 1
+
     @pytest.mark.asyncio
     async def test_transformer_weakener(self):
         network_with_tx = await (
@@ -211,6 +298,319 @@ class TestNetworkConsumer:
         )
 
 
+    @pytest.mark.asyncio
+    async def test_async_mutators_and_callbacks_are_awaited_in_order(self):
+        network_with_tx = await (
+            TestNetworkBuilder()
+            .from_power_transformer(
+                nominal_phases=[PhaseCode.ABCN, PhaseCode.ABC],
+                end_actions=[
+                    lambda end: setattr(end, "rated_u", 11000) or setattr(end, "rated_s", 300000),
+                    lambda end: setattr(end, "rated_u", 433) or setattr(end, "rated_s", 300000)
+                ]
+            )
+            .add_feeder("tx0")
+            .build()
+        )
+        events = []
+
+        async def store_modified(modified_txs: Set[str]):
+            await asyncio.sleep(0)
+            events.append(("stored", modified_txs))
+
+        async def async_mutator(network: NetworkService):
+            await asyncio.sleep(0)
+            events.append(("mutated", network.get("tx0", PowerTransformer).mrid))
+
+        async def client_test():
+            await self.client.create_synthetic_feeder("fdr1", [transformer_weakener(30, callback=store_modified), async_mutator])
+
+        await self.mock_server.validate(
+            client_test,
+            [
+                UnaryGrpc('getNetworkHierarchy', unary_from_fixed(None, _create_hierarchy_response(network_with_tx))),
+                StreamGrpc('getEquipmentForContainers', [_create_container_responses(network_with_tx)]),
+                StreamGrpc('getIdentifiedObjects', [_create_object_responses(network_with_tx)])
+            ]
+        )
+
+        assert events == [("stored", {"tx0"}), ("mutated", "tx0")]
+
+    @pytest.mark.asyncio
+    async def test_create_synthetic_feeders_uses_isolated_networks(self):
+        network_with_tx = await (
+            TestNetworkBuilder()
+            .from_power_transformer(
+                nominal_phases=[PhaseCode.ABCN, PhaseCode.ABC],
+                end_actions=[
+                    lambda end: setattr(end, "rated_u", 11000) or setattr(end, "rated_s", 300000),
+                    lambda end: setattr(end, "rated_u", 433) or setattr(end, "rated_s", 300000)
+                ]
+            )
+            .add_feeder("tx0")
+            .build()
+        )
+        modified = []
+        results = []
+
+        async def client_test():
+            results.extend(await self.client.create_synthetic_feeders(
+                ["fdr1", "fdr1"],
+                [transformer_weakener(30, callback=modified.append)],
+                max_concurrency=1
+            ))
+
+        object_responses = _create_object_responses(network_with_tx)
+        hierarchy_requests = []
+        container_responses = _create_container_responses(network_with_tx)
+
+        # The hierarchy is only requested for the first feeder of the batch.
+        await self.mock_server.validate(
+            client_test,
+            [
+                UnaryGrpc('getNetworkHierarchy', _record_hierarchy_request(network_with_tx, hierarchy_requests)),
+                StreamGrpc('getEquipmentForContainers', [container_responses]),
+                StreamGrpc('getIdentifiedObjects', [object_responses]),
+                StreamGrpc('getEquipmentForContainers', [container_responses]),
+                StreamGrpc('getIdentifiedObjects', [object_responses])
+            ]
+        )
+
+        assert len(hierarchy_requests) == 1
+        assert all(r.network.get("fdr1", Feeder) is not None for r in results)
+        assert [r.feeder_mrid for r in results] == ["fdr1", "fdr1"]
+        assert all(r.was_successful for r in results)
+        assert results[0].network is not results[1].network
+        assert modified == [{"tx0"}, {"tx0"}]
+        for result in results:
+            assert all(end.rated_s == 200000 for end in result.network.get("tx0", PowerTransformer).ends)
+        assert self.service.get("tx0", PowerTransformer, default=None) is None
+
+
+    @pytest.mark.asyncio
+    async def test_fetch_attempts_are_recorded_with_a_policy(self):
+        network_with_tx = await TestNetworkBuilder().from_power_transformer().add_feeder("tx0").build()
+        results = []
+
+        async def client_test():
+            results.extend(await self.client.create_synthetic_feeders(["fdr1"], policy=FetchPolicy(deadline=10, max_attempts=3)))
+
+        await self.mock_server.validate(
+            client_test,
+            [
+                UnaryGrpc('getNetworkHierarchy', unary_from_fixed(None, _create_hierarchy_response(network_with_tx))),
+                StreamGrpc('getEquipmentForContainers', [_create_container_responses(network_with_tx)]),
+                StreamGrpc('getIdentifiedObjects', [_create_object_responses(network_with_tx)])
+            ]
+        )
+
+        [result] = results
+        assert result.was_successful
+        assert result.network.get("tx0", PowerTransformer) is not None
+        assert [(a.number, a.hedged, a.was_successful) for a in result.attempts] == [(1, False, True)]
+
+    @pytest.mark.asyncio
+    async def test_feeders_can_be_iterated_one_at_a_time(self):
+        network_with_tx = await TestNetworkBuilder().from_power_transformer().add_feeder("tx0").build()
+        networks = []
+
+        async def client_test():
+            async for result in self.client.iterate_synthetic_feeders(["fdr1", "fdr1"], prefetch=0):
+                assert result.was_successful
+                networks.append(result.network)
+
+        hierarchy_requests = []
+        container_responses = _create_container_responses(network_with_tx)
+        object_responses = _create_object_responses(network_with_tx)
+
+        await self.mock_server.validate(
+            client_test,
+            [
+                UnaryGrpc('getNetworkHierarchy', _record_hierarchy_request(network_with_tx, hierarchy_requests)),
+                StreamGrpc('getEquipmentForContainers', [container_responses]),
+                StreamGrpc('getIdentifiedObjects', [object_responses]),
+                StreamGrpc('getEquipmentForContainers', [container_responses]),
+                StreamGrpc('getIdentifiedObjects', [object_responses])
+            ]
+        )
+
+        assert len(hierarchy_requests) == 1
+        assert len(networks) == 2 and networks[0] is not networks[1]
+        assert all(network.get("tx0", PowerTransformer) is not None for network in networks)
+
+    @pytest.mark.asyncio
+    async def test_cached_feeders_are_not_fetched_again(self, tmp_path, monkeypatch):
+        network_with_tx = await (
+            TestNetworkBuilder()
+            .from_power_transformer(
+                nominal_phases=[PhaseCode.ABCN, PhaseCode.ABC],
+                end_actions=[
+                    lambda end: setattr(end, "rated_u", 11000) or setattr(end, "rated_s", 300000),
+                    lambda end: setattr(end, "rated_u", 433) or setattr(end, "rated_s", 300000)
+                ]
+            )
+            .add_feeder("tx0")
+            .build()
+        )
+        cache = FeederDiskCache(tmp_path, "v1")
+        serialised = []
+
+        def record_serialisation(network: NetworkService) -> bytes:
+            serialised.append(network)
+            return network_to_bytes(network)
+
+        monkeypatch.setattr(edith, "network_to_bytes", record_serialisation)
+        monkeypatch.setattr(feeder_cache, "network_to_bytes", record_serialisation)
+
+        async def client_test():
+            await self.client.create_synthetic_feeder("fdr1", [transformer_weakener(30)], cache=cache)
+
+        object_responses = _create_object_responses(network_with_tx)
+
+        await self.mock_server.validate(
+            client_test,
+            [
+                UnaryGrpc('getNetworkHierarchy', unary_from_fixed(None, _create_hierarchy_response(network_with_tx))),
+                StreamGrpc('getEquipmentForContainers', [_create_container_responses(network_with_tx)]),
+                StreamGrpc('getIdentifiedObjects', [object_responses])
+            ]
+        )
+
+        # The fetched network is serialised once, for both the cache and the client's network.
+        assert len(serialised) == 1
+
+        client = NetworkConsumerClient(channel=self.channel)
+        await self.mock_server.validate(lambda: client.create_synthetic_feeder("fdr1", cache=cache), [])
+
+        cached_ends = list(client.service.get("tx0", PowerTransformer).ends)
+        assert [end.rated_s for end in cached_ends] == [300000, 300000]
+        assert all(end.rated_s == 200000 for end in self.service.get("tx0", PowerTransformer).ends)
+
+
+    @pytest.mark.asyncio
+    @pytest.mark.parametrize("network_with_nmis", [5], indirect=True)
+    async def test_lv_feeders_can_be_streamed(self, network_with_nmis: NetworkService):
+        container_requests = []
+        named = []
+
+        def record_container_request(request: GetEquipmentForContainersRequest):
+            container_requests.append((list(request.mrids), request.includeEnergizedContainers))
+            yield from _create_container_responses(network_with_nmis)(request)
+
+        async def client_test():
+            await self.client.create_synthetic_feeder(
+                "fdr2",
+                [usage_point_proportional_allocator(60, ["A", "B", "C"], seed=1, callback=named.append)],
+                stream_lv_feeders=True
+            )
+
+        object_responses = _create_object_responses(network_with_nmis)
+
+        await self.mock_server.validate(
+            client_test,
+            [
+                UnaryGrpc('getNetworkHierarchy', unary_from_fixed(None, _create_hierarchy_response(network_with_nmis))),
+                StreamGrpc('getEquipmentForContainers', [record_container_request]),
+                StreamGrpc('getIdentifiedObjects', [object_responses, object_responses]),
+                StreamGrpc('getEquipmentForContainers', [record_container_request])
+            ]
+        )
+
+        assert container_requests == [(["fdr2"], EXCLUDE_ENERGIZED_CONTAINERS), (["lvf3"], EXCLUDE_ENERGIZED_CONTAINERS)]
+
+        expected = []
+        usage_point_proportional_allocator(60, ["A", "B", "C"], seed=1, callback=expected.append)(network_with_nmis)
+        assert named == expected
+        assert len(named[0]) == 3
+
+
+    @pytest.mark.asyncio
+    @pytest.mark.parametrize("network_with_nmis", [5], indirect=True)
+    async def test_lv_feeders_are_not_streamed_when_no_mutator_needs_them(self, network_with_nmis: NetworkService):
+        container_requests = []
+
+        def record_container_request(request: GetEquipmentForContainersRequest):
+            container_requests.append((list(request.mrids), request.includeEnergizedContainers))
+            yield from _create_container_responses(network_with_nmis)(request)
+
+        async def client_test():
+            await self.client.create_synthetic_feeder("fdr2", [transformer_weakener(30)], stream_lv_feeders=True, minimal_fetch=True)
+
+        object_responses = _create_object_responses(network_with_nmis)
+
+        await self.mock_server.validate(
+            client_test,
+            [
+                UnaryGrpc('getNetworkHierarchy', unary_from_fixed(None, _create_hierarchy_response(network_with_nmis))),
+                StreamGrpc('getEquipmentForContainers', [record_container_request]),
+                StreamGrpc('getIdentifiedObjects', [object_responses, object_responses])
+            ]
+        )
+
+        assert container_requests == [(["fdr2"], EXCLUDE_ENERGIZED_CONTAINERS)]
+        assert self.service.get("lvf3", LvFeeder) is not None
+
+    @pytest.mark.parametrize("feeder_network", [5], indirect=True)
+    def test_sync_client_can_run_on_a_background_loop(self, feeder_network: NetworkService):
+        background_loop = BackgroundEventLoop()
+        client = BackgroundSyncNetworkConsumerClient(lambda: self.channel, background_loop=background_loop)
+        object_responses = _create_object_responses(feeder_network)
+
+        server = CatchingThread(target=self.mock_server._run_server_logic, args=[[
+            UnaryGrpc('getNetworkHierarchy', unary_from_fixed(None, _create_hierarchy_response(feeder_network))),
+            StreamGrpc('getEquipmentForContainers', [_create_container_responses(feeder_network)]),
+            StreamGrpc('getIdentifiedObjects', [object_responses, object_responses])
+        ]])
+        server.start()
+        try:
+            result = client.submit_synthetic_feeder("f001", [usage_point_proportional_allocator(80, ["A", "B", "C"])]).result(timeout=10)
+        finally:
+            server.join()
+            background_loop.close()
+        if server.exception:
+            raise server.exception
+
+        assert result.was_successful
+        assert len(list(result.network.get_name_type("NMI").names)) == 3
+        assert client.background_loop is background_loop
+
+
+    @pytest.mark.asyncio
+    @pytest.mark.parametrize("feeder_network", [5], indirect=True)
+    async def test_client_pool_spreads_feeders_across_channels(self, feeder_network: NetworkService):
+        second_channel = async_testing_channel(nc_pb2.DESCRIPTOR.services_by_name.values(), grpc_testing.strict_real_time())
+        second_server = MockServer(second_channel, nc_pb2.DESCRIPTOR.services_by_name['NetworkConsumer'])
+        pool = NetworkConsumerClientPool([self.channel, second_channel])
+        object_responses = _create_object_responses(feeder_network)
+        interactions = [
+            UnaryGrpc('getNetworkHierarchy', unary_from_fixed(None, _create_hierarchy_response(feeder_network))),
+            StreamGrpc('getEquipmentForContainers', [_create_container_responses(feeder_network)]),
+            StreamGrpc('getIdentifiedObjects', [object_responses, object_responses])
+        ]
+        in_flight = []
+        results = []
+
+        async def client_test():
+            results.extend(await pool.create_synthetic_feeders(
+                ["f001", "f001"],
+                [lambda network: in_flight.append(pool.in_flight)],
+                max_concurrency=1
+            ))
+
+        second = CatchingThread(target=second_server._run_server_logic, args=[interactions])
+        second.start()
+        await self.mock_server.validate(client_test, interactions)
+        second.join()
+        if second.exception:
+            raise second.exception
+
+        assert all(r.was_successful for r in results)
+        assert results[0].network is not results[1].network
+        assert in_flight == [[1, 0], [0, 1]]
+        assert pool.in_flight == [0, 0]
+        assert pool.dispatched == [1, 1]
+
+
 # noinspection PyUnresolvedReferences
 def _to_network_identified_object(obj) -> NetworkIdentifiedObject:
     if isinstance(obj, AcLineSegment):
@@ -293,6 +693,14 @@ def _create_hierarchy_response(service: NetworkService) -> GetNetworkHierarchyRe
     )
 
 
+def _record_hierarchy_request(service: NetworkService, requests: list) -> Callable:
+    def process(request):
+        requests.append(request)
+        yield _create_hierarchy_response(service)
+
+    return process
+
+
 def _create_container_responses(ns: NetworkService, mrids: Optional[Iterable[str]] = None) \
         -> Callable[[GetEquipmentForContainersRequest], Generator[GetEquipmentForContainersResponse, None, None]]:
     valid: Dict[str, EquipmentContainer] = {mrid: ns[mrid] for mrid in mrids} if mrids else ns
@@ -0,0 +1,86 @@
+#  Copyright 2024 Zeppelin Bend Pty Ltd
+#
+#  This Source Code Form is subject to the terms of the Mozilla Public
+#  License, v. 2.0. If a copy of the MPL was not distributed with this
+#  file, You can obtain one at https://mozilla.org/MPL/2.0/.
+from concurrent.futures import ThreadPoolExecutor
+
+import numpy as np
+import pytest
+from zepben.evolve import NetworkService, UsagePoint
+
+from zepben.edith import usage_point_proportional_allocator
+from zepben.edith.allocation import allocate_customers
+from zepben.edith.network_snapshot import clone_network
+
+
+def _lv_feeders(*sizes: int):
+    return [(f"lvf{i}", [UsagePoint(mrid=f"lvf{i}-up{j}") for j in range(size)]) for i, size in enumerate(sizes)]
+
+
+def _allocate(lv_feeders, proportion=50, customers=tuple("ABCDEFGHIJ"), allow_duplicate_customers=False, seed=1, first_customer=0):
+    allocations = allocate_customers(lv_feeders, proportion, customers, allow_duplicate_customers, np.random.default_rng(seed), first_customer)
+    return [(usage_point.mrid, customer) for usage_point, customer in allocations]
+
+
+def test_a_proportion_of_each_lv_feeder_is_allocated():
+    allocations = _allocate(_lv_feeders(4, 7, 1))
+
+    assert [customer for _, customer in allocations] == list("ABCDE")
+    assert [mrid.split("-")[0] for mrid, _ in allocations] == ["lvf0"] * 2 + ["lvf1"] * 3
+    assert len(set(mrid for mrid, _ in allocations)) == 5
+
+
+def test_allocations_do_not_depend_on_the_order_of_lv_feeders_or_usage_points():
+    lv_feeders = _lv_feeders(20, 30, 40)
+    shuffled = [(mrid, list(reversed(usage_points))) for mrid, usage_points in reversed(lv_feeders)]
+
+    assert _allocate(lv_feeders, customers=[str(i) for i in range(100)]) == _allocate(shuffled, customers=[str(i) for i in range(100)])
+    assert _allocate(lv_feeders, customers=[str(i) for i in range(100)]) != \
+           _allocate(lv_feeders, customers=[str(i) for i in range(100)], seed=2)
+
+
+def test_customers_are_only_reused_when_allowed():
+    assert len(_allocate(_lv_feeders(10, 10), customers="AB")) == 2
+    assert [customer for _, customer in _allocate(_lv_feeders(10, 10), customers="AB", allow_duplicate_customers=True)] == list("AB") * 5
+    assert _allocate(_lv_feeders(10), customers="") == []
+    assert _allocate([]) == []
+
+
+def test_customers_are_given_out_from_the_first_customer():
+    assert [customer for _, customer in _allocate(_lv_feeders(10), customers="ABCD", first_customer=2)] == list("CD")
+    assert _allocate(_lv_feeders(10), customers="ABCD", first_customer=4) == []
+    assert [customer for _, customer in _allocate(_lv_feeders(10), customers="ABCD", allow_duplicate_customers=True, first_customer=2)] == \
+           list("CDABC")
+
+
+@pytest.mark.parametrize("network_with_nmis", [10], indirect=True)
+async def test_customers_continue_across_feeder_networks_unless_restarted(network_with_nmis: NetworkService):
+    def allocate(mutator, network: NetworkService):
+        mutator(network)
+        return sorted(name.name for name in network.get_name_type("NMI").names if not name.name.startswith("NMI"))
+
+    mutator = usage_point_proportional_allocator(50, list("ABCDEFG"), seed=1)
+    assert [allocate(mutator, clone_network(network_with_nmis)) for _ in range(3)] == [list("ABCDE"), list("FG"), []]
+
+    mutator = usage_point_proportional_allocator(50, list("ABCDEFG"), allow_duplicate_customers=True, seed=1)
+    assert [allocate(mutator, clone_network(network_with_nmis)) for _ in range(2)] == [list("ABCDE"), list("ABCFG")]
+
+    mutator = usage_point_proportional_allocator(50, list("ABCDEFG"), seed=1, restart_customers_per_feeder=True)
+    assert [allocate(mutator, clone_network(network_with_nmis)) for _ in range(2)] == [list("ABCDE")] * 2
+
+
+@pytest.mark.parametrize("network_with_nmis", [50], indirect=True)
+async def test_allocations_are_the_same_when_feeders_are_mutated_concurrently(network_with_nmis: NetworkService):
+    mutator = usage_point_proportional_allocator(30, [str(i) for i in range(100)], seed=7, restart_customers_per_feeder=True)
+    networks = [clone_network(network_with_nmis) for _ in range(4)]
+
+    def allocate(network: NetworkService):
+        mutator(network)
+        return sorted((name.identified_object.mrid, name.name) for name in network.get_name_type("NMI").names)
+
+    with ThreadPoolExecutor(4) as executor:
+        allocations = list(executor.map(allocate, networks))
+
+    assert allocations == [allocate(clone_network(network_with_nmis))] * 4
+    assert sum(name.isdigit() for _, name in allocations[0]) == 15
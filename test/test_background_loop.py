@@ -0,0 +1,56 @@
+#  Copyright 2024 Zeppelin Bend Pty Ltd
+#
+#  This Source Code Form is subject to the terms of the Mozilla Public
+#  License, v. 2.0. If a copy of the MPL was not distributed with this
+#  file, You can obtain one at https://mozilla.org/MPL/2.0/.
+import asyncio
+import threading
+
+import pytest
+
+from zepben.edith.background_loop import BackgroundEventLoop, default_background_loop
+
+
+@pytest.fixture()
+def background_loop():
+    loop = BackgroundEventLoop()
+    yield loop
+    loop.close()
+
+
+def test_coroutines_run_on_the_background_thread(background_loop):
+    async def thread_name():
+        await asyncio.sleep(0)
+        return threading.current_thread().name
+
+    assert background_loop.run(thread_name()) == "edith-event-loop"
+    assert background_loop.call(lambda: asyncio.get_running_loop()) is background_loop.loop
+
+
+def test_submitted_coroutines_overlap(background_loop):
+    started = []
+
+    async def wait(i: int):
+        started.append(i)
+        await asyncio.sleep(0.2)
+        return i
+
+    futures = [background_loop.submit(wait(i)) for i in range(10)]
+
+    assert [f.result(timeout=1) for f in futures] == list(range(10))
+
+
+def test_waiting_from_the_background_thread_is_an_error(background_loop):
+    async def nested():
+        return background_loop.run(asyncio.sleep(0))
+
+    with pytest.raises(RuntimeError):
+        background_loop.run(nested())
+
+
+def test_closed_loops_stop_their_thread():
+    loop = BackgroundEventLoop()
+    loop.close()
+
+    assert not loop.is_running
+    assert default_background_loop() is default_background_loop()
@@ -0,0 +1,223 @@
+#  Copyright 2024 Zeppelin Bend Pty Ltd
+#
+#  This Source Code Form is subject to the terms of the Mozilla Public
+#  License, v. 2.0. If a copy of the MPL was not distributed with this
+#  file, You can obtain one at https://mozilla.org/MPL/2.0/.
+import random
+from concurrent.futures import ThreadPoolExecutor
+
+import numpy as np
+import pytest
+from zepben.evolve import AcLineSegment, CableInfo, OverheadWireInfo, PerLengthSequenceImpedance, PhaseCode, TestNetworkBuilder
+
+from zepben.edith import line_weakener, transformer_weakener, VoltageMatchCounts
+from zepben.edith.catalogue_columns import LINECODE_COLUMNS, TRANSFORMER_COLUMNS, LinecodeColumns, TransformerColumns
+from zepben.edith.linecode_catalogue import LINECODE_CATALOGUE, LC
+from zepben.edith.transformer_catalogue import TRANSFORMER_CATALOGUE
+
+
+def _linear_linecode_select(hv, phases, max_amps, use_weakest_when_necessary):
+    candidates = [lc for lc in LINECODE_CATALOGUE if lc.hv == hv and lc.phases == phases]
+    fallback = min(candidates, key=lambda lc: lc.norm_amps, default=None) if use_weakest_when_necessary else None
+    return max((lc for lc in candidates if lc.norm_amps <= max_amps), key=lambda lc: lc.norm_amps, default=fallback)
+
+
+def _linear_transformer_select(windings, phases, max_va, kvs, use_weakest_when_necessary=True):
+    candidates = [
+        xfmr for xfmr in TRANSFORMER_CATALOGUE
+        if xfmr.windings == windings and xfmr.phases == phases and (kvs is None or xfmr.kvs == tuple(kvs))
+    ]
+    fallback = min(candidates, key=lambda x: max(x.kvas), default=None) if use_weakest_when_necessary else None
+    return max((x for x in candidates if max(x.kvas) * 1000 <= max_va), key=lambda x: max(x.kvas), default=fallback)
+
+
+def test_columns_mirror_catalogues():
+    assert len(LINECODE_COLUMNS) == len(LINECODE_CATALOGUE)
+    assert list(LINECODE_COLUMNS.names) == [lc.name for lc in LINECODE_CATALOGUE]
+    assert list(LINECODE_COLUMNS.r0) == [lc.r0 for lc in LINECODE_CATALOGUE]
+
+    assert len(TRANSFORMER_COLUMNS) == len(TRANSFORMER_CATALOGUE)
+    assert TRANSFORMER_COLUMNS.kvs.shape == (len(TRANSFORMER_CATALOGUE), 2)
+    assert [list(kvs) for kvs in TRANSFORMER_COLUMNS.kvs] == [list(x.kvs) for x in TRANSFORMER_CATALOGUE]
+
+
+@pytest.mark.parametrize("use_weakest_when_necessary", [True, False])
+def test_batch_linecode_selection_matches_linear_selection(use_weakest_when_necessary):
+    rng = random.Random(0)
+    max_amps = [rng.uniform(0, 800) for _ in range(500)]
+    phases = [rng.choice([1, 2, 3, 4]) for _ in range(500)]
+    hv = [rng.choice([True, False]) for _ in range(500)]
+
+    selected = LINECODE_COLUMNS.select(max_amps, phases, hv, use_weakest_when_necessary)
+
+    for row, args in zip(selected, zip(hv, phases, max_amps)):
+        expected = _linear_linecode_select(*args, use_weakest_when_necessary)
+        assert (LINECODE_CATALOGUE[row] if row >= 0 else None) is expected
+
+
+@pytest.mark.parametrize("match_voltages", [True, False])
+def test_batch_transformer_selection_matches_linear_selection(match_voltages):
+    rng = random.Random(0)
+    voltages = [[11, 0.433], [22, 0.433], [33, 22], [11, 0.5], [6.6, 0.433], [11, 0.415]]
+    max_va = [rng.uniform(0, 2000000) for _ in range(500)]
+    phases = [rng.choice([1, 3]) for _ in range(500)]
+    kvs = [rng.choice(voltages) for _ in range(500)]
+
+    selected = TRANSFORMER_COLUMNS.select(max_va, [2] * 500, phases, kvs if match_voltages else None)
+
+    for row, va, p, end_kvs in zip(selected, max_va, phases, kvs):
+        expected = _linear_transformer_select(2, p, va, end_kvs if match_voltages else None)
+        assert (TRANSFORMER_CATALOGUE[row] if row >= 0 else None) is expected
+
+
+def test_batch_selection_prefers_first_catalogue_entry_on_equal_ratings():
+    first = LC("first", phases=3, norm_amps=100, emerg_amps=150, r0=0, r1=0, x0=0, x1=0)
+    second = LC("second", phases=3, norm_amps=100, emerg_amps=150, r0=0, r1=0, x0=0, x1=0)
+    columns = LinecodeColumns.from_records([first, second])
+
+    assert list(columns.select([150, 50, 150], [3, 3, 3], [False, False, True])) == [0, 0, -1]
+    assert list(columns.select([50], [3], [False], use_weakest_when_necessary=False)) == [-1]
+
+
+def test_batch_selection_handles_empty_batches():
+    assert len(LINECODE_COLUMNS.select([], [], [])) == 0
+    assert len(TRANSFORMER_COLUMNS.select([], [], [], [])) == 0
+
+
+def test_linecode_catalogues_can_be_memory_mapped(tmp_path):
+    path = tmp_path / "linecodes.npy"
+    LINECODE_COLUMNS.save_binary(path)
+    mapped = LinecodeColumns.from_binary(path)
+
+    assert isinstance(mapped.norm_amps, np.memmap)
+    assert list(mapped) == list(LINECODE_CATALOGUE)
+    assert list(mapped.select([200, 50], [3, 1], [True, False])) == list(LINECODE_COLUMNS.select([200, 50], [3, 1], [True, False]))
+
+
+def test_transformer_catalogues_can_be_memory_mapped(tmp_path):
+    path = tmp_path / "transformers.npy"
+    TRANSFORMER_COLUMNS.save_binary(path)
+    mapped = TransformerColumns.from_binary(path)
+
+    assert isinstance(mapped.kvas, np.memmap)
+    assert [x.name for x in mapped] == [x.name for x in TRANSFORMER_CATALOGUE]
+    assert mapped[1].kvs == (11, 0.433)
+    assert mapped[1].conns == ("delta", "wye")
+    assert list(mapped.select([210000], [2], [3], [[11, 0.433]])) == list(TRANSFORMER_COLUMNS.select([210000], [2], [3], [[11, 0.433]]))
+
+
+def test_binary_files_must_hold_a_catalogue(tmp_path):
+    path = tmp_path / "linecodes.npy"
+    TRANSFORMER_COLUMNS.save_binary(path)
+
+    with pytest.raises(ValueError):
+        LinecodeColumns.from_binary(path)
+
+
+def test_catalogues_can_be_read_from_csv(tmp_path):
+    linecodes = tmp_path / "linecodes.csv"
+    linecodes.write_text(
+        "name,phases,norm_amps,emerg_amps,r0,r1,x0,x1,hv\n"
+        "lv-100,3,100,150,0.1,0.2,0.3,0.4,false\n"
+        "hv-200,3,200,300,0.1,0.2,0.3,0.4,true\n"
+    )
+    xfmrs = tmp_path / "transformers.csv"
+    xfmrs.write_text(
+        "name,phases,windings,kvas,kvs,xhl,load_loss,conns,tap\n"
+        "tx-100,3,2,100;100,11;0.433,4,1,delta;wye,1\n"
+    )
+
+    linecode_catalogue = LinecodeColumns.from_csv(linecodes)
+    assert linecode_catalogue[1] == LC("hv-200", phases=3, norm_amps=200, emerg_amps=300, r0=0.1, r1=0.2, x0=0.3, x1=0.4, hv=True)
+    assert list(linecode_catalogue.select([250, 250], [3, 3], [True, False])) == [1, 0]
+
+    transformer_catalogue = TransformerColumns.from_csv(xfmrs)
+    assert transformer_catalogue[0].kvs == (11, 0.433)
+    assert list(transformer_catalogue.select([150000], [2], [3], [[11, 0.433]])) == [0]
+
+
+async def test_line_weakener_uses_given_catalogue():
+    cable_info = CableInfo(mrid="cable-500A", rated_current=500)
+    network = await TestNetworkBuilder().from_acls(action=lambda acls: setattr(acls, "wire_info", cable_info)).build()
+    network.add(cable_info)
+    catalogue = LinecodeColumns.from_records([
+        LC("custom-300", phases=3, norm_amps=300, emerg_amps=450, r0=0.1, r1=0.2, x0=0.3, x1=0.4)
+    ])
+    modified = []
+
+    line_weakener(30, callback=modified.append, catalogue=catalogue)(network)
+
+    assert modified == [{"c0"}]
+    assert network.get("c0", AcLineSegment).wire_info.mrid == "custom-300-ug"
+
+
+async def test_line_weakener_only_adds_selected_linecodes_once():
+    cable_info = CableInfo(mrid="cable-500A", rated_current=500)
+    network = await TestNetworkBuilder() \
+        .from_acls(action=lambda acls: setattr(acls, "wire_info", cable_info)) \
+        .to_acls(action=lambda acls: setattr(acls, "wire_info", cable_info)) \
+        .build()
+    network.add(cable_info)
+    catalogue = LinecodeColumns.from_records([
+        LC("custom-100", phases=3, norm_amps=100, emerg_amps=150, r0=0.1, r1=0.2, x0=0.3, x1=0.4),
+        LC("custom-300", phases=3, norm_amps=300, emerg_amps=450, r0=0.1, r1=0.2, x0=0.3, x1=0.4)
+    ])
+
+    line_weakener(30, catalogue=catalogue)(network)
+    plsi = network.get("custom-300-plsi", PerLengthSequenceImpedance)
+
+    assert [ci.mrid for ci in network.objects(CableInfo)] == ["cable-500A", "custom-300-ug"]
+    assert [p.mrid for p in network.objects(PerLengthSequenceImpedance)] == ["custom-300-plsi"]
+    assert not list(network.objects(OverheadWireInfo))
+
+    for acls in network.objects(AcLineSegment):
+        acls.wire_info = cable_info
+    line_weakener(30, catalogue=catalogue)(network)
+
+    assert [ci.mrid for ci in network.objects(CableInfo)] == ["cable-500A", "custom-300-ug"]
+    assert network.get("c1", AcLineSegment).per_length_sequence_impedance is plsi
+
+
+def test_find_voltages_prefers_exact_then_closest_within_tolerance():
+    assert TRANSFORMER_COLUMNS.find_voltages(2, 3, (11, 0.433)) == ((11, 0.433), True)
+    assert TRANSFORMER_COLUMNS.find_voltages(2, 3, (11, 0.415)) is None
+    assert TRANSFORMER_COLUMNS.find_voltages(2, 3, (11, 0.415), tolerance=0.05) == ((11, 0.433), False)
+    assert TRANSFORMER_COLUMNS.find_voltages(2, 3, (22.0001, 0.433), tolerance=0.001) == ((22, 0.433), False)
+    assert TRANSFORMER_COLUMNS.find_voltages(2, 3, (11, 0.415), tolerance=0.01) is None
+    assert TRANSFORMER_COLUMNS.find_voltages(2, 3, (16, 0.433), tolerance=0.5) == ((11, 0.433), False)
+
+
+def test_find_voltages_is_safe_on_first_use_from_several_threads():
+    for _ in range(20):
+        columns = TransformerColumns.from_records(TRANSFORMER_CATALOGUE)
+        with ThreadPoolExecutor(8) as executor:
+            matches = list(executor.map(lambda _: columns.find_voltages(2, 3, (11, 0.415), tolerance=0.05), range(32)))
+        assert matches == [((11, 0.433), False)] * 32
+
+
+async def test_transformer_weakener_matches_voltages_within_tolerance():
+    network = await (
+        TestNetworkBuilder()
+        .from_power_transformer(
+            nominal_phases=[PhaseCode.ABCN, PhaseCode.ABC],
+            end_actions=[
+                lambda end: setattr(end, "rated_u", 11000) or setattr(end, "rated_s", 300000),
+                lambda end: setattr(end, "rated_u", 415) or setattr(end, "rated_s", 300000)
+            ]
+        )
+        .to_power_transformer(
+            nominal_phases=[PhaseCode.ABC, PhaseCode.ABC],
+            end_actions=[
+                lambda end: setattr(end, "rated_u", 11000) or setattr(end, "rated_s", 300000),
+                lambda end: setattr(end, "rated_u", 433) or setattr(end, "rated_s", 300000)
+            ]
+        )
+        .build()
+    )
+    modified, counts = [], []
+
+    transformer_weakener(30, callback=modified.append)(network)
+    transformer_weakener(30, callback=modified.append, voltage_tolerance=0.05, voltage_match_callback=counts.append)(network)
+
+    assert modified == [{"tx1"}, {"tx0", "tx1"}]
+    assert counts == [VoltageMatchCounts(exact=1, within_tolerance=1, unmatched=0)]
@@ -0,0 +1,59 @@
+#  Copyright 2024 Zeppelin Bend Pty Ltd
+#
+#  This Source Code Form is subject to the terms of the Mozilla Public
+#  License, v. 2.0. If a copy of the MPL was not distributed with this
+#  file, You can obtain one at https://mozilla.org/MPL/2.0/.
+import csv
+
+import pytest
+from network_fixtures import create_weakenable_network
+from zepben.evolve import NetworkService
+
+from zepben.edith import line_weakener, transformer_weakener, usage_point_proportional_allocator
+from zepben.edith.catalogue_columns import LinecodeColumns
+from zepben.edith.change_set import Change, ChangeSetBuffer, ChangeSetFileSink
+from zepben.edith.linecode_catalogue import LC
+from zepben.edith.mutation_journal import MutationJournal, RecorderGroup
+
+
+async def test_weakeners_record_their_changes():
+    network = await create_weakenable_network()
+    catalogue = LinecodeColumns.from_records([
+        LC("custom-300", phases=3, norm_amps=300, emerg_amps=450, r0=0.1, r1=0.2, x0=0.3, x1=0.4)
+    ])
+    changes = ChangeSetBuffer()
+
+    line_weakener(30, catalogue=catalogue, recorder=changes)(network)
+    transformer_weakener(30, recorder=changes)(network)
+
+    assert list(changes)[:4] == [
+        Change("custom-300-plsi", "*", None, "PerLengthSequenceImpedance", "custom-300"),
+        Change("c0", "per_length_sequence_impedance", None, "custom-300-plsi", "custom-300"),
+        Change("custom-300-ug", "*", None, "CableInfo", "custom-300"),
+        Change("c0", "wire_info", "cable-500A", "custom-300-ug", "custom-300"),
+    ]
+    assert changes.mrids[4:] == ["tx1-e1", "tx1-e2"]
+    assert changes.fields[4:] == ["s_ratings"] * 2
+    assert changes.old_values[4:] == ["UNKNOWN_COOLING_TYPE:300000"] * 2
+    assert changes.new_values[4] == "UNKNOWN_COOLING_TYPE:200000"
+    assert changes.entries[4] == changes.entries[5] is not None
+
+    changes.clear()
+    assert len(changes) == 0
+
+
+@pytest.mark.parametrize("network_with_nmis", [5], indirect=True)
+async def test_changes_are_written_to_files_as_they_are_made(network_with_nmis: NetworkService, tmp_path):
+    journal = MutationJournal()
+    path = str(tmp_path / "changes.csv")
+
+    with ChangeSetFileSink(path) as sink:
+        usage_point_proportional_allocator(60, ["A", "B", "C"], seed=1, recorder=RecorderGroup(journal, sink))(network_with_nmis)
+
+    with open(path, newline="") as f:
+        rows = list(csv.reader(f))
+
+    assert rows[0] == ["mrid", "field", "old_value", "new_value", "entry"]
+    assert len(rows) - 1 == len(journal) == 6
+    assert sorted(row[3] for row in rows[1:] if row[3]) == ["A", "B", "C"]
+    assert all(row[1] == "names" and row[4] == "" for row in rows[1:])
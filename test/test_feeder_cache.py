@@ -0,0 +1,106 @@
+#  Copyright 2024 Zeppelin Bend Pty Ltd
+#
+#  This Source Code Form is subject to the terms of the Mozilla Public
+#  License, v. 2.0. If a copy of the MPL was not distributed with this
+#  file, You can obtain one at https://mozilla.org/MPL/2.0/.
+import os
+
+import pytest
+from network_fixtures import create_weakenable_network
+from zepben.evolve import AcLineSegment, Feeder, IdentifiedObject
+
+from zepben.edith.feeder_cache import FeederDiskCache, FeederMemoryCache
+from zepben.edith.network_snapshot import clone_network, network_from_bytes, network_to_bytes
+
+
+async def test_snapshots_round_trip_networks():
+    network = await create_weakenable_network(feeder=True)
+
+    copy = network_from_bytes(network_to_bytes(network))
+
+    assert sorted(io.mrid for io in copy.objects(IdentifiedObject)) == sorted(io.mrid for io in network.objects(IdentifiedObject))
+    assert copy.get("c0", AcLineSegment).get_terminal_by_sn(2).connectivity_node.mrid == "generated_cn_0"
+    assert {ce.mrid for ce in copy.get("fdr", Feeder).equipment} == {ce.mrid for ce in network.get("fdr", Feeder).equipment}
+    assert copy.num_unresolved_references() == 0
+
+
+async def test_cached_feeders_are_only_loaded_for_the_same_version(tmp_path):
+    FeederDiskCache(tmp_path, "v1").store("fdr", await create_weakenable_network(feeder=True))
+
+    assert FeederDiskCache(tmp_path, "v1").load("fdr").get("c0", AcLineSegment)
+    assert FeederDiskCache(tmp_path, "v2").load("fdr") is None
+    assert FeederDiskCache(tmp_path, "v1").load("other") is None
+
+
+async def test_least_recently_used_feeders_are_evicted(tmp_path):
+    network = await create_weakenable_network(feeder=True)
+    size = len(network_to_bytes(network))
+    cache = FeederDiskCache(tmp_path, "v1", max_bytes=2 * size)
+
+    cache.store("a", network)
+    cache.store("b", network)
+    os.utime(cache._path("a"), (0, 0))
+    os.utime(cache._path("b"), (1, 1))
+    assert cache.load("a") is not None
+    cache.store("c", network)
+
+    assert cache.load("a") is not None
+    assert cache.load("b") is None
+    assert cache.load("c") is not None
+
+    cache.clear()
+    assert not list(tmp_path.iterdir())
+
+
+def test_corrupt_entries_are_treated_as_missing(tmp_path):
+    cache = FeederDiskCache(tmp_path, "v1")
+    cache._path("fdr").write_bytes(b"not a network")
+
+    assert cache.load("fdr") is None
+    assert not cache._path("fdr").exists()
+
+
+def test_cache_size_must_be_positive(tmp_path):
+    with pytest.raises(ValueError):
+        FeederDiskCache(tmp_path, "v1", max_bytes=0)
+
+
+async def test_memory_cache_loads_independent_copies():
+    cache = FeederMemoryCache()
+    cache.store("fdr", await create_weakenable_network(feeder=True))
+
+    first = cache.load("fdr")
+    first.get("c0", AcLineSegment).length = 1234.0
+    second = cache.load("fdr")
+
+    assert first is not second
+    assert second.get("c0", AcLineSegment).length != 1234.0
+    assert cache.load("other") is None
+
+
+async def test_memory_cache_evicts_least_recently_used_feeders():
+    network = await create_weakenable_network(feeder=True)
+    num_objects = sum(1 for _ in network.objects(IdentifiedObject))
+    cache = FeederMemoryCache(max_bytes=None, max_objects=2 * num_objects)
+
+    cache.store("a", network)
+    cache.store("b", network)
+    cache.load("a")
+    cache.store("c", network)
+
+    assert "a" in cache and "c" in cache
+    assert "b" not in cache
+
+    cache = FeederMemoryCache(max_bytes=len(network_to_bytes(network)))
+    cache.store("a", network)
+    cache.store("b", network)
+    assert len(cache) == 1 and "b" in cache
+
+
+async def test_clones_are_independent():
+    network = await create_weakenable_network(feeder=True)
+
+    clone = clone_network(network)
+    clone.remove(clone.get("tx1"))
+
+    assert network.get("tx1", default=None) is not None
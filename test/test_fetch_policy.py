@@ -0,0 +1,124 @@
+#  Copyright 2024 Zeppelin Bend Pty Ltd
+#
+#  This Source Code Form is subject to the terms of the Mozilla Public
+#  License, v. 2.0. If a copy of the MPL was not distributed with this
+#  file, You can obtain one at https://mozilla.org/MPL/2.0/.
+import asyncio
+from asyncio import CancelledError
+
+import grpc
+import pytest
+
+from zepben.edith.fetch_policy import FetchPolicy, fetch_with_policy
+
+
+class _RpcError(grpc.RpcError):
+
+    def __init__(self, code: grpc.StatusCode):
+        self._code = code
+
+    def code(self) -> grpc.StatusCode:
+        return self._code
+
+
+async def test_transient_failures_are_retried_into_the_same_client():
+    fetched_into = []
+
+    async def fetch(client):
+        fetched_into.append(client)
+        if len(fetched_into) < 3:
+            raise _RpcError(grpc.StatusCode.UNAVAILABLE)
+
+    attempts = []
+    client = await fetch_with_policy(fetch, "primary", None, FetchPolicy(max_attempts=3, initial_backoff=0), attempts)
+
+    assert client == "primary"
+    assert fetched_into == ["primary"] * 3
+    assert [a.number for a in attempts] == [1, 2, 3]
+    assert [a.was_successful for a in attempts] == [False, False, True]
+    assert all(not a.hedged and a.duration >= 0 for a in attempts)
+
+
+async def test_permanent_failures_and_exhausted_retries_are_raised():
+    async def fetch(client):
+        raise _RpcError(grpc.StatusCode.NOT_FOUND)
+
+    attempts = []
+    with pytest.raises(_RpcError):
+        await fetch_with_policy(fetch, "primary", None, FetchPolicy(max_attempts=3, initial_backoff=0), attempts)
+    assert len(attempts) == 1
+
+    async def unavailable(client):
+        raise _RpcError(grpc.StatusCode.UNAVAILABLE)
+
+    attempts = []
+    with pytest.raises(_RpcError):
+        await fetch_with_policy(unavailable, "primary", None, FetchPolicy(max_attempts=2, initial_backoff=0), attempts)
+    assert len(attempts) == 2
+
+
+async def test_slow_fetches_are_hedged():
+    policy = FetchPolicy(hedge_percentile=90, hedge_min_samples=2)
+    policy.record_latency(0.01)
+    policy.record_latency(0.02)
+
+    async def fetch(client):
+        if client == "primary":
+            await asyncio.sleep(10)
+
+    attempts = []
+    client = await fetch_with_policy(fetch, "primary", lambda: "hedge", policy, attempts)
+
+    assert client == "hedge"
+    assert [(a.number, a.hedged) for a in attempts] == [(2, True), (1, False)]
+    assert attempts[0].started >= 0.02
+    assert isinstance(attempts[1].error, CancelledError)
+
+
+async def test_hedge_clients_are_released_when_their_attempt_ends():
+    policy = FetchPolicy(hedge_percentile=90, hedge_min_samples=2)
+    policy.record_latency(0.01)
+    policy.record_latency(0.02)
+
+    async def fetch(client):
+        if client == "hedge":
+            await asyncio.sleep(10)
+        else:
+            await asyncio.sleep(0.1)
+
+    released = []
+    client = await fetch_with_policy(fetch, "primary", lambda: "hedge", policy, [], released.append)
+
+    assert client == "primary"
+    assert released == ["hedge"]
+
+
+async def test_fetches_that_pass_the_deadline_fail():
+    async def fetch(client):
+        await asyncio.sleep(10)
+
+    attempts = []
+    with pytest.raises(TimeoutError):
+        await fetch_with_policy(fetch, "primary", None, FetchPolicy(deadline=0.01), attempts)
+    assert len(attempts) == 1
+    assert isinstance(attempts[0].error, CancelledError)
+
+
+def test_hedge_delay_is_a_percentile_of_recent_fetches():
+    policy = FetchPolicy(hedge_percentile=50, hedge_min_samples=3, latency_window=4)
+    policy.record_latency(5)
+    policy.record_latency(1)
+    assert policy.hedge_delay() is None
+
+    for latency in [2, 3, 4]:
+        policy.record_latency(latency)
+    assert policy.hedge_delay() == 2
+    assert FetchPolicy().hedge_delay() is None
+
+    assert FetchPolicy(initial_backoff=1, max_backoff=3).backoff(0) == 1
+    assert FetchPolicy(initial_backoff=1, max_backoff=3).backoff(5) == 3
+
+    with pytest.raises(ValueError):
+        FetchPolicy(max_attempts=0)
+    with pytest.raises(ValueError):
+        FetchPolicy(hedge_percentile=0)
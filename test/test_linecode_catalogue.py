@@ -0,0 +1,29 @@
+#  Copyright 2024 Zeppelin Bend Pty Ltd
+#
+#  This Source Code Form is subject to the terms of the Mozilla Public
+#  License, v. 2.0. If a copy of the MPL was not distributed with this
+#  file, You can obtain one at https://mozilla.org/MPL/2.0/.
+import os
+import subprocess
+import sys
+
+import pytest
+
+from zepben.edith.linecode_catalogue import LINECODE_CATALOGUE
+
+
+def test_catalogues_are_loaded_on_first_use():
+    script = (
+        "import sys, zepben.edith\n"
+        "assert 'zepben.edith._linecode_data' not in sys.modules\n"
+        "assert 'zepben.edith._transformer_data' not in sys.modules\n"
+        "assert 'numpy' not in sys.modules\n"
+        "from zepben.edith.linecode_catalogue import LINECODE_CATALOGUE\n"
+        "assert 'zepben.edith._linecode_data' in sys.modules\n"
+    )
+    subprocess.run([sys.executable, "-c", script], check=True, env={**os.environ, "PYTHONPATH": os.pathsep.join(sys.path)})
+
+
+def test_linecodes_are_immutable():
+    with pytest.raises(AttributeError):
+        LINECODE_CATALOGUE[0].norm_amps = 1
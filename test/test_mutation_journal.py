@@ -0,0 +1,73 @@
+#  Copyright 2024 Zeppelin Bend Pty Ltd
+#
+#  This Source Code Form is subject to the terms of the Mozilla Public
+#  License, v. 2.0. If a copy of the MPL was not distributed with this
+#  file, You can obtain one at https://mozilla.org/MPL/2.0/.
+import pytest
+from network_fixtures import create_weakenable_network
+from zepben.evolve import AcLineSegment, IdentifiedObject, NetworkService, PowerTransformerEnd, UsagePoint
+
+from zepben.edith import line_weakener, transformer_weakener, usage_point_proportional_allocator
+from zepben.edith.mutation_journal import MutationJournal
+from zepben.edith.mutator_engine import apply_mutators
+
+
+def _state(network: NetworkService):
+    return (
+        sorted(io.mrid for io in network.objects(IdentifiedObject)),
+        [(acls.wire_info, acls.per_length_sequence_impedance) for acls in network.objects(AcLineSegment)],
+        [list(end.s_ratings) for end in network.objects(PowerTransformerEnd)],
+        sorted((up.mrid, name.type.name, name.name) for up in network.objects(UsagePoint) for name in up.names),
+        sorted(name_type.name for name_type in network.name_types)
+    )
+
+
+async def test_weakening_is_rolled_back():
+    network = await create_weakenable_network()
+    pristine = _state(network)
+    journal = MutationJournal()
+
+    for percentage in [30, 60]:
+        await apply_mutators([
+            line_weakener(percentage, recorder=journal),
+            transformer_weakener(percentage, recorder=journal)
+        ], network)
+        assert _state(network) != pristine
+
+        # A wire info, a plsi, the line's two assignments and the ratings of both transformer ends.
+        assert len(journal) == 6
+        journal.rollback()
+
+        assert _state(network) == pristine
+        assert len(journal) == 0
+
+
+@pytest.mark.parametrize("network_with_nmis", [5], indirect=True)
+async def test_allocation_is_rolled_back(network_with_nmis: NetworkService):
+    pristine = _state(network_with_nmis)
+    journal = MutationJournal()
+
+    usage_point_proportional_allocator(60, ["A", "B", "C"], seed=1, recorder=journal)(network_with_nmis)
+    assert _state(network_with_nmis) != pristine
+
+    journal.rollback()
+    assert _state(network_with_nmis) == pristine
+
+    usage_point_proportional_allocator(60, ["A", "B", "C"], seed=1, recorder=journal)(network_with_nmis)
+    named = _state(network_with_nmis)
+    journal.clear()
+    journal.rollback()
+    assert _state(network_with_nmis) == named
+
+
+def test_added_name_types_are_left_in_place():
+    network = NetworkService()
+    journal = MutationJournal()
+
+    usage_point_proportional_allocator(60, ["A", "B", "C"], recorder=journal)(network)
+    [nmi] = network.name_types
+    assert nmi.name == "NMI"
+
+    journal.rollback()
+    assert list(network.name_types) == [nmi]
+    assert not list(nmi.names)
@@ -0,0 +1,157 @@
+#  Copyright 2024 Zeppelin Bend Pty Ltd
+#
+#  This Source Code Form is subject to the terms of the Mozilla Public
+#  License, v. 2.0. If a copy of the MPL was not distributed with this
+#  file, You can obtain one at https://mozilla.org/MPL/2.0/.
+import threading
+import time
+
+from network_fixtures import create_weakenable_network
+from zepben.evolve import AcLineSegment, Breaker, CableInfo, ConductingEquipment, IdentifiedObject, NetworkService, PowerTransformer, \
+    PowerTransformerEnd, Recloser
+
+from zepben.edith import MutatorPipeline, line_weakener, transformer_weakener
+from zepben.edith.mutator_engine import ALL_FIELDS, MutatorAccess, VisitingMutator, _stages, apply_mutators, mutator_access
+from zepben.edith.network_snapshot import clone_network
+
+
+class _CountingMutator(VisitingMutator):
+
+    def __init__(self, *visited_types):
+        self.visited_types = visited_types
+        self.walks = 0
+        self.visited = []
+
+    def begin(self, feeder_network: NetworkService):
+        self.walks += 1
+
+    def visit(self, state, io):
+        self.visited.append(io.mrid)
+
+
+def _ratings(network: NetworkService):
+    return (
+        {acls.mrid: acls.wire_info.mrid for acls in network.objects(AcLineSegment)},
+        {tx.mrid: [end.rated_s for end in tx.ends] for tx in network.objects(PowerTransformer)}
+    )
+
+
+async def test_fused_mutators_match_applying_them_in_order():
+    fused = await create_weakenable_network(lv_line=True)
+    sequential = clone_network(fused)
+    modified = []
+
+    def mutators():
+        return [
+            line_weakener(30, callback=modified.append),
+            transformer_weakener(30, callback=modified.append),
+            line_weakener(30, callback=modified.append)
+        ]
+
+    await apply_mutators(mutators(), fused)
+    for mutator in mutators():
+        mutator(sequential)
+
+    assert _ratings(fused) == _ratings(sequential)
+    assert modified[:3] == modified[3:] == [{"c0", "c2"}, {"tx1"}, {"c0", "c2"}]
+    # The weakeners add linecodes, but that only stops them being applied on separate threads, not sharing a walk.
+    assert len(_stages([line_weakener(30), transformer_weakener(30)])) == 1
+
+
+async def test_mutators_visiting_different_types_share_a_walk():
+    network = await create_weakenable_network(lv_line=True)
+    lines = _CountingMutator(AcLineSegment)
+    transformers = _CountingMutator(PowerTransformer)
+    equipment = _CountingMutator(ConductingEquipment, AcLineSegment)
+    plain_calls = []
+
+    await apply_mutators([lines, transformers, plain_calls.append, equipment, lines], network)
+
+    assert lines.walks == 2 and transformers.walks == 1 and equipment.walks == 1
+    assert lines.visited == ["c0", "c2", "c0", "c2"]
+    assert transformers.visited == ["tx1"]
+    assert sorted(equipment.visited) == ["c0", "c2", "tx1"]
+    assert plain_calls == [network]
+
+
+async def test_independent_mutators_share_a_stage_and_run_on_threads():
+    network = await create_weakenable_network(lv_line=True)
+    fused = clone_network(network)
+    barrier = threading.Barrier(2, timeout=5)
+    threads = set()
+
+    def blocking_mutator(field: str):
+        def mutate(feeder_network: NetworkService):
+            threads.add(threading.get_ident())
+            barrier.wait()
+
+        mutate.access = MutatorAccess(reads=frozenset({(Breaker, field)}), writes=frozenset({(Breaker, field)}))
+        return mutate
+
+    # Both mutators wait for each other, so this only finishes if they are applied at the same time.
+    await apply_mutators([blocking_mutator("normal_open"), blocking_mutator("open")], network, max_workers=2)
+    assert len(threads) == 2
+
+    await apply_mutators(
+        [MutatorPipeline([line_weakener(30), transformer_weakener(30), line_weakener(30)], max_workers=2)],
+        fused
+    )
+    for mutator in [line_weakener(30), transformer_weakener(30), line_weakener(30)]:
+        mutator(network)
+    assert _ratings(fused) == _ratings(network)
+
+
+async def test_mutators_that_add_objects_are_not_applied_at_the_same_time():
+    running = []
+    overlapped = []
+
+    def adding_mutator(type_: type):
+        def mutate(feeder_network: NetworkService):
+            running.append(type_)
+            # Give a mutator applied on another thread the chance to start.
+            time.sleep(0.05)
+            overlapped.append(len(running) > 1)
+            for i in range(200):
+                feeder_network.add(type_(mrid=f"{type_.__name__}-{i}"))
+                list(feeder_network.objects(IdentifiedObject))
+            running.remove(type_)
+
+        mutate.access = MutatorAccess(writes=frozenset({(type_, ALL_FIELDS)}))
+        return mutate
+
+    network = await create_weakenable_network()
+    await apply_mutators([adding_mutator(CableInfo), adding_mutator(Recloser)], network, max_workers=2)
+
+    assert overlapped == [False, False]
+    assert len(list(network.objects(CableInfo))) == 201
+    assert len(list(network.objects(Recloser))) == 200
+
+
+async def test_visiting_mutators_without_access_are_not_applied_on_threads():
+    network = await create_weakenable_network(lv_line=True)
+    threads = set()
+
+    class ThreadMutator(_CountingMutator):
+
+        def begin(self, feeder_network: NetworkService):
+            threads.add(threading.get_ident())
+
+    def report_breakers(feeder_network: NetworkService):
+        threads.add(threading.get_ident())
+
+    report_breakers.access = MutatorAccess(reads=frozenset({(Breaker, "open")}))
+
+    await apply_mutators([ThreadMutator(AcLineSegment), report_breakers], network, max_workers=2)
+
+    assert threads == {threading.get_ident()}
+    assert mutator_access(ThreadMutator(AcLineSegment)) is None
+
+
+def test_access_conflicts():
+    tx_ends = MutatorAccess(reads=frozenset({(PowerTransformerEnd, "rated_u")}), writes=frozenset({(PowerTransformerEnd, "rated_s")}))
+
+    assert not tx_ends.conflicts_with(MutatorAccess(reads=frozenset({(PowerTransformerEnd, "rated_u")})))
+    assert tx_ends.conflicts_with(MutatorAccess(reads=frozenset({(PowerTransformerEnd, "rated_s")})))
+    assert tx_ends.conflicts_with(MutatorAccess(writes=frozenset({(IdentifiedObject, ALL_FIELDS)})))
+    assert not tx_ends.conflicts_with(MutatorAccess(writes=frozenset({(AcLineSegment, ALL_FIELDS)})))
+    assert MutatorPipeline([line_weakener(30), lambda network: None]).access is None
@@ -0,0 +1,59 @@
+#  Copyright 2024 Zeppelin Bend Pty Ltd
+#
+#  This Source Code Form is subject to the terms of the Mozilla Public
+#  License, v. 2.0. If a copy of the MPL was not distributed with this
+#  file, You can obtain one at https://mozilla.org/MPL/2.0/.
+from network_fixtures import create_weakenable_network
+from zepben.evolve import AcLineSegment, CableInfo, PowerTransformer
+
+from zepben.edith import line_weakener, transformer_weakener
+from zepben.edith.catalogue_columns import LinecodeColumns
+from zepben.edith.linecode_catalogue import LC
+from zepben.edith.original_ratings import OriginalRatings
+
+CATALOGUE = LinecodeColumns.from_records([
+    LC("custom-100", phases=3, norm_amps=100, emerg_amps=150, r0=0.1, r1=0.2, x0=0.3, x1=0.4),
+    LC("custom-300", phases=3, norm_amps=300, emerg_amps=450, r0=0.1, r1=0.2, x0=0.3, x1=0.4)
+])
+
+
+async def test_lines_are_weakened_incrementally_from_their_original_ratings():
+    network = await create_weakenable_network()
+    originals = OriginalRatings()
+    modified = []
+
+    def weaken(percentage, **kwargs):
+        line_weakener(percentage, callback=modified.append, catalogue=CATALOGUE, originals=originals, **kwargs)(network)
+        return network.get("c0", AcLineSegment).wire_info.mrid
+
+    assert weaken(30) == "custom-300-ug"
+    assert weaken(10) == "custom-300-ug"
+    assert weaken(50) == "custom-100-ug"
+    assert weaken(30) == "custom-300-ug"
+    assert modified == [{"c0"}, set(), {"c0"}, {"c0"}]
+    assert originals.line(network, "c0") == (network.get("cable-500A", CableInfo), None)
+
+    # Lines that are no longer weakened are restored.
+    assert weaken(90, use_weakest_when_necessary=False) == "cable-500A"
+    assert network.get("c0", AcLineSegment).per_length_sequence_impedance is None
+    assert modified[-1] == {"c0"}
+
+
+async def test_transformers_are_weakened_incrementally_from_their_original_ratings():
+    network = await create_weakenable_network()
+    originals = OriginalRatings()
+    modified = []
+
+    for percentage in [60, 60, 20, 60]:
+        transformer_weakener(percentage, callback=modified.append, originals=originals)(network)
+
+        fresh = await create_weakenable_network()
+        transformer_weakener(percentage)(fresh)
+        assert [end.rated_s for end in network.get("tx1", PowerTransformer).ends] == \
+               [end.rated_s for end in fresh.get("tx1", PowerTransformer).ends]
+
+    assert modified == [{"tx1"}, set(), {"tx1"}, {"tx1"}]
+    assert [[r.rated_s for r in ratings] for ratings in originals.transformer(network, "tx1")] == [[300000], [300000]]
+
+    originals.forget(network)
+    assert originals.transformer(network, "tx1") is None
@@ -0,0 +1,48 @@
+#  Copyright 2024 Zeppelin Bend Pty Ltd
+#
+#  This Source Code Form is subject to the terms of the Mozilla Public
+#  License, v. 2.0. If a copy of the MPL was not distributed with this
+#  file, You can obtain one at https://mozilla.org/MPL/2.0/.
+import asyncio
+
+from zepben.edith import _prefetch
+
+
+async def test_prefetch_bounds_the_items_ahead_of_the_current_one():
+    started = []
+    finished = []
+
+    async def create(item: str) -> str:
+        started.append(item)
+        await asyncio.sleep(0)
+        finished.append(item)
+        return item
+
+    seen = []
+    async for item in _prefetch(["a", "b", "c", "d", "e"], create, 2):
+        # Let the prefetched items run, as the caller would while working on the current one.
+        await asyncio.sleep(0.01)
+        assert len(started) - len(seen) <= 3
+        seen.append(item)
+
+    assert seen == ["a", "b", "c", "d", "e"]
+    assert finished == seen
+
+
+async def test_prefetched_items_are_cancelled_when_iteration_stops():
+    cancelled = []
+
+    async def create(item: str) -> str:
+        try:
+            if item != "a":
+                await asyncio.sleep(10)
+            return item
+        except asyncio.CancelledError:
+            cancelled.append(item)
+            raise
+
+    results = _prefetch(["a", "b", "c", "d"], create, 2)
+    assert await results.__anext__() == "a"
+    await results.aclose()
+
+    assert cancelled == ["b", "c"]
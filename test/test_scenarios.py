@@ -0,0 +1,68 @@
+#  Copyright 2024 Zeppelin Bend Pty Ltd
+#
+#  This Source Code Form is subject to the terms of the Mozilla Public
+#  License, v. 2.0. If a copy of the MPL was not distributed with this
+#  file, You can obtain one at https://mozilla.org/MPL/2.0/.
+import os
+import subprocess
+import sys
+from functools import partial
+
+from zepben.evolve import AcLineSegment, CableInfo, NetworkService, TestNetworkBuilder
+
+from zepben.edith import line_weakener
+from zepben.edith.scenarios import run_scenarios
+
+
+def _failing_mutator(callback):
+    def mutate(network: NetworkService):
+        raise ValueError("bad scenario")
+
+    return mutate
+
+
+async def test_scenarios_are_applied_to_independent_copies():
+    cable_info = CableInfo(mrid="cable-500A", rated_current=500)
+    network = await TestNetworkBuilder() \
+        .from_acls(action=lambda acls: setattr(acls, "wire_info", cable_info)) \
+        .to_acls(action=lambda acls: setattr(acls, "wire_info", cable_info)) \
+        .build()
+    network.add(cable_info)
+
+    results = run_scenarios(
+        network,
+        [
+            [partial(line_weakener, 10)],
+            [partial(line_weakener, 50), partial(line_weakener, 50)],
+            [_failing_mutator]
+        ],
+        max_workers=2
+    )
+
+    assert [r.scenario for r in results] == [0, 1, 2]
+    assert results[0].callback_payloads == [[{"c0", "c1"}]]
+    assert results[1].callback_payloads == [[{"c0", "c1"}], [{"c0", "c1"}]]
+    assert results[0].network.get("c0", AcLineSegment).wire_info.rated_current > \
+           results[1].network.get("c0", AcLineSegment).wire_info.rated_current
+    assert isinstance(results[2].error, ValueError) and results[2].network is None
+    assert network.get("c0", AcLineSegment).wire_info is cable_info
+
+
+async def test_networks_are_only_returned_when_requested():
+    network = await TestNetworkBuilder().from_acls().build()
+
+    [result] = run_scenarios(network, [[partial(line_weakener, 10)]], max_workers=1, return_networks=False)
+
+    assert result.was_successful
+    assert result.network is None
+    assert result.callback_payloads == [[set()]]
+    assert run_scenarios(network, []) == []
+
+
+def test_process_pools_are_imported_when_scenarios_are_run():
+    script = (
+        "import sys, zepben.edith\n"
+        "assert 'multiprocessing' not in sys.modules\n"
+        "assert 'concurrent.futures.process' not in sys.modules\n"
+    )
+    subprocess.run([sys.executable, "-c", script], check=True, env={**os.environ, "PYTHONPATH": os.pathsep.join(sys.path)})
@@ -0,0 +1,81 @@
+#  Copyright 2024 Zeppelin Bend Pty Ltd
+#
+#  This Source Code Form is subject to the terms of the Mozilla Public
+#  License, v. 2.0. If a copy of the MPL was not distributed with this
+#  file, You can obtain one at https://mozilla.org/MPL/2.0/.
+import gc
+import weakref
+
+import pytest
+
+from zepben.edith.selection_cache import SelectionCache, CacheInfo
+
+
+class _Catalogue(object):
+    pass
+
+
+CATALOGUE = _Catalogue()
+
+
+def test_only_distinct_uncached_keys_are_selected():
+    cache = SelectionCache()
+    calls = []
+
+    def select(keys):
+        calls.append(keys)
+        return [len(k) for k in keys]
+
+    assert cache.get_many(CATALOGUE, ["a", "bb", "a", "ccc"], select) == [1, 2, 1, 3]
+    assert cache.get_many(CATALOGUE, ["bb", "dddd", "a"], select) == [2, 4, 1]
+    assert cache.get_many(CATALOGUE, ["a", "bb"], select) == [1, 2]
+
+    assert calls == [["a", "bb", "ccc"], ["dddd"]]
+    assert cache.info() == CacheInfo(hits=5, misses=4, maxsize=4096, currsize=4)
+
+
+def test_least_recently_used_selections_are_evicted():
+    cache = SelectionCache(maxsize=2)
+    selected = []
+
+    def select(keys):
+        selected.extend(keys)
+        return [0] * len(keys)
+
+    cache.get_many(CATALOGUE, ["a", "b"], select)
+    cache.get_many(CATALOGUE, ["a"], select)
+    cache.get_many(CATALOGUE, ["c"], select)
+    cache.get_many(CATALOGUE, ["a", "b"], select)
+
+    assert selected == ["a", "b", "c", "b"]
+    assert cache.info().currsize == 2
+
+
+def test_clear_resets_counters():
+    cache = SelectionCache()
+    cache.get_many(CATALOGUE, ["a", "a"], lambda keys: [0] * len(keys))
+    cache.clear()
+
+    assert cache.info() == CacheInfo(hits=0, misses=0, maxsize=4096, currsize=0)
+
+
+def test_selections_are_per_catalogue_and_freed_with_it():
+    cache = SelectionCache()
+    catalogue = _Catalogue()
+    catalogue_ref = weakref.ref(catalogue)
+
+    assert cache.get_many(CATALOGUE, ["a"], lambda keys: [1] * len(keys)) == [1]
+    assert cache.get_many(catalogue, ["a"], lambda keys: [2] * len(keys)) == [2]
+    assert cache.info().currsize == 2
+
+    del catalogue
+    gc.collect()
+
+    assert catalogue_ref() is None
+    assert cache.info().currsize == 1
+    assert cache.get_many(CATALOGUE, ["a"], lambda keys: [3] * len(keys)) == [1]
+
+
+def test_cache_size_must_be_positive():
+    with pytest.raises(ValueError):
+        SelectionCache(maxsize=0)